@@ -10,25 +10,52 @@ api.interceptors.request.use(cfg => {
   return cfg
 })
 
+// List endpoints return { items, next_cursor } pages: follow the cursor and
+// hand callers the concatenated items as `data`
+const listAll = async (url, params = {}) => {
+  const items = []
+  let cursor = null
+  let r
+  do {
+    r = await api.get(url, { params: { ...params, limit: 1000, ...(cursor ? { cursor } : {}) } })
+    items.push(...r.data.items)
+    cursor = r.data.next_cursor
+  } while (cursor)
+  return { ...r, data: items }
+}
+
 export const register  = (data) => api.post('/api/auth/register', data)
 export const login     = (data) => api.post('/api/auth/login', data)
 export const getMe     = ()     => api.get('/api/auth/me')
 
 export const createCompany  = (data) => api.post('/api/companies', data)
-export const listCompanies  = ()     => api.get('/api/companies')
+export const listCompanies  = ()     => listAll('/api/companies')
 export const getCompany     = (id)   => api.get(`/api/companies/${id}`)
 
 export const submitAssessment = (data) => api.post('/api/assessments', data)
-export const getAssessments   = (cid)  => api.get(`/api/assessments/company/${cid}`)
+export const getAssessments   = (cid)  => listAll(`/api/assessments/company/${cid}`)
 
 export const getScore         = (cid)  => api.get(`/api/scores/${cid}`)
-export const getOpportunities = (cid)  => api.get(`/api/opportunities/${cid}`)
+export const getOpportunities = (cid)  => listAll(`/api/opportunities/${cid}`)
 
-export const listProviders    = ()     => api.get('/api/providers')
+export const listProviders    = ()     => listAll('/api/providers')
 export const createProvider   = (data) => api.post('/api/providers', data)
 export const deleteProvider   = (id)   => api.delete(`/api/providers/${id}`)
 
-export const getMatches       = (cid)  => api.get(`/api/matches/${cid}`)
-export const getDashboard     = (cid)  => api.get(`/api/dashboard/${cid}`)
+export const getMatches       = (cid)  => listAll(`/api/matches/${cid}`)
+
+// Dashboard is served from a versioned snapshot: replay the last ETag and reuse
+// the cached body when the server answers 304 Not Modified.
+const dashboardCache = new Map()
+export const getDashboard = async (cid) => {
+  const cached = dashboardCache.get(cid)
+  const r = await api.get(`/api/dashboard/${cid}`, {
+    headers: cached ? { 'If-None-Match': cached.etag } : {},
+    validateStatus: s => (s >= 200 && s < 300) || s === 304,
+  })
+  if (r.status === 304 && cached) return { ...r, data: cached.data }
+  if (r.headers.etag) dashboardCache.set(cid, { etag: r.headers.etag, data: r.data })
+  return r
+}
 
 export default api
@@ -0,0 +1,148 @@
+"""initial schema
+
+Exactly the tables Base.metadata.create_all produced before migrations were
+introduced (users, companies, assessments, scores, opportunities, providers,
+matches). Databases created that way: `alembic stamp 0001`, then upgrade.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('providers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('provider_type', sa.String(), nullable=True),
+    sa.Column('capability_tags', sa.JSON(), nullable=True),
+    sa.Column('industries_served', sa.JSON(), nullable=True),
+    sa.Column('delivery_model', sa.String(), nullable=True),
+    sa.Column('typical_project_size', sa.String(), nullable=True),
+    sa.Column('capacity', sa.String(), nullable=True),
+    sa.Column('qualification_score', sa.Integer(), nullable=True),
+    sa.Column('website', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_providers_id'), 'providers', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('hashed_password', sa.String(), nullable=False),
+    sa.Column('full_name', sa.String(), nullable=True),
+    sa.Column('is_admin', sa.Boolean(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('companies',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('industry', sa.String(), nullable=True),
+    sa.Column('county', sa.String(), nullable=True),
+    sa.Column('city', sa.String(), nullable=True),
+    sa.Column('website', sa.String(), nullable=True),
+    sa.Column('employee_count', sa.Integer(), nullable=True),
+    sa.Column('revenue_estimate', sa.String(), nullable=True),
+    sa.Column('company_size_segment', sa.String(), nullable=True),
+    sa.Column('primary_function', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_companies_id'), 'companies', ['id'], unique=False)
+    op.create_table('assessments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('data_maturity', sa.Integer(), nullable=True),
+    sa.Column('process_automation', sa.Integer(), nullable=True),
+    sa.Column('leadership_alignment', sa.Integer(), nullable=True),
+    sa.Column('technical_infrastructure', sa.Integer(), nullable=True),
+    sa.Column('primary_pain', sa.Text(), nullable=True),
+    sa.Column('current_tools', sa.Text(), nullable=True),
+    sa.Column('budget_range', sa.String(), nullable=True),
+    sa.Column('timeline', sa.String(), nullable=True),
+    sa.Column('submitted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessments_id'), 'assessments', ['id'], unique=False)
+    op.create_table('opportunities',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('use_case', sa.String(), nullable=True),
+    sa.Column('use_case_tag', sa.String(), nullable=True),
+    sa.Column('impact_estimate', sa.String(), nullable=True),
+    sa.Column('implementation_effort', sa.String(), nullable=True),
+    sa.Column('roi_classification', sa.String(), nullable=True),
+    sa.Column('rank', sa.Integer(), nullable=True),
+    sa.Column('generated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_opportunities_id'), 'opportunities', ['id'], unique=False)
+    op.create_table('matches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('opportunity_id', sa.Integer(), nullable=False),
+    sa.Column('provider_id', sa.Integer(), nullable=False),
+    sa.Column('industry_match', sa.Boolean(), nullable=True),
+    sa.Column('capability_match', sa.Boolean(), nullable=True),
+    sa.Column('weighted_score', sa.Float(), nullable=True),
+    sa.Column('est_pilot_value', sa.Float(), nullable=True),
+    sa.Column('stage', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.ForeignKeyConstraint(['opportunity_id'], ['opportunities.id'], ),
+    sa.ForeignKeyConstraint(['provider_id'], ['providers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_matches_id'), 'matches', ['id'], unique=False)
+    op.create_table('scores',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assessment_id', sa.Integer(), nullable=True),
+    sa.Column('company_id', sa.Integer(), nullable=True),
+    sa.Column('overall_score', sa.Float(), nullable=True),
+    sa.Column('data_maturity_score', sa.Float(), nullable=True),
+    sa.Column('process_automation_score', sa.Float(), nullable=True),
+    sa.Column('leadership_alignment_score', sa.Float(), nullable=True),
+    sa.Column('technical_infrastructure_score', sa.Float(), nullable=True),
+    sa.Column('recommendation_level', sa.String(), nullable=True),
+    sa.Column('calculated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('assessment_id')
+    )
+    op.create_index(op.f('ix_scores_id'), 'scores', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_scores_id'), table_name='scores')
+    op.drop_table('scores')
+    op.drop_index(op.f('ix_matches_id'), table_name='matches')
+    op.drop_table('matches')
+    op.drop_index(op.f('ix_opportunities_id'), table_name='opportunities')
+    op.drop_table('opportunities')
+    op.drop_index(op.f('ix_assessments_id'), table_name='assessments')
+    op.drop_table('assessments')
+    op.drop_index(op.f('ix_companies_id'), table_name='companies')
+    op.drop_table('companies')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_providers_id'), table_name='providers')
+    op.drop_table('providers')
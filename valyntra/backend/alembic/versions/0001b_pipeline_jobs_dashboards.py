@@ -0,0 +1,52 @@
+"""pipeline jobs and dashboard snapshots
+
+Tables added after the baseline: pipeline_jobs (background assessment
+pipeline queue) and company_dashboards (precomputed dashboard payloads).
+
+Revision ID: 0001b
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001b'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('pipeline_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assessment_id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('top_k', sa.Integer(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_pipeline_jobs_id'), 'pipeline_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_pipeline_jobs_status'), 'pipeline_jobs', ['status'], unique=False)
+    op.create_table('company_dashboards',
+    sa.Column('company_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('company_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('company_dashboards')
+    op.drop_index(op.f('ix_pipeline_jobs_status'), table_name='pipeline_jobs')
+    op.drop_index(op.f('ix_pipeline_jobs_id'), table_name='pipeline_jobs')
+    op.drop_table('pipeline_jobs')
@@ -0,0 +1,41 @@
+"""hot path indexes
+
+Composite indexes for the per-company lookups every route makes: ownership
+(companies.owner_id), latest score, opportunities by rank, matches by
+weighted_score, plus the matches foreign keys used when opportunities are
+replaced or providers change. See benchmarks/bench_indexes.py for plans.
+
+On Postgres the indexes are built CONCURRENTLY so large tables stay writable.
+
+Revision ID: 0002
+Revises: 0001b
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = '0002'
+down_revision = '0001b'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_companies_owner_id_id", "companies", ["owner_id", "id"]),
+    ("ix_assessments_company_id_id", "assessments", ["company_id", "id"]),
+    ("ix_scores_company_id_calculated_at", "scores", ["company_id", "calculated_at", "id"]),
+    ("ix_opportunities_company_id_rank", "opportunities", ["company_id", "rank"]),
+    ("ix_matches_company_id_weighted_score", "matches", ["company_id", "weighted_score"]),
+    ("ix_matches_opportunity_id", "matches", ["opportunity_id"]),
+    ("ix_matches_provider_id", "matches", ["provider_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
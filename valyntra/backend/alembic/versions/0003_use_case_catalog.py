@@ -0,0 +1,55 @@
+"""use case catalog
+
+Admin-editable opportunity library: use_cases, use_case_points and the
+single-row use_case_catalog version (seeded here). The tables start empty, which means the
+built-in library in opportunity_engine.py; the first admin edit copies it in.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('use_cases',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('industry', sa.String(), nullable=False),
+    sa.Column('use_case', sa.String(), nullable=False),
+    sa.Column('tag', sa.String(), nullable=False),
+    sa.Column('impact', sa.String(), nullable=False),
+    sa.Column('effort', sa.String(), nullable=False),
+    sa.Column('roi', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_use_cases_id'), 'use_cases', ['id'], unique=False)
+    op.create_table('use_case_points',
+    sa.Column('dimension', sa.String(), nullable=False),
+    sa.Column('level', sa.String(), nullable=False),
+    sa.Column('points', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dimension', 'level')
+    )
+    catalog = op.create_table('use_case_catalog',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # The single version row; edits only UPDATE it (and lock it while they run)
+    op.bulk_insert(catalog, [{'id': 1, 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('use_case_catalog')
+    op.drop_table('use_case_points')
+    op.drop_index(op.f('ix_use_cases_id'), table_name='use_cases')
+    op.drop_table('use_cases')
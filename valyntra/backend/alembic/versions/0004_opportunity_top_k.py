@@ -0,0 +1,27 @@
+"""opportunity top_k
+
+opportunities.top_k: matches per opportunity the company was matched with, so
+incremental re-matching keeps an explicit smaller (or larger) K. Existing rows
+stay NULL and re-matching falls back to its previous estimate for them.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('opportunities', sa.Column('top_k', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('opportunities') as batch_op:
+        batch_op.drop_column('top_k')
@@ -0,0 +1,33 @@
+"""provider catalog version
+
+Single-row provider_catalog version (seeded here), bumped by every provider
+write. Workers compare it with the version their in-memory provider index was
+built from and rebuild when it differs.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    catalog = op.create_table('provider_catalog',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # The single version row; provider writes only UPDATE it
+    op.bulk_insert(catalog, [{'id': 1, 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('provider_catalog')
@@ -0,0 +1,43 @@
+"""rematch jobs
+
+rematch_jobs: provider changes waiting to be applied to existing matches. The
+API records one in the transaction that adds or deactivates a provider; the
+re-match worker (`python -m app.services.rematch --worker`) runs them.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('rematch_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('provider_id', sa.Integer(), nullable=False),
+    sa.Column('change', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=True),
+    sa.Column('changed_companies', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['provider_id'], ['providers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_rematch_jobs_id'), 'rematch_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_rematch_jobs_status'), 'rematch_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_rematch_jobs_status'), table_name='rematch_jobs')
+    op.drop_index(op.f('ix_rematch_jobs_id'), table_name='rematch_jobs')
+    op.drop_table('rematch_jobs')
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from app.core.response_cache import response_cache
+from app.core.security import get_current_admin
+from app.core.timing import reset_timing_stats, timing_stats
+from app.db.session import pool_stats
+from app.services.exports import FORMATS, iter_export, match_export_statement
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.get("/db-pool")
+def db_pool(admin=Depends(get_current_admin)):
+    """Connection pool utilization for the worker serving this request."""
+    return pool_stats()
+
+
+@router.get("/response-cache")
+def response_cache_stats(admin=Depends(get_current_admin)):
+    """Hit/miss counters for the read-endpoint response cache (this worker only)."""
+    return response_cache.stats()
+
+
+@router.get("/timings")
+def timings(reset: bool = Query(False, description="Clear the histograms after reading them"), admin=Depends(get_current_admin)):
+    """Per-route, per-stage latency histograms in milliseconds (this worker only)."""
+    stats = timing_stats()
+    if reset:
+        reset_timing_stats()
+    return stats
+
+
+@router.get("/exports/matches")
+def export_matches(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    gzip: bool = Query(False, description="Gzip the file (.gz download)"),
+    stage: Optional[str] = None,
+    industry: Optional[str] = None,
+    since: Optional[datetime] = Query(None, description="Matches created at or after"),
+    until: Optional[datetime] = Query(None, description="Matches created before"),
+    admin=Depends(get_current_admin),
+):
+    """Every match with company, opportunity, provider, score, pilot value and stage, streamed."""
+    stmt = match_export_statement(stage, industry, since, until)
+    filename = f"matches.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        iter_export(stmt, format, compress=gzip),
+        media_type="application/gzip" if gzip else FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
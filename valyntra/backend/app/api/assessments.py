@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.models.models import Assessment, Company
-from app.schemas.schemas import AssessmentCreate, AssessmentOut
+from app.core.config import settings
+from app.models.models import Assessment, Company, PipelineJob
+from app.schemas.schemas import AssessmentCreate, AssessmentOut, PipelineJobOut, Page
+from app.core.pagination import Keyset, PageParams, PageQuery
 from app.core.security import get_current_user
-from app.services.scoring import calculate_score
-from app.services.opportunity_engine import generate_opportunities
-from app.services.matching import run_matching
+from app.core.serialization import fast_response
+from app.core.timing import span
+from app.services.pipeline import run_pipeline
+from app.services.jobs import create_job, enqueue_job
 
 router = APIRouter(prefix="/api/assessments", tags=["assessments"])
 
@@ -14,14 +19,18 @@ router = APIRouter(prefix="/api/assessments", tags=["assessments"])
 @router.post("", response_model=AssessmentOut)
 def submit_assessment(
     payload: AssessmentCreate,
+    response: Response,
+    matches_per_opportunity: Optional[int] = Query(None, ge=1, le=20),
+    background: Optional[bool] = Query(None, description="Run the pipeline in a background job (default: PIPELINE_BACKGROUND)"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     # Validate company ownership
-    company = db.query(Company).filter(
-        Company.id == payload.company_id,
-        Company.owner_id == current_user.id,
-    ).first()
+    with span("ownership"):
+        company = db.query(Company).filter(
+            Company.id == payload.company_id,
+            Company.owner_id == current_user.id,
+        ).first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
 
@@ -31,23 +40,36 @@ def submit_assessment(
         if not (1 <= val <= 5):
             raise HTTPException(status_code=422, detail=f"{field} must be between 1 and 5")
 
-    # Save assessment
-    assessment = Assessment(**payload.model_dump())
-    db.add(assessment)
-    db.commit()
-    db.refresh(assessment)
+    # Save assessment (INSERT … RETURNING fills id + submitted_at, no refresh)
+    assessment = db.scalar(insert(Assessment).returning(Assessment).values(**payload.model_dump()))
+
+    if settings.PIPELINE_BACKGROUND if background is None else background:
+        # Persist the job with the assessment, then hand it to the worker pool
+        job = create_job(assessment, db, top_k=matches_per_opportunity)
+        result = AssessmentOut.model_validate(assessment)
+        result.job_id = job.id
+        with span("commit"):
+            db.commit()
+        enqueue_job(job.id)
+        response.status_code = 202
+        return fast_response(AssessmentOut, result, status_code=202)
+
+    # Run full pipeline: score → opportunities → matches, committed once
+    run_pipeline(assessment, company, db, top_k=matches_per_opportunity)
+    result = AssessmentOut.model_validate(assessment)
+    with span("commit"):
+        db.commit()
+
+    return fast_response(AssessmentOut, result)
 
-    # Run full pipeline: score → opportunities → matches
-    score = calculate_score(assessment, db)
-    opportunities = generate_opportunities(company, score, db)
-    run_matching(company, opportunities, db)
 
-    return assessment
+ASSESSMENT_KEYSET = Keyset(((Assessment.id, False),))
 
 
-@router.get("/company/{company_id}", response_model=list[AssessmentOut])
+@router.get("/company/{company_id}", response_model=Page[AssessmentOut])
 def get_assessments(
     company_id: int,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -57,4 +79,22 @@ def get_assessments(
     ).first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    return db.query(Assessment).filter(Assessment.company_id == company_id).all()
+    page = PageQuery(Assessment, AssessmentOut, [Assessment.company_id == company_id], ASSESSMENT_KEYSET, page).fetch(db)
+    return fast_response(Page[AssessmentOut], page)
+
+
+@router.get("/jobs/{job_id}", response_model=PipelineJobOut)
+def get_pipeline_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    job = (
+        db.query(PipelineJob)
+        .join(Company, Company.id == PipelineJob.company_id)
+        .filter(PipelineJob.id == job_id, Company.owner_id == current_user.id)
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return fast_response(PipelineJobOut, job)
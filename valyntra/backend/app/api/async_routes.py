@@ -0,0 +1,114 @@
+"""
+Async versions of the read endpoints in routes.py, served from the AsyncEngine
+when DB_ASYNC is enabled. Paths and response shapes are identical.
+"""
+from typing import Union
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_async_db
+from app.models.models import Score, Opportunity, Provider, Match, Company, CompanyDashboard
+from app.schemas.schemas import (
+    ScoreOut, OpportunityOut, ProviderOut, MatchOut, DashboardOut, Page, CompactMatchPage, CompactDashboardOut,
+)
+from app.core.pagination import PageParams, PageQuery
+from app.core.response_cache import PROVIDERS, company_scope, response_cache
+from app.core.security import get_current_user_async
+from app.core.timing import span
+from app.services.dashboard import dashboard_statement, build_dashboard, compact_dashboard
+from app.api.routes import COMPACT, MATCH_KEYSET, MATCH_OPTIONS, OPPORTUNITY_KEYSET, PROVIDER_KEYSET, compact_match_page
+
+# ── Scores ───────────────────────────────────────────────────────────────
+scores_router = APIRouter(prefix="/api/scores", tags=["scores"])
+
+@scores_router.get("/{company_id}", response_model=ScoreOut)
+async def get_score(company_id: int, request: Request, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user_async)):
+    async def build():
+        await _assert_owns(company_id, current_user, db)
+        score = await db.scalar(
+            select(Score)
+            .where(Score.company_id == company_id)
+            .order_by(Score.calculated_at.desc(), Score.id.desc())
+            .limit(1)
+        )
+        if not score:
+            raise HTTPException(status_code=404, detail="No score found. Submit an assessment first.")
+        return ScoreOut.model_validate(score)
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return await response_cache.respond_async(request, key, build)
+
+
+# ── Opportunities ─────────────────────────────────────────────────────────
+opps_router = APIRouter(prefix="/api/opportunities", tags=["opportunities"])
+
+@opps_router.get("/{company_id}", response_model=Page[OpportunityOut])
+async def get_opportunities(company_id: int, request: Request, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user_async)):
+    async def build():
+        await _assert_owns(company_id, current_user, db)
+        query = PageQuery(Opportunity, OpportunityOut, [Opportunity.company_id == company_id], OPPORTUNITY_KEYSET, page)
+        return await query.fetch_async(db)
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return await response_cache.respond_async(request, key, build)
+
+
+# ── Providers ─────────────────────────────────────────────────────────────
+providers_router = APIRouter(prefix="/api/providers", tags=["providers"])
+
+@providers_router.get("", response_model=Page[ProviderOut])
+async def list_providers(request: Request, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user_async)):
+    query = PageQuery(Provider, ProviderOut, [Provider.is_active == True], PROVIDER_KEYSET, page)
+    return await response_cache.respond_async(request, response_cache.key(request, PROVIDERS), lambda: query.fetch_async(db))
+
+
+# ── Matches ───────────────────────────────────────────────────────────────
+matches_router = APIRouter(prefix="/api/matches", tags=["matches"])
+
+@matches_router.get("/{company_id}", response_model=Union[Page[MatchOut], CompactMatchPage])
+async def get_matches(company_id: int, request: Request, page: PageParams = Depends(), compact: bool = COMPACT, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user_async)):
+    async def build():
+        await _assert_owns(company_id, current_user, db)
+        # Async sessions can't lazy-load during serialization: load nested objects up front
+        query = PageQuery(Match, MatchOut, [Match.company_id == company_id], MATCH_KEYSET, page, options=MATCH_OPTIONS)
+        result = await query.fetch_async(db)
+        return compact_match_page(result) if compact else result
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return await response_cache.respond_async(request, key, build)
+
+
+# ── Dashboard ─────────────────────────────────────────────────────────────
+dashboard_router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+@dashboard_router.get("/{company_id}", response_model=Union[DashboardOut, CompactDashboardOut])
+async def get_dashboard(company_id: int, request: Request, compact: bool = COMPACT, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user_async)):
+    async def build():
+        row = (await db.execute(
+            select(Company.id, CompanyDashboard)
+            .outerjoin(CompanyDashboard, CompanyDashboard.company_id == Company.id)
+            .where(Company.id == company_id, Company.owner_id == current_user.id)
+        )).first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Company not found")
+
+        snapshot = row[1]
+        if snapshot is None:
+            # No pipeline run has written a snapshot yet: build it live
+            dashboard = build_dashboard(*(await db.execute(dashboard_statement(company_id))).first())
+            return compact_dashboard(dashboard.model_dump(mode="json")) if compact else dashboard
+        return compact_dashboard(snapshot.payload) if compact else snapshot.payload
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return await response_cache.respond_async(request, key, build)
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────
+async def _assert_owns(company_id: int, current_user, db: AsyncSession):
+    with span("ownership"):
+        company = await db.scalar(
+            select(Company).where(Company.id == company_id, Company.owner_id == current_user.id)
+        )
+    if not company:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return company
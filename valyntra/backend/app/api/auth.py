@@ -1,37 +1,73 @@
+import anyio
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.models import User
 from app.schemas.schemas import UserCreate, UserOut, Token, LoginRequest
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import (
+    hash_password, verify_and_rehash, create_access_token,
+    get_current_user_profile, get_current_admin, user_cache,
+)
+from app.core.hashing import hashing_stats
+from app.core.serialization import fast_response
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 
+# register / login are async so no thread is held while bcrypt runs in the hashing
+# pool; their (sync) database calls go to a worker thread instead.
+def _find_user(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+def _save_user(db: Session, user: User):
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return fast_response(UserOut, user)
+
+
 @router.post("/register", response_model=UserOut)
-def register(payload: UserCreate, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.email == payload.email).first():
+async def register(payload: UserCreate, db: Session = Depends(get_db)):
+    if await anyio.to_thread.run_sync(_find_user, db, payload.email):
         raise HTTPException(status_code=400, detail="Email already registered")
     user = User(
         email=payload.email,
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password(payload.password),
         full_name=payload.full_name,
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+    return await anyio.to_thread.run_sync(_save_user, db, user)
 
 
 @router.post("/login", response_model=Token)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.hashed_password):
+async def login(payload: LoginRequest, db: Session = Depends(get_db)):
+    user = await anyio.to_thread.run_sync(_find_user, db, payload.email)
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    token = create_access_token({"sub": str(user.id)})
+    valid, new_hash = await verify_and_rehash(payload.password, user.hashed_password)
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    # Claims read before any commit expires the instance
+    token = create_access_token({"sub": str(user.id), "adm": bool(user.is_admin), "act": bool(user.is_active)})
+    if new_hash:
+        # BCRYPT_ROUNDS changed since this password was stored
+        user.hashed_password = new_hash
+        await anyio.to_thread.run_sync(db.commit)
     return {"access_token": token}
 
 
 @router.get("/me", response_model=UserOut)
-def me(current_user=Depends(__import__("app.core.security", fromlist=["get_current_user"]).get_current_user)):
-    return current_user
+def me(current_user=Depends(get_current_user_profile)):
+    return fast_response(UserOut, current_user)
+
+
+@router.get("/user-cache")
+def user_cache_stats(admin=Depends(get_current_admin)):
+    """Hit/miss counters for the authenticated-user cache (this worker only)."""
+    return user_cache.stats()
+
+
+@router.get("/hashing")
+def password_hashing_stats(admin=Depends(get_current_admin)):
+    """Password hashing pool latency and queue depth (this worker only)."""
+    return hashing_stats()
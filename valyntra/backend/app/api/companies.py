@@ -2,8 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.models import Company
-from app.schemas.schemas import CompanyCreate, CompanyOut
+from app.schemas.schemas import CompanyCreate, CompanyOut, Page
+from app.core.pagination import Keyset, PageParams, PageQuery
 from app.core.security import get_current_user
+from app.core.serialization import fast_response
 
 router = APIRouter(prefix="/api/companies", tags=["companies"])
 
@@ -30,15 +32,20 @@ def create_company(
     db.add(company)
     db.commit()
     db.refresh(company)
-    return company
+    return fast_response(CompanyOut, company)
 
 
-@router.get("", response_model=list[CompanyOut])
+COMPANY_KEYSET = Keyset(((Company.id, False),))
+
+
+@router.get("", response_model=Page[CompanyOut])
 def list_companies(
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    return db.query(Company).filter(Company.owner_id == current_user.id).all()
+    page = PageQuery(Company, CompanyOut, [Company.owner_id == current_user.id], COMPANY_KEYSET, page).fetch(db)
+    return fast_response(Page[CompanyOut], page)
 
 
 @router.get("/{company_id}", response_model=CompanyOut)
@@ -53,4 +60,4 @@ def get_company(
     ).first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    return company
+    return fast_response(CompanyOut, company)
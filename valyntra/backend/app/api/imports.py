@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+import logging
+import tempfile
+from typing import Optional
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.requests import ClientDisconnect
+from app.db.session import get_db
+from app.core.config import settings
+from app.schemas.schemas import AssessmentCreate, CompanyCreate
+from app.core.security import get_current_user
+from app.api.companies import _size_segment
+from app.services.bulk_import import FORMATS, BodyReader, import_chunk, read_records
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/imports", tags=["imports"])
+
+SCORE_FIELDS = ("data_maturity", "process_automation", "leadership_alignment", "technical_infrastructure")
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/companies")
+async def import_companies(
+    request: Request,
+    format: Optional[str] = Query(None, description="csv or ndjson (default: from Content-Type)"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Bulk-create companies, each with an optional assessment, from a CSV or NDJSON
+    body. Columns / keys are the CompanyCreate fields plus the AssessmentCreate
+    fields (minus company_id); rows without the four 1-5 scores create the company
+    only. Rows are validated and written IMPORT_CHUNK_SIZE at a time, one
+    transaction per chunk, while the upload is still streaming in.
+
+    The response is NDJSON: one result per row ({"row", "status", ...}) in input
+    order, then a {"summary": ...} line.
+    """
+    fmt = format or CONTENT_TYPES.get(request.headers.get("content-type", "").split(";")[0].strip().lower())
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=415, detail="Send text/csv or application/x-ndjson (or pass ?format=)")
+
+    reader = BodyReader()
+    # Results are spooled rather than streamed back live: the response can't start
+    # until the request body has been fully read
+    out = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    owner_id = current_user.id
+
+    # Own limiter: waiting on a full queue must not take a token from the shared
+    # threadpool, which the import threads themselves need to drain it
+    feed_limiter = anyio.CapacityLimiter(1)
+
+    async def hand_over(chunk) -> bool:
+        # Usually there's room; when the import is behind (e.g. committing a chunk),
+        # wait in a thread instead of blocking the event loop
+        if reader.feed_nowait(chunk):
+            return True
+        return await anyio.to_thread.run_sync(reader.feed, chunk, limiter=feed_limiter)
+
+    async def feed():
+        try:
+            async for chunk in request.stream():
+                if chunk and not await hand_over(chunk):
+                    return  # import stopped early (row limit)
+            await hand_over(b"")
+        except ClientDisconnect:
+            reader.abort()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(feed)
+        await anyio.to_thread.run_sync(_run_import, reader, fmt, owner_id, db, out)
+
+    out.seek(0)
+    return StreamingResponse(_drain(out), media_type="application/x-ndjson")
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────
+def _parse_row(record) -> tuple:
+    """Validate one raw record → (company row, assessment row or None)."""
+    if isinstance(record, Exception):
+        raise record
+    # CSV gives "" for empty cells and puts surplus cells under None
+    values = {k: v for k, v in record.items() if k is not None and v not in ("", None)}
+
+    company = CompanyCreate(**{k: values[k] for k in CompanyCreate.model_fields if k in values})
+    company_row = dict(company.model_dump(), company_size_segment=_size_segment(company.employee_count))
+
+    if not any(field in values for field in SCORE_FIELDS):
+        return company_row, None
+    fields = {k: values[k] for k in AssessmentCreate.model_fields if k in values and k != "company_id"}
+    assessment = AssessmentCreate(company_id=0, **fields)
+    for field in SCORE_FIELDS:
+        if not (1 <= getattr(assessment, field) <= 5):
+            raise ValueError(f"{field} must be between 1 and 5")
+    return company_row, assessment.model_dump(exclude={"company_id"})
+
+
+def _errors(exc: Exception) -> list:
+    if isinstance(exc, ValidationError):
+        return [f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in exc.errors()]
+    return [str(exc)]
+
+
+def _write(out, result: dict) -> None:
+    out.write(json.dumps(result).encode() + b"\n")
+
+
+def _flush_chunk(chunk: list, owner_id: int, db: Session, out, totals: dict) -> None:
+    """chunk: [(row number, parsed entry or Exception)] → result lines, in row order."""
+    valid = [(row, entry) for row, entry in chunk if not isinstance(entry, Exception)]
+    created = {}
+    if valid:
+        try:
+            results = import_chunk([entry for _, entry in valid], owner_id, db)
+            db.commit()
+            created = {row: result for (row, _), result in zip(valid, results)}
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Bulk import chunk failed")
+            failure = ValueError(f"chunk not imported: {type(exc).__name__}")
+            created = {row: failure for row, _ in valid}
+
+    for row, entry in chunk:
+        result = created.get(row, entry)
+        if isinstance(result, Exception):
+            totals["failed"] += 1
+            _write(out, {"row": row, "status": "error", "errors": _errors(result)})
+        else:
+            totals["created"] += 1
+            _write(out, {"row": row, **result})
+
+
+def _run_import(reader: BodyReader, fmt: str, owner_id: int, db: Session, out) -> None:
+    """Worker-thread side: parse, validate and import the body chunk by chunk."""
+    totals = {"rows": 0, "created": 0, "failed": 0, "truncated": False}
+    text = io.TextIOWrapper(io.BufferedReader(reader), encoding="utf-8-sig", newline="")
+    chunk = []
+    try:
+        for record in read_records(text, fmt):
+            if totals["rows"] >= settings.IMPORT_MAX_ROWS:
+                totals["truncated"] = True
+                break
+            totals["rows"] += 1
+            try:
+                chunk.append((totals["rows"], _parse_row(record)))
+            except (ValidationError, ValueError) as exc:
+                chunk.append((totals["rows"], exc))
+            if len(chunk) >= settings.IMPORT_CHUNK_SIZE:
+                _flush_chunk(chunk, owner_id, db, out, totals)
+                chunk = []
+        _flush_chunk(chunk, owner_id, db, out, totals)
+    except (OSError, UnicodeDecodeError, csv.Error) as exc:
+        # Rows already committed stay imported; the rest of the upload is dropped
+        totals["error"] = str(exc)
+    finally:
+        text.close()
+    _write(out, {"summary": totals})
+
+
+def _drain(out, block_size: int = 64 * 1024):
+    try:
+        while block := out.read(block_size):
+            yield block
+    finally:
+        out.close()
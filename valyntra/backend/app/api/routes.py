@@ -1,94 +1,163 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session, joinedload
 from app.db.session import get_db
-from app.models.models import Score, Opportunity, Provider, Match, Company
-from app.schemas.schemas import ScoreOut, OpportunityOut, ProviderOut, ProviderCreate, MatchOut, DashboardOut
+from app.models.models import Score, Opportunity, Provider, Match, Company, CompanyDashboard
+from app.schemas.schemas import (
+    ScoreOut, OpportunityOut, ProviderOut, ProviderCreate, MatchOut, DashboardOut, Page,
+    CompactMatchPage, CompactDashboardOut,
+)
+from app.core.pagination import Keyset, PageParams, PageQuery
+from app.core.response_cache import PROVIDERS, company_scope, invalidate_on_commit, response_cache
 from app.core.security import get_current_user, get_current_admin
+from app.core.serialization import fast_response
+from app.core.timing import span
+from app.services.provider_index import bump_provider_catalog_version, invalidate_provider_index
+from app.services.rematch import ADDED, REMOVED, queue_rematch
+from app.services.dashboard import load_dashboard, build_dashboard, compact_dashboard, compact_matches
 
 # ── Scores ───────────────────────────────────────────────────────────────
 scores_router = APIRouter(prefix="/api/scores", tags=["scores"])
 
 @scores_router.get("/{company_id}", response_model=ScoreOut)
-def get_score(company_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    _assert_owns(company_id, current_user, db)
-    score = db.query(Score).filter(Score.company_id == company_id).order_by(Score.calculated_at.desc()).first()
-    if not score:
-        raise HTTPException(status_code=404, detail="No score found. Submit an assessment first.")
-    return score
+def get_score(company_id: int, request: Request, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    def build():
+        _assert_owns(company_id, current_user, db)
+        score = db.query(Score).filter(Score.company_id == company_id).order_by(Score.calculated_at.desc(), Score.id.desc()).first()
+        if not score:
+            raise HTTPException(status_code=404, detail="No score found. Submit an assessment first.")
+        return ScoreOut.model_validate(score)
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return response_cache.respond(request, key, build)
 
 
 # ── Opportunities ─────────────────────────────────────────────────────────
 opps_router = APIRouter(prefix="/api/opportunities", tags=["opportunities"])
 
-@opps_router.get("/{company_id}", response_model=list[OpportunityOut])
-def get_opportunities(company_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    _assert_owns(company_id, current_user, db)
-    return db.query(Opportunity).filter(Opportunity.company_id == company_id).order_by(Opportunity.rank).all()
+OPPORTUNITY_KEYSET = Keyset(((Opportunity.rank, False), (Opportunity.id, False)))
+
+@opps_router.get("/{company_id}", response_model=Page[OpportunityOut])
+def get_opportunities(company_id: int, request: Request, page: PageParams = Depends(), db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    def build():
+        _assert_owns(company_id, current_user, db)
+        return PageQuery(Opportunity, OpportunityOut, [Opportunity.company_id == company_id], OPPORTUNITY_KEYSET, page).fetch(db)
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return response_cache.respond(request, key, build)
 
 
 # ── Providers ─────────────────────────────────────────────────────────────
 providers_router = APIRouter(prefix="/api/providers", tags=["providers"])
 
-@providers_router.get("", response_model=list[ProviderOut])
-def list_providers(db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    return db.query(Provider).filter(Provider.is_active == True).all()
+PROVIDER_KEYSET = Keyset(((Provider.id, False),))
+
+@providers_router.get("", response_model=Page[ProviderOut])
+def list_providers(request: Request, page: PageParams = Depends(), db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    # Same catalog for every user: one shared entry per page
+    key = response_cache.key(request, PROVIDERS)
+    return response_cache.respond(
+        request, key, lambda: PageQuery(Provider, ProviderOut, [Provider.is_active == True], PROVIDER_KEYSET, page).fetch(db)
+    )
+
 
-@providers_router.post("", response_model=ProviderOut)
+# Catalog writes stay sync even when reads are served by the async stack
+provider_admin_router = APIRouter(prefix="/api/providers", tags=["providers"])
+
+@provider_admin_router.post("", response_model=ProviderOut)
 def create_provider(payload: ProviderCreate, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
     provider = Provider(**payload.model_dump())
     db.add(provider)
+    db.flush()
+    bump_provider_catalog_version(db)
+    # Existing matches pick the provider up from the re-match worker, not this process
+    queue_rematch(provider.id, ADDED, db)
+    invalidate_on_commit(db, PROVIDERS)
     db.commit()
     db.refresh(provider)
-    return provider
+    invalidate_provider_index()
+    return fast_response(ProviderOut, provider)
 
-@providers_router.delete("/{provider_id}", status_code=204)
+@provider_admin_router.delete("/{provider_id}", status_code=204)
 def delete_provider(provider_id: int, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
     p = db.query(Provider).filter(Provider.id == provider_id).first()
     if not p:
         raise HTTPException(status_code=404, detail="Provider not found")
     p.is_active = False
+    bump_provider_catalog_version(db)
+    queue_rematch(provider_id, REMOVED, db)
+    invalidate_on_commit(db, PROVIDERS)
     db.commit()
+    invalidate_provider_index()
 
 
 # ── Matches ───────────────────────────────────────────────────────────────
 matches_router = APIRouter(prefix="/api/matches", tags=["matches"])
 
-@matches_router.get("/{company_id}", response_model=list[MatchOut])
-def get_matches(company_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    _assert_owns(company_id, current_user, db)
-    return (
-        db.query(Match)
-        .filter(Match.company_id == company_id)
-        .order_by(Match.weighted_score.desc())
-        .all()
-    )
+MATCH_KEYSET = Keyset(((Match.weighted_score, True), (Match.id, False)))
+# MatchOut nests provider and opportunity: load them with the page (many-to-one joins
+# add no rows) instead of two lazy SELECTs per match during serialization
+MATCH_OPTIONS = (joinedload(Match.provider), joinedload(Match.opportunity))
+
+COMPACT = Query(False, description="Send each provider / opportunity once; matches reference them by id")
+
+
+def compact_match_page(page):
+    """CompactMatchPage from a Page[MatchOut]; `fields=` projections are returned as they are."""
+    if not isinstance(page, Page):
+        return page
+    items, providers, opportunities = compact_matches(page.model_dump(mode="json")["items"])
+    return {"items": items, "providers": providers, "opportunities": opportunities, "next_cursor": page.next_cursor}
+
+
+@matches_router.get("/{company_id}", response_model=Union[Page[MatchOut], CompactMatchPage])
+def get_matches(company_id: int, request: Request, page: PageParams = Depends(), compact: bool = COMPACT, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    def build():
+        _assert_owns(company_id, current_user, db)
+        result = PageQuery(
+            Match, MatchOut, [Match.company_id == company_id], MATCH_KEYSET, page, options=MATCH_OPTIONS,
+        ).fetch(db)
+        return compact_match_page(result) if compact else result
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return response_cache.respond(request, key, build)
 
 
 # ── Dashboard ─────────────────────────────────────────────────────────────
 dashboard_router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
-@dashboard_router.get("/{company_id}", response_model=DashboardOut)
-def get_dashboard(company_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
-    company = _assert_owns(company_id, current_user, db)
-    score = db.query(Score).filter(Score.company_id == company_id).order_by(Score.calculated_at.desc()).first()
-    opportunities = db.query(Opportunity).filter(Opportunity.company_id == company_id).order_by(Opportunity.rank).all()
-    matches = db.query(Match).filter(Match.company_id == company_id).order_by(Match.weighted_score.desc()).all()
-    total_value = sum(m.est_pilot_value or 0 for m in matches)
-    return DashboardOut(
-        company=company,
-        score=score,
-        opportunities=opportunities,
-        matches=matches,
-        total_pipeline_value=total_value,
-    )
+@dashboard_router.get("/{company_id}", response_model=Union[DashboardOut, CompactDashboardOut])
+def get_dashboard(company_id: int, request: Request, compact: bool = COMPACT, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+    def build():
+        row = (
+            db.query(Company.id, CompanyDashboard)
+            .outerjoin(CompanyDashboard, CompanyDashboard.company_id == Company.id)
+            .filter(Company.id == company_id, Company.owner_id == current_user.id)
+            .first()
+        )
+        if not row:
+            raise HTTPException(status_code=404, detail="Company not found")
+
+        snapshot = row[1]
+        if snapshot is None:
+            # No pipeline run has written a snapshot yet: build it live
+            dashboard = build_dashboard(*load_dashboard(company_id, db))
+            return compact_dashboard(dashboard.model_dump(mode="json")) if compact else dashboard
+        # Snapshot was validated against DashboardOut when written; serve it as-is
+        return compact_dashboard(snapshot.payload) if compact else snapshot.payload
+
+    key = response_cache.key(request, company_scope(company_id), current_user.id)
+    return response_cache.respond(request, key, build)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────
 def _assert_owns(company_id: int, current_user, db: Session):
-    company = db.query(Company).filter(
-        Company.id == company_id,
-        Company.owner_id == current_user.id,
-    ).first()
+    with span("ownership"):
+        company = db.query(Company).filter(
+            Company.id == company_id,
+            Company.owner_id == current_user.id,
+        ).first()
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     return company
+
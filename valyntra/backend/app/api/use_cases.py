@@ -0,0 +1,134 @@
+"""
+Admin CRUD for the use-case catalog behind opportunity generation. Every write
+starts by bumping the catalog version, which also serializes concurrent edits
+on the catalog row; this worker reloads at once, the others within
+USE_CASE_CATALOG_POLL_SECONDS. Existing opportunities are unchanged until the
+company's next assessment.
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.core.security import get_current_admin
+from app.db.session import get_db
+from app.models.models import UseCaseEntry, UseCasePoints
+from app.schemas.schemas import (
+    UseCaseCatalogOut, UseCaseCreate, UseCaseOut, UseCasePointsIn, UseCasePointsOut, UseCaseUpdate,
+)
+from app.services.opportunity_engine import PRIORITY_POINTS, current_catalog
+from app.services.use_case_catalog import (
+    DEFAULT_INDUSTRY, bump_catalog_version, catalog_version, load_points, reload_catalog, seed_builtin_catalog,
+)
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.get("/use-case-catalog", response_model=UseCaseCatalogOut)
+def catalog_status(db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    """Stored catalog version vs the one compiled in this worker."""
+    snapshot = current_catalog()
+    return UseCaseCatalogOut(
+        version=catalog_version(db),
+        loaded_version=snapshot.version,
+        industries=sorted({industry for industry, _ in snapshot.ranked}),
+    )
+
+
+@router.get("/use-cases", response_model=List[UseCaseOut])
+def list_use_cases(industry: Optional[str] = None, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    stmt = select(UseCaseEntry).order_by(UseCaseEntry.industry, UseCaseEntry.id)
+    if industry is not None:
+        stmt = stmt.where(UseCaseEntry.industry == industry)
+    return db.scalars(stmt).all()
+
+
+@router.post("/use-cases", response_model=UseCaseOut, status_code=201)
+def create_use_case(payload: UseCaseCreate, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    bump_catalog_version(db)
+    # The first edit of an empty catalog starts from the built-in library
+    seed_builtin_catalog(db)
+    _validate_levels(payload.model_dump(), db)
+    entry = UseCaseEntry(**payload.model_dump())
+    db.add(entry)
+    _commit_and_reload(db)
+    db.refresh(entry)
+    return entry
+
+
+@router.patch("/use-cases/{use_case_id}", response_model=UseCaseOut)
+def update_use_case(use_case_id: int, payload: UseCaseUpdate, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    bump_catalog_version(db)
+    entry = _get_entry(use_case_id, db)
+    changes = payload.model_dump(exclude_unset=True)
+    _validate_levels(changes, db)
+    if "industry" in changes and changes["industry"] != DEFAULT_INDUSTRY:
+        _keep_default(entry, db)
+    for field, value in changes.items():
+        setattr(entry, field, value)
+    _commit_and_reload(db)
+    db.refresh(entry)
+    return entry
+
+
+@router.delete("/use-cases/{use_case_id}", status_code=204)
+def delete_use_case(use_case_id: int, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    bump_catalog_version(db)
+    entry = _get_entry(use_case_id, db)
+    _keep_default(entry, db)
+    db.delete(entry)
+    _commit_and_reload(db)
+
+
+@router.get("/use-case-points", response_model=List[UseCasePointsOut])
+def list_points(db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    return [
+        UseCasePointsOut(dimension=dimension, level=level, points=points)
+        for dimension, levels in load_points(db).items() for level, points in levels.items()
+    ]
+
+
+@router.put("/use-case-points/{dimension}/{level}", response_model=UseCasePointsOut)
+def set_points(dimension: str, level: str, payload: UseCasePointsIn, db: Session = Depends(get_db), admin=Depends(get_current_admin)):
+    """Set the ranking points of a level (adding the level if it's new)."""
+    if dimension not in PRIORITY_POINTS:
+        raise HTTPException(status_code=404, detail=f"Unknown dimension; choose from {', '.join(PRIORITY_POINTS)}")
+    bump_catalog_version(db)
+    row = db.get(UseCasePoints, (dimension, level))
+    if row is None:
+        row = UseCasePoints(dimension=dimension, level=level)
+        db.add(row)
+    row.points = payload.points
+    _commit_and_reload(db)
+    return UseCasePointsOut(dimension=dimension, level=level, points=payload.points)
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────
+def _get_entry(use_case_id: int, db: Session) -> UseCaseEntry:
+    entry = db.get(UseCaseEntry, use_case_id)
+    if not entry:
+        raise HTTPException(status_code=404, detail="Use case not found")
+    return entry
+
+
+def _validate_levels(values: dict, db: Session) -> None:
+    points = load_points(db)
+    for dimension in PRIORITY_POINTS:
+        if dimension in values and values[dimension] not in points[dimension]:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Unknown {dimension} level '{values[dimension]}'; choose from {', '.join(points[dimension])}",
+            )
+
+
+def _keep_default(entry: UseCaseEntry, db: Session) -> None:
+    """Unknown industries fall back to Default, so its last use case can't go."""
+    if entry.industry != DEFAULT_INDUSTRY:
+        return
+    defaults = db.scalar(select(func.count()).select_from(UseCaseEntry).where(UseCaseEntry.industry == DEFAULT_INDUSTRY))
+    if defaults <= 1:
+        raise HTTPException(status_code=409, detail="The Default industry needs at least one use case")
+
+
+def _commit_and_reload(db: Session) -> None:
+    db.commit()
+    reload_catalog(db)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -7,9 +8,67 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "changeme-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # Authenticated user cache (per process) and optional claims-only auth
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10_000
+    # Claims-only auth trusts is_admin / is_active as signed at login: revoking admin or
+    # deactivating a user takes effect only once their token expires (ACCESS_TOKEN_EXPIRE_MINUTES)
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
+    # Password hashing (bcrypt in a bounded process pool; 0 workers = inline)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
     ENVIRONMENT: str = "development"
+    # Create missing tables at startup; default on outside production (use `alembic upgrade head` there)
+    DB_CREATE_ALL: Optional[bool] = None
+    # Database connection pool (ignored for SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0       # Postgres statement_timeout; 0 = server default
+    # Serve read endpoints from an AsyncEngine (asyncpg / aiosqlite)
+    DB_ASYNC: bool = False
+    ASYNC_DATABASE_URL: str = ""           # default: DATABASE_URL with the async driver
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
+    # Provider matching: providers kept per opportunity, optionally per company size segment
+    MATCHES_PER_OPPORTUNITY: int = 3
+    MATCHES_PER_SEGMENT: dict[str, int] = {}
+    # How long a worker matches against its provider index before re-reading the catalog version
+    PROVIDER_INDEX_MAX_AGE_SECONDS: float = 5.0
+    # Assessment pipeline: run in background workers instead of inside the request
+    PIPELINE_BACKGROUND: bool = False
+    PIPELINE_WORKERS: int = 4
+    PIPELINE_POLL_SECONDS: float = 30.0
+    PIPELINE_JOB_TIMEOUT_SECONDS: int = 600
+    # Use-case catalog: seconds between version checks in each worker (0 = no watcher)
+    USE_CASE_CATALOG_POLL_SECONDS: float = 10.0
+    # List endpoints (keyset pagination)
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 1000
+    # Per-request stage timings: Server-Timing header, admin histograms, JSON log line (app.timing logger)
+    REQUEST_TIMING: bool = True
+    REQUEST_TIMING_LOG: bool = True
+    # Prometheus /metrics (set PROMETHEUS_MULTIPROC_DIR when running several workers)
+    METRICS_ENABLED: bool = True
+    # orjson default response class + single-validation serialization of *Out schemas
+    FAST_JSON: bool = False
+    # Read-endpoint response cache: memory (per worker) | redis | none
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    RESPONSE_CACHE_MAX_SIZE: int = 10_000
+    RESPONSE_CACHE_REDIS_URL: str = ""
+    # Incremental re-matching after a provider catalog change (0 workers = inline), run from
+    # the rematch_jobs queue by `python -m app.services.rematch --worker`
+    REMATCH_WORKERS: int = 4
+    REMATCH_CHUNK_SIZE: int = 2000
+    REMATCH_POLL_SECONDS: float = 10.0
+    REMATCH_JOB_TIMEOUT_SECONDS: int = 3600
+    # Bulk company/assessment import: rows per transaction, rows per request
+    IMPORT_CHUNK_SIZE: int = 500
+    IMPORT_MAX_ROWS: int = 100_000
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,10 @@
+from fastapi import Request
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match covers `etag` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [t.strip() for t in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
@@ -0,0 +1,140 @@
+"""
+Password hashing off the request thread.
+bcrypt runs in a bounded process pool and callers await it, so a burst of
+logins neither blocks the event loop nor holds threadpool threads while it
+hashes; callers past PASSWORD_HASH_MAX_QUEUE get a 503.
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+import anyio
+from fastapi import HTTPException
+from passlib.context import CryptContext
+from app.core.config import settings
+
+
+@lru_cache()
+def _context(rounds: int) -> CryptContext:
+    # min == max == default, so hashes at any other cost are flagged for rehash
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+# Module-level so they can be sent to pool processes
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(plain: str, hashed: str, rounds: int) -> tuple:
+    return _context(rounds).verify_and_update(plain, hashed)
+
+
+class _OpStats:
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 4),
+            "avg_seconds": round(self.total_seconds / self.count, 4) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 4),
+        }
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_in_flight = 0
+_peak_in_flight = 0
+_rejected = 0
+_stats = {"hash": _OpStats(), "verify": _OpStats()}
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None  # hash inline (tests / single-core dev)
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+async def _run(op: str, fn, *args):
+    global _in_flight, _peak_in_flight, _rejected
+    with _lock:
+        if _in_flight >= settings.PASSWORD_HASH_MAX_QUEUE:
+            _rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Too many authentication requests, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        _in_flight += 1
+        _peak_in_flight = max(_peak_in_flight, _in_flight)
+
+    start = time.perf_counter()
+    try:
+        pool = _get_pool()
+        if pool is None:
+            return await anyio.to_thread.run_sync(fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            _in_flight -= 1
+            _stats[op].observe(elapsed)
+
+
+async def hash_password(password: str) -> str:
+    return await _run("hash", _hash, password, settings.BCRYPT_ROUNDS)
+
+
+async def verify_and_update(plain: str, hashed: str) -> tuple:
+    """Returns (valid, new_hash); new_hash is set when the stored cost differs from BCRYPT_ROUNDS."""
+    return await _run("verify", _verify_and_update, plain, hashed, settings.BCRYPT_ROUNDS)
+
+
+def queue_depth() -> int:
+    return _in_flight
+
+
+def hashing_stats() -> dict:
+    with _lock:
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+            "in_flight": _in_flight,
+            "peak_in_flight": _peak_in_flight,
+            "rejected": _rejected,
+            **{op: s.as_dict() for op, s in _stats.items()},
+        }
+
+
+def shutdown_hash_pool() -> None:
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,151 @@
+"""
+Prometheus metrics, served at GET /metrics.
+
+  valyntra_http_requests_total / _request_duration_seconds   per router (route tag)
+  valyntra_stage_duration_seconds                             span() stages, incl. the pipeline
+  valyntra_db_pool_* / valyntra_cache_* / valyntra_password_hash_*
+                                                              gauges read from this worker
+
+Counters and histograms are prometheus_client objects: a dict lookup and an
+add per observation. Gauges are refreshed at most once a second per worker
+(after a request) and at scrape time.
+
+Several uvicorn workers: set PROMETHEUS_MULTIPROC_DIR to an empty directory
+before starting. Each worker then writes its values to mmap files there and
+/metrics, whichever worker serves it, aggregates all of them. Gauges are
+summed across live workers, and hit ratios are reported per worker (pid
+label). Without the variable each worker reports only itself.
+"""
+import os
+import threading
+import time
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+    disable_created_metrics, generate_latest, multiprocess,
+)
+from app.core.config import settings
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+disable_created_metrics()   # no *_created series
+
+REQUESTS = Counter(
+    "valyntra_http_requests_total", "HTTP requests", ["router", "method", "status"],
+)
+REQUEST_SECONDS = Histogram(
+    "valyntra_http_request_duration_seconds", "HTTP request latency until the body is sent", ["router"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+STAGE_SECONDS = Histogram(
+    "valyntra_stage_duration_seconds", "Duration of timed stages (auth, pipeline stages, commit, ...)", ["stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+# Per-worker values: summed over live workers in multiprocess mode
+_SUM = {"multiprocess_mode": "livesum"}
+DB_POOL = Gauge("valyntra_db_pool_connections", "Connection pool state", ["state"], **_SUM)
+DB_POOL_EVENTS = Gauge("valyntra_db_pool_events", "Pool checkouts / checkouts that waited at capacity / timeouts since start", ["event"], **_SUM)
+DB_POOL_WAIT = Gauge("valyntra_db_pool_wait_seconds", "Time spent waiting for a pooled connection since start", **_SUM)
+CACHE_LOOKUPS = Gauge("valyntra_cache_lookups", "Cache lookups since start", ["cache", "result"], **_SUM)
+CACHE_HIT_RATIO = Gauge("valyntra_cache_hit_ratio", "Cache hit ratio", ["cache"], multiprocess_mode="liveall")
+HASH_QUEUE = Gauge("valyntra_password_hash_queue_depth", "bcrypt operations queued or running", **_SUM)
+HASH_REJECTED = Gauge("valyntra_password_hash_rejected", "bcrypt operations rejected with 503 since start", **_SUM)
+
+GAUGE_INTERVAL_SECONDS = 1.0
+_gauges_refreshed = 0.0
+_gauges_lock = threading.Lock()
+
+
+def observe_stage(name: str, seconds: float) -> None:
+    if settings.METRICS_ENABLED:
+        STAGE_SECONDS.labels(name).observe(seconds)
+
+
+def router_name(scope: dict) -> str:
+    """First tag of the matched route (auth, companies, ..., dashboard); bounded label values."""
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    tags = getattr(route, "tags", None)
+    return tags[0] if tags else "other"
+
+
+def refresh_gauges(force: bool = False) -> None:
+    global _gauges_refreshed
+    now = time.monotonic()
+    if not force and now - _gauges_refreshed < GAUGE_INTERVAL_SECONDS:
+        return
+    if not _gauges_lock.acquire(blocking=False):
+        return  # another thread is refreshing
+    try:
+        _gauges_refreshed = now
+        # Imported here: these modules import timing, which imports this one
+        from app.core import hashing
+        from app.core.response_cache import response_cache
+        from app.core.security import user_cache
+        from app.db.session import pool_stats
+
+        pool = pool_stats()
+        for state in ("size", "checked_out", "checked_in", "overflow"):
+            if state in pool:
+                DB_POOL.labels(state).set(pool[state])
+        for name in ("checkouts", "waits", "timeouts"):
+            DB_POOL_EVENTS.labels(name).set(pool[name])
+        DB_POOL_WAIT.set(pool["wait_seconds_total"])
+
+        for cache, stats in (("user", user_cache.stats()), ("response", response_cache.stats())):
+            CACHE_LOOKUPS.labels(cache, "hit").set(stats["hits"])
+            CACHE_LOOKUPS.labels(cache, "miss").set(stats["misses"])
+            CACHE_HIT_RATIO.labels(cache).set(stats["hit_ratio"])
+
+        HASH_QUEUE.set(hashing.queue_depth())
+        HASH_REJECTED.set(hashing.hashing_stats()["rejected"])
+    finally:
+        _gauges_lock.release()
+
+
+def render() -> tuple:
+    """(body, content type) for GET /metrics."""
+    refresh_gauges(force=True)
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess directory (at shutdown)."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware counting requests and their latency per router."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status, elapsed = 500, None
+
+        async def send_and_observe(message):
+            nonlocal status, elapsed
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                elapsed = time.perf_counter() - start   # background tasks excluded
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_observe)
+        finally:
+            router = router_name(scope)
+            REQUESTS.labels(router, scope["method"], str(status)).inc()
+            REQUEST_SECONDS.labels(router).observe(elapsed if elapsed is not None else time.perf_counter() - start)
+            refresh_gauges()
@@ -0,0 +1,146 @@
+"""
+Keyset (cursor) pagination and `fields=` projection for list endpoints.
+
+A page is fetched with `WHERE (sort key) > (last row's sort key) ORDER BY sort key
+LIMIT n + 1`, so every page costs the same index range scan however deep the
+client pages. The cursor is the last row's sort key, base64-encoded.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, or_, select
+from app.core.config import settings
+from app.schemas.schemas import Page
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """Sort key of a list endpoint: (column, descending) pairs, ending in a unique column."""
+    columns: tuple
+
+    def order_by(self) -> list:
+        return [col.desc() if desc else col.asc() for col, desc in self.columns]
+
+    def after(self, values: list):
+        # Row-value comparison spelled out, since directions may differ per column
+        clauses = []
+        for i, (col, desc) in enumerate(self.columns):
+            equal = [c == v for (c, _), v in zip(self.columns[:i], values)]
+            clauses.append(and_(*equal, col < values[i] if desc else col > values[i]))
+        return or_(*clauses)
+
+
+class PageParams:
+    """Query parameters shared by the paginated list endpoints."""
+
+    def __init__(
+        self,
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return (default: all)"),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.fields = fields
+
+
+def encode_cursor(values: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _cursor_value(col, value):
+    """`value` as the Python type of `col`; ValueError if it isn't one (JSON has no datetimes or bool/int split)."""
+    try:
+        python_type = col.type.python_type
+    except NotImplementedError:
+        return value
+    if isinstance(value, bool) or value is None:
+        raise ValueError(value)
+    if python_type is float and isinstance(value, int):
+        return float(value)
+    if python_type is datetime and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if not isinstance(value, python_type):
+        raise ValueError(value)
+    return value
+
+
+def decode_cursor(cursor: str, keyset: Keyset) -> list:
+    """Sort-key values from a client cursor, checked against the keyset's columns (400 if they don't fit)."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keyset.columns):
+            raise ValueError(values)
+        return [_cursor_value(col, v) for (col, _), v in zip(keyset.columns, values)]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _projection(model, schema, fields: Optional[str]) -> Optional[list]:
+    if not fields:
+        return None
+    allowed = [f for f in schema.model_fields if f in model.__table__.columns]
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in allowed]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}; choose from {', '.join(allowed)}",
+        )
+    return requested
+
+
+class PageQuery:
+    """
+    One page of `model` rows matching `where`, ordered by `keyset`, fetched with
+    `fetch` (Session) or `fetch_async` (AsyncSession). With `fields=` only those
+    columns are selected and the page skips response_model validation; otherwise
+    rows are full ORM entities.
+    """
+
+    def __init__(self, model, schema, where: list, keyset: Keyset, params: PageParams, options: tuple = ()):
+        self.schema = schema
+        self.keyset = keyset
+        self.limit = params.limit
+        self.fields = _projection(model, schema, params.fields)
+
+        if self.fields is None:
+            stmt = select(model).options(*options)
+        else:
+            key_columns = [col.label(f"_key{i}") for i, (col, _) in enumerate(keyset.columns)]
+            stmt = select(*(getattr(model, f) for f in self.fields), *key_columns)
+        stmt = stmt.where(*where)
+        if params.cursor:
+            stmt = stmt.where(keyset.after(decode_cursor(params.cursor, keyset)))
+        # One extra row tells us whether there is a next page
+        self.statement = stmt.order_by(*keyset.order_by()).limit(self.limit + 1)
+
+    def fetch(self, db):
+        result = db.execute(self.statement)
+        return self.response(result.scalars().all() if self.fields is None else result.all())
+
+    async def fetch_async(self, db):
+        result = await db.execute(self.statement)
+        return self.response(result.scalars().all() if self.fields is None else result.all())
+
+    def _key(self, row) -> list:
+        if self.fields is None:
+            return [getattr(row, col.key) for col, _ in self.keyset.columns]
+        return list(row[len(self.fields):])
+
+    def response(self, rows: list):
+        """Page envelope for the fetched rows (entities, or Row tuples when projecting)."""
+        rows = list(rows)
+        next_cursor = None
+        if len(rows) > self.limit:
+            rows = rows[:self.limit]
+            next_cursor = encode_cursor(jsonable_encoder(self._key(rows[-1])))
+        if self.fields is None:
+            return Page[self.schema].model_validate({"items": rows, "next_cursor": next_cursor})
+        items = [dict(zip(self.fields, row)) for row in rows]
+        return JSONResponse(jsonable_encoder({"items": items, "next_cursor": next_cursor}))
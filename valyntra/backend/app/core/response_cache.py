@@ -0,0 +1,204 @@
+"""
+Response cache for the read endpoints, with strong ETags.
+
+Entries are the serialized JSON body plus its ETag, keyed by route, user, company
+and query string. Invalidation never deletes keys: each company (and the provider
+catalog) has a version number that is part of the key, and a write bumps it once
+its transaction commits. Stale entries are never read again and age out by TTL.
+
+Writers invalidate through invalidate_on_commit() / invalidate(): the
+assessment pipeline, provider changes, batch re-scoring (calculate_scores_batch)
+and re-matching; when re-matching fans out to its process pool, the parent
+invalidates the companies the children changed.
+
+Backends:
+  memory  per-process LRU + TTL (default). Invalidation only reaches the process
+          that made the change: other API workers, and API workers after a CLI
+          run (python -m app.services.scoring / app.services.rematch), serve up
+          to TTL-old entries (RESPONSE_CACHE_TTL_SECONDS). Re-matching always runs
+          in the re-match worker process, so use the redis backend with several
+          workers or out-of-process writers.
+  redis   any client with the redis-py get/set/incr API (a fake works in tests).
+  none    no caching; responses still carry ETags and honour If-None-Match.
+"""
+import hashlib
+import threading
+from typing import Any, Callable, Optional
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.etag import etag_matches
+from app.core.serialization import dumps
+from app.core.timing import span
+
+PROVIDERS = "providers"
+
+
+class MemoryBackend:
+    def __init__(self, maxsize: int, ttl: float):
+        self.entries = TTLCache(maxsize, ttl)
+        # Versions must outlive entries: an evicted version would restart at 0
+        # and make older entries reachable again
+        self._versions: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.entries.set(key, value, ttl)
+
+    def version(self, scope: str) -> int:
+        return self._versions.get(scope, 0)
+
+    def bump(self, scope: str) -> None:
+        with self._lock:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+
+
+class RedisBackend:
+    def __init__(self, client, prefix: str = "valyntra:rc:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(self.prefix + key, value, ex=ttl)
+
+    def version(self, scope: str) -> int:
+        return int(self.client.get(f"{self.prefix}v:{scope}") or 0)
+
+    def bump(self, scope: str) -> None:
+        self.client.incr(f"{self.prefix}v:{scope}")
+
+
+class NullBackend:
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    def version(self, scope: str) -> int:
+        return 0
+
+    def bump(self, scope: str) -> None:
+        pass
+
+
+def _backend_from_settings():
+    if settings.RESPONSE_CACHE_BACKEND == "none":
+        return NullBackend()
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        import redis  # optional dependency, only needed for this backend
+        return RedisBackend(redis.Redis.from_url(settings.RESPONSE_CACHE_REDIS_URL))
+    return MemoryBackend(settings.RESPONSE_CACHE_MAX_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+def company_scope(company_id: int) -> str:
+    return f"company:{company_id}"
+
+
+class ResponseCache:
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, request: Request, scope: str, user_id: Optional[int] = None) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        version = self.backend.version(scope)
+        return f"{request.scope['route'].path}|{scope}@{version}|u{user_id}|{query}"
+
+    def _entry(self, key: str, content: Any) -> bytes:
+        with span("serialization"):
+            if isinstance(content, Response):
+                body = bytes(content.body)
+            elif isinstance(content, BaseModel):
+                body = content.model_dump_json().encode()
+            else:
+                body = dumps(content)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        entry = etag.encode() + b"\n" + body
+        self.backend.set(key, entry, self.ttl)
+        return entry
+
+    def _respond(self, request: Request, entry: bytes) -> Response:
+        etag, body = entry.split(b"\n", 1)
+        headers = {"ETag": etag.decode(), "Cache-Control": "private, no-cache"}
+        if etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    def respond(self, request: Request, key: str, build: Callable[[], Any]) -> Response:
+        """
+        Serve `key` from the cache, or call `build` (which may raise, e.g. a 404)
+        and cache its result: a pydantic model, a JSON-able value or a Response.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._entry(key, build())
+        else:
+            self.hits += 1
+        return self._respond(request, entry)
+
+    async def respond_async(self, request: Request, key: str, build) -> Response:
+        """respond() for async routes: `build` is a coroutine function."""
+        entry = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._entry(key, await build())
+        else:
+            self.hits += 1
+        return self._respond(request, entry)
+
+    def invalidate(self, scope: str) -> None:
+        self.backend.bump(scope)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        stats = {
+            "backend": type(self.backend).__name__,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+        if isinstance(self.backend, MemoryBackend):
+            stats.update(size=len(self.backend.entries), evictions=self.backend.entries.evictions)
+        return stats
+
+
+response_cache = ResponseCache(_backend_from_settings(), settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+def set_backend(backend) -> None:
+    """Swap the cache backend (e.g. a fake Redis client wrapped in RedisBackend)."""
+    response_cache.backend = backend
+
+
+# ── Invalidation on commit ───────────────────────────────────────────────
+def invalidate_on_commit(db: Session, scope: str) -> None:
+    """
+    Bump `scope` once `db` commits. Bumping earlier would let a concurrent read
+    re-cache the pre-commit state under the new version.
+    """
+    db.info.setdefault("response_cache_scopes", set()).add(scope)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    for scope in session.info.pop("response_cache_scopes", ()):
+        response_cache.invalidate(scope)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop("response_cache_scopes", None)
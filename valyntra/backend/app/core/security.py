@@ -1,23 +1,29 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from app.core.cache import TTLCache
+from app.core import hashing
 from app.core.config import settings
-from app.db.session import get_db
+from app.core.timing import span
+from app.db.session import get_db, get_async_db
+from app.models.models import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+async def verify_and_rehash(plain: str, hashed: str) -> tuple:
+    """(valid, new_hash) — new_hash is set when the stored bcrypt cost is out of date."""
+    return await hashing.verify_and_update(plain, hashed)
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    return await hashing.hash_password(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -34,18 +40,114 @@ def decode_token(token: str) -> dict:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    from app.models.user import User
-    payload = decode_token(token)
+# ── Current user ─────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class CurrentUser:
+    """Session-independent snapshot of a User, safe to cache across requests."""
+    id: int
+    is_admin: bool
+    is_active: bool
+    email: Optional[str] = None
+    full_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_user(user_id: int) -> None:
+    user_cache.delete(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target):
+    # Evicted once the flush commits, like invalidate_on_commit: evicting now would let a
+    # concurrent request re-cache the pre-commit row
+    session = object_session(target)
+    if session is None:
+        invalidate_user(target.id)
+    else:
+        session.info.setdefault("user_cache_ids", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    for user_id in session.info.pop("user_cache_ids", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop("user_cache_ids", None)
+
+
+def _user_id_from(payload: dict) -> int:
     user_id: str = payload.get("sub")
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if not user:
+    return int(user_id)
+
+
+def _cache_user(row: Optional[User]) -> CurrentUser:
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
+    user = CurrentUser(
+        id=row.id,
+        is_admin=bool(row.is_admin),
+        is_active=bool(row.is_active),
+        email=row.email,
+        full_name=row.full_name,
+        created_at=row.created_at,
+    )
+    user_cache.set(user.id, user)
+    return user
+
+
+def _load_user(user_id: int, db: Session) -> CurrentUser:
+    user = user_cache.get(user_id)
+    if user is None:
+        user = _cache_user(db.query(User).filter(User.id == user_id).first())
     return user
 
 
+def _claims_user(payload: dict) -> Optional[CurrentUser]:
+    """
+    Claims-only fast path: trust is_admin / is_active signed into the token, so a
+    change to either only applies to tokens issued after it (see AUTH_TRUST_TOKEN_CLAIMS).
+    """
+    if settings.AUTH_TRUST_TOKEN_CLAIMS and "adm" in payload and "act" in payload:
+        return CurrentUser(id=_user_id_from(payload), is_admin=bool(payload["adm"]), is_active=bool(payload["act"]))
+    return None
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> CurrentUser:
+    with span("auth"):
+        payload = decode_token(token)
+        return _claims_user(payload) or _load_user(_user_id_from(payload), db)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
+    with span("auth"):
+        payload = decode_token(token)
+        user = _claims_user(payload)
+        if user is None:
+            user_id = _user_id_from(payload)
+            user = user_cache.get(user_id)
+            if user is None:
+                row = (await db.execute(select(User).where(User.id == user_id))).scalar_one_or_none()
+                user = _cache_user(row)
+        return user
+
+
+def get_current_user_profile(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> CurrentUser:
+    """Like get_current_user but always resolves the full profile (never claims-only)."""
+    with span("auth"):
+        return _load_user(_user_id_from(decode_token(token)), db)
+
+
 def get_current_admin(current_user=Depends(get_current_user)):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
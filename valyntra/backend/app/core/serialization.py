@@ -0,0 +1,41 @@
+"""
+Fast JSON path (FAST_JSON).
+
+With `response_model`, FastAPI validates the returned ORM rows, dumps the result
+back to Python objects and then JSON-encodes them. `fast_response` validates once
+against the *Out schema and lets pydantic-core write the JSON bytes directly;
+with the flag off it returns the content untouched and FastAPI does the usual.
+"""
+import json
+from functools import lru_cache
+from typing import Any, Optional
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from app.core.config import settings
+from app.core.timing import span
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def fast_response(schema, content: Any, status_code: int = 200, headers: Optional[dict] = None):
+    """`schema` may be a model or a generic alias such as list[CompanyOut] / Page[MatchOut]."""
+    if not settings.FAST_JSON or isinstance(content, Response):
+        return content
+    with span("serialization"):
+        if isinstance(content, BaseModel) and type(content) is schema:
+            body = content.model_dump_json().encode()
+        else:
+            adapter = _adapter(schema)
+            body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    return Response(body, status_code=status_code, media_type="application/json", headers=headers)
+
+
+def dumps(content: Any) -> bytes:
+    """Plain JSON values (e.g. stored dashboard snapshots) → bytes."""
+    if settings.FAST_JSON:
+        import orjson  # only required in FAST_JSON mode
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode()
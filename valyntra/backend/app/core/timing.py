@@ -0,0 +1,202 @@
+"""
+Per-request stage timings.
+
+`TimingMiddleware` gives every HTTP request a `RequestTimings` (in a context
+variable, so it follows the request into threadpool dependencies and async
+sessions). `span("name")` blocks add to it, and so does every SQL statement
+(`db`). When the response starts, the stages go out as a `Server-Timing`
+header. When it completes they are logged as one JSON line on the
+`app.timing` logger and added to per-route / per-stage histograms, served by
+GET /api/admin/timings (this worker only).
+
+Every span is also observed by the Prometheus stage histogram (metrics.py),
+in a request or not, so pipeline stages run by background jobs are counted too.
+"""
+import bisect
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.core.metrics import observe_stage
+
+logger = logging.getLogger("app.timing")
+
+# Upper bounds in milliseconds; the last bucket is +Inf
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (thread-safe)."""
+
+    def __init__(self, buckets: tuple = BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None if it's the +Inf bucket)."""
+        target, seen = q * self.count, 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum / self.count, 3) if self.count else 0.0,
+            "p50_le_ms": self.quantile(0.50),
+            "p95_le_ms": self.quantile(0.95),
+            "p99_le_ms": self.quantile(0.99),
+            "buckets": {str(b): n for b, n in zip(self.buckets + ("+Inf",), self.counts)},
+        }
+
+
+class RequestTimings:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.stages: dict = {}        # name → ms, summed over repeated spans
+        self.queries = 0
+
+    def add(self, name: str, ms: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + ms
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def header(self) -> str:
+        parts = [f"{name};dur={ms:.2f}" for name, ms in self.stages.items() if name != "db"]
+        if self.queries:
+            parts.append(f'db;dur={self.stages.get("db", 0.0):.2f};desc="{self.queries} queries"')
+        parts.append(f"total;dur={self.elapsed_ms():.2f}")
+        return ", ".join(parts)
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def span(name: str):
+    """Time the block as stage `name` of the current request (if any) and in metrics."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        observe_stage(name, elapsed)
+        timings = _current.get()
+        if timings is not None:
+            timings.add(name, elapsed * 1000)
+
+
+# ── SQL statements ───────────────────────────────────────────────────────
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("timing_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = _current.get()
+    starts = conn.info.get("timing_query_start")
+    if timings is not None and starts:
+        timings.add("db", (time.perf_counter() - starts.pop()) * 1000)
+        timings.queries += 1
+
+
+# ── Aggregates ───────────────────────────────────────────────────────────
+_histograms: dict = {}          # (route, stage) → Histogram
+_histograms_lock = threading.Lock()
+
+
+def _observe(route: str, stage: str, ms: float) -> None:
+    histogram = _histograms.get((route, stage))
+    if histogram is None:
+        with _histograms_lock:
+            histogram = _histograms.setdefault((route, stage), Histogram())
+    histogram.observe(ms)
+
+
+def timing_stats() -> dict:
+    """{route: {stage: histogram stats}} for this worker."""
+    stats: dict = {}
+    for (route, stage), histogram in sorted(_histograms.items()):
+        stats.setdefault(route, {})[stage] = histogram.stats()
+    return stats
+
+
+def reset_timing_stats() -> None:
+    with _histograms_lock:
+        _histograms.clear()
+
+
+def route_name(scope: dict) -> str:
+    """'METHOD /path/{template}'; unmatched paths share one name to keep cardinality bounded."""
+    route = scope.get("route")
+    return f"{scope['method']} {route.path}" if route is not None else "unmatched"
+
+
+# ── Middleware ───────────────────────────────────────────────────────────
+class TimingMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware task per request)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status, total = 500, None
+
+        async def send_with_header(message):
+            nonlocal status, total
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", timings.header().encode())]
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Background tasks run after this; they are not part of the request's latency
+                total = timings.elapsed_ms()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            _current.reset(token)
+            self._record(scope, timings, status, total if total is not None else timings.elapsed_ms())
+
+    @staticmethod
+    def _record(scope: dict, timings: RequestTimings, status: int, total: float) -> None:
+        route = route_name(scope)
+        for stage, ms in timings.stages.items():
+            _observe(route, stage, ms)
+        _observe(route, "total", total)
+        if settings.REQUEST_TIMING_LOG and logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                "route": route,
+                "path": scope["path"],
+                "status": status,
+                "total_ms": round(total, 3),
+                "queries": timings.queries,
+                "stages_ms": {name: round(ms, 3) for name, ms in timings.stages.items()},
+            }))
@@ -0,0 +1,65 @@
+"""
+Deploy-time migrations: `python -m app.db.migrate` (from backend/), then start
+the app. Runs `alembic upgrade head`, but first stamps databases that predate
+Alembic (schema tables present, no alembic_version) at the revision their
+tables and columns match, so the upgrade doesn't fail on "table already exists".
+"""
+import logging
+import sys
+from typing import Optional
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from app.db.session import get_engine
+
+logger = logging.getLogger(__name__)
+
+BASELINE_TABLES = {"users", "companies", "assessments", "scores", "opportunities", "providers", "matches"}
+# Newest first: (revision, tables / "table.column"s it adds). 0002 only adds
+# indexes, created IF NOT EXISTS.
+REVISION_OBJECTS = [
+    ("0006", {"rematch_jobs"}),
+    ("0005", {"provider_catalog"}),
+    ("0004", {"opportunities.top_k"}),
+    ("0003", {"use_cases", "use_case_points", "use_case_catalog"}),
+    ("0001b", {"pipeline_jobs", "company_dashboards"}),
+]
+
+
+def schema_objects(inspector) -> set:
+    """Table names plus "table.column" for every column."""
+    tables = set(inspector.get_table_names())
+    return tables | {f"{table}.{c['name']}" for table in tables for c in inspector.get_columns(table)}
+
+
+def unversioned_revision(objects: set) -> Optional[str]:
+    """Revision an un-stamped database already matches; None if it's empty or versioned."""
+    if "alembic_version" in objects or not objects & BASELINE_TABLES:
+        return None
+    missing = BASELINE_TABLES - objects
+    if missing:
+        raise RuntimeError(f"Partial baseline schema, missing {', '.join(sorted(missing))}; stamp it by hand")
+    for revision, added in REVISION_OBJECTS:
+        if added <= objects:
+            return revision
+        if added & objects:
+            raise RuntimeError(f"Partial schema for revision {revision} ({', '.join(sorted(added & objects))}); stamp it by hand")
+    return "0001"
+
+
+def migrate(config_path: str = "alembic.ini") -> None:
+    config = Config(config_path)
+    revision = unversioned_revision(schema_objects(inspect(get_engine())))
+    if revision is not None:
+        logger.warning("Database has no alembic_version; stamping existing schema at %s", revision)
+        command.stamp(config, revision)
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        migrate()
+    except RuntimeError as e:
+        logger.error("%s", e)
+        sys.exit(1)
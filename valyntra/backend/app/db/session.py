@@ -1,16 +1,188 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class _PoolStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+
+    def observe_wait(self, seconds: float, timed_out: bool) -> None:
+        with self.lock:
+            self.waits += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+
+_pool_stats = _PoolStats()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection when it is at capacity."""
+
+    def _at_capacity(self) -> bool:
+        # No idle connection and no overflow left: QueuePool blocks until one is returned
+        return self.checkedin() == 0 and -1 < self._max_overflow <= self.overflow()
+
+    def _do_get(self):
+        if not self._at_capacity():
+            return super()._do_get()
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            _pool_stats.observe_wait(time.perf_counter() - start, timed_out)
+
+
+def _engine_kwargs(url: str) -> dict:
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    kwargs = dict(
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    if settings.DB_STATEMENT_TIMEOUT_MS and make_url(url).get_backend_name() == "postgresql":
+        kwargs["connect_args"] = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return kwargs
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    with _pool_stats.lock:
+        _pool_stats.checkouts += 1
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Created on first use, so importing the app doesn't load the DB driver."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(settings.DATABASE_URL, **_engine_kwargs(settings.DATABASE_URL))
+                event.listen(engine, "checkout", _on_checkout)
+                _engine = engine
+    return _engine
+
+
+def __getattr__(name):
+    # `from app.db.session import engine` keeps working, but creates the engine lazily
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker that binds to the engine the first time a session is made."""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
 
+def pool_stats() -> dict:
+    """Utilization of this worker's connection pool."""
+    pool = get_engine().pool
+    stats = {
+        "pool_class": type(pool).__name__,
+        "checkouts": _pool_stats.checkouts,
+        "waits": _pool_stats.waits,
+        "wait_seconds_total": round(_pool_stats.wait_seconds_total, 4),
+        "wait_seconds_max": round(_pool_stats.wait_seconds_max, 4),
+        "timeouts": _pool_stats.timeouts,
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    return stats
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+# ── Async stack (read endpoints when DB_ASYNC is on) ─────────────────────
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    backend = "postgresql" if url.get_backend_name() == "postgres" else url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise RuntimeError(f"No async driver configured for {backend}; set ASYNC_DATABASE_URL")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def get_async_engine():
+    """Created on first use so sync-only deployments never import the async drivers."""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        url = async_database_url()
+        kwargs = {}
+        if make_url(url).get_backend_name() != "sqlite":
+            kwargs = dict(
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_pre_ping=settings.DB_POOL_PRE_PING,
+            )
+            if settings.DB_STATEMENT_TIMEOUT_MS:
+                kwargs["connect_args"] = {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+        _async_engine = create_async_engine(url, **kwargs)
+        _async_session_factory = async_sessionmaker(_async_engine, class_=AsyncSession, expire_on_commit=False)
+    return _async_engine
+
+
+async def get_async_db():
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = _async_session_factory = None
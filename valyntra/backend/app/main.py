@@ -1,21 +1,60 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.db.session import Base, engine
+from app.core.config import settings
+from app.db.session import Base, SessionLocal, get_engine, dispose_async_engine
+from app.api.admin import router as admin_router
 from app.api.auth import router as auth_router
 from app.api.companies import router as companies_router
 from app.api.assessments import router as assessments_router
-from app.api.routes import (
-    scores_router, opps_router, providers_router,
-    matches_router, dashboard_router,
-)
+from app.api.imports import router as imports_router
+from app.api.use_cases import router as use_cases_router
+from app.api import routes, async_routes
+from app.core.hashing import shutdown_hash_pool
+from app.core.timing import TimingMiddleware
+from app.core.metrics import MetricsMiddleware, mark_worker_dead, render as render_metrics
+from app.services.jobs import start_workers, stop_workers
+from app.services.provider_index import seed_provider_catalog
+from app.services.use_case_catalog import bump_catalog_version, seed_builtin_catalog, start_catalog_watcher, stop_catalog_watcher
+
+
+def _create_all_enabled() -> bool:
+    if settings.DB_CREATE_ALL is not None:
+        return settings.DB_CREATE_ALL
+    return settings.ENVIRONMENT != "production"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Dev convenience only: production schema is managed by Alembic, so startup
+    # never creates or writes tables there (it only reads the use-case catalog)
+    if _create_all_enabled():
+        Base.metadata.create_all(bind=get_engine())
+        with SessionLocal() as db:
+            if seed_builtin_catalog(db):
+                bump_catalog_version(db)
+            seed_provider_catalog(db)
+            db.commit()
+    # Loads the stored use-case catalog now, then follows edits made by other workers
+    start_catalog_watcher()
+    # Background pipeline workers also pick up jobs left queued by a previous run
+    if settings.PIPELINE_BACKGROUND:
+        start_workers()
+    yield
+    stop_catalog_watcher()
+    stop_workers()
+    shutdown_hash_pool()
+    await dispose_async_engine()
+    mark_worker_dead()
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Valyntra Platform API",
     description="AI Adoption & Operational Intelligence Platform",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if settings.FAST_JSON else JSONResponse,
 )
 
 app.add_middleware(
@@ -24,17 +63,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Server-Timing"],
 )
+# Added last = outermost, so measured latency covers every other middleware
+if settings.REQUEST_TIMING:
+    app.add_middleware(TimingMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 # Register routers
 app.include_router(auth_router)
 app.include_router(companies_router)
 app.include_router(assessments_router)
-app.include_router(scores_router)
-app.include_router(opps_router)
-app.include_router(providers_router)
-app.include_router(matches_router)
-app.include_router(dashboard_router)
+app.include_router(imports_router)
+# Read endpoints: sync (threadpool) or async (AsyncEngine) stack
+read_routes = async_routes if settings.DB_ASYNC else routes
+app.include_router(read_routes.scores_router)
+app.include_router(read_routes.opps_router)
+app.include_router(read_routes.providers_router)
+app.include_router(routes.provider_admin_router)
+app.include_router(read_routes.matches_router)
+app.include_router(read_routes.dashboard_router)
+app.include_router(admin_router)
+app.include_router(use_cases_router)
 
 
 @app.get("/")
@@ -45,3 +96,11 @@ def root():
 @app.get("/health")
 def health():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
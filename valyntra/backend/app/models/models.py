@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON, Enum
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.session import Base
@@ -20,6 +20,9 @@ class User(Base):
 
 class Company(Base):
     __tablename__ = "companies"
+    __table_args__ = (
+        Index("ix_companies_owner_id_id", "owner_id", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     name = Column(String, nullable=False)
@@ -41,6 +44,9 @@ class Company(Base):
 
 class Assessment(Base):
     __tablename__ = "assessments"
+    __table_args__ = (
+        Index("ix_assessments_company_id_id", "company_id", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     # Scoring inputs (1-5 scale)
@@ -61,6 +67,10 @@ class Assessment(Base):
 
 class Score(Base):
     __tablename__ = "scores"
+    __table_args__ = (
+        # latest score per company: ORDER BY calculated_at DESC, id DESC
+        Index("ix_scores_company_id_calculated_at", "company_id", "calculated_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     assessment_id = Column(Integer, ForeignKey("assessments.id"), unique=True)
     company_id = Column(Integer, ForeignKey("companies.id"))
@@ -77,6 +87,9 @@ class Score(Base):
 
 class Opportunity(Base):
     __tablename__ = "opportunities"
+    __table_args__ = (
+        Index("ix_opportunities_company_id_rank", "company_id", "rank"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     use_case = Column(String)
@@ -85,6 +98,7 @@ class Opportunity(Base):
     implementation_effort = Column(String)  # High / Medium / Low
     roi_classification = Column(String)     # Quick Win / Strategic / Long-Term
     rank = Column(Integer)
+    top_k = Column(Integer)                 # matches per opportunity it was matched with
     generated_at = Column(DateTime(timezone=True), server_default=func.now())
 
     company = relationship("Company", back_populates="opportunities")
@@ -109,8 +123,21 @@ class Provider(Base):
     matches = relationship("Match", back_populates="provider")
 
 
+class ProviderCatalog(Base):
+    """Single row (id=1): bumped with every provider write; workers rebuild their provider index when it changes."""
+    __tablename__ = "provider_catalog"
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_company_id_weighted_score", "company_id", "weighted_score"),
+        Index("ix_matches_opportunity_id", "opportunity_id"),
+        Index("ix_matches_provider_id", "provider_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     opportunity_id = Column(Integer, ForeignKey("opportunities.id"), nullable=False)
@@ -125,3 +152,70 @@ class Match(Base):
     company = relationship("Company", back_populates="matches")
     opportunity = relationship("Opportunity", back_populates="matches")
     provider = relationship("Provider", back_populates="matches")
+
+
+class PipelineJob(Base):
+    __tablename__ = "pipeline_jobs"
+    id = Column(Integer, primary_key=True, index=True)
+    assessment_id = Column(Integer, ForeignKey("assessments.id"), nullable=False)
+    company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    status = Column(String, default="queued", index=True)  # queued / running / done / failed
+    top_k = Column(Integer)                 # matches per opportunity override
+    attempts = Column(Integer, default=0)
+    error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+
+class RematchJob(Base):
+    """A provider change still to be applied to existing matches (run by the re-match worker, not the API)."""
+    __tablename__ = "rematch_jobs"
+    id = Column(Integer, primary_key=True, index=True)
+    provider_id = Column(Integer, ForeignKey("providers.id"), nullable=False)
+    change = Column(String, nullable=False)                 # added / removed
+    status = Column(String, default="queued", index=True)  # queued / running / done / failed
+    attempts = Column(Integer, default=0)
+    changed_companies = Column(Integer)
+    error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+
+class CompanyDashboard(Base):
+    __tablename__ = "company_dashboards"
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    version = Column(Integer, nullable=False, default=1)   # bumped on every rebuild; drives the ETag
+    payload = Column(JSON, nullable=False)                 # serialized DashboardOut
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class UseCaseEntry(Base):
+    """Admin-editable opportunity library (compiled in memory by services/use_case_catalog.py)."""
+    __tablename__ = "use_cases"
+    id = Column(Integer, primary_key=True, index=True)
+    industry = Column(String, nullable=False)       # "Default" = fallback for other industries
+    use_case = Column(String, nullable=False)
+    tag = Column(String, nullable=False)            # matched against provider capability_tags
+    impact = Column(String, nullable=False)         # levels of use_case_points
+    effort = Column(String, nullable=False)
+    roi = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class UseCasePoints(Base):
+    """Ranking points per level of each use-case dimension (effort / impact / roi)."""
+    __tablename__ = "use_case_points"
+    dimension = Column(String, primary_key=True)
+    level = Column(String, primary_key=True)
+    points = Column(Integer, nullable=False)
+
+
+class UseCaseCatalog(Base):
+    """Single row (id=1): bumped with every catalog edit; workers reload when it changes."""
+    __tablename__ = "use_case_catalog"
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
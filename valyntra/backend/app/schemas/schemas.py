@@ -1,7 +1,15 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from typing import Generic, Optional, List, TypeVar
 from datetime import datetime
 
+T = TypeVar("T")
+
+
+# ── Pagination ───────────────────────────────────────────────────────────
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None   # pass back as ?cursor= for the next page
+
 
 # ── Auth ────────────────────────────────────────────────────────────────
 class UserCreate(BaseModel):
@@ -72,6 +80,19 @@ class AssessmentOut(BaseModel):
     primary_pain: Optional[str]
     budget_range: Optional[str]
     submitted_at: datetime
+    job_id: Optional[int] = None   # set when the pipeline runs in the background
+    class Config: from_attributes = True
+
+class PipelineJobOut(BaseModel):
+    id: int
+    assessment_id: int
+    company_id: int
+    status: str                    # queued / running / done / failed
+    attempts: int
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
     class Config: from_attributes = True
 
 
@@ -102,6 +123,43 @@ class OpportunityOut(BaseModel):
     class Config: from_attributes = True
 
 
+# ── Use-case catalog (admin) ─────────────────────────────────────────────
+class UseCaseCreate(BaseModel):
+    industry: str
+    use_case: str
+    tag: str
+    impact: str
+    effort: str
+    roi: str
+
+class UseCaseUpdate(BaseModel):
+    # Omitted fields are left alone (exclude_unset); explicit nulls are rejected (422)
+    industry: str = None
+    use_case: str = None
+    tag: str = None
+    impact: str = None
+    effort: str = None
+    roi: str = None
+
+class UseCaseOut(UseCaseCreate):
+    id: int
+    class Config: from_attributes = True
+
+class UseCasePointsIn(BaseModel):
+    points: int
+
+class UseCasePointsOut(BaseModel):
+    dimension: str
+    level: str
+    points: int
+    class Config: from_attributes = True
+
+class UseCaseCatalogOut(BaseModel):
+    version: int            # in the database
+    loaded_version: int     # compiled in the worker serving the request
+    industries: List[str]
+
+
 # ── Provider ─────────────────────────────────────────────────────────────
 class ProviderCreate(BaseModel):
     name: str
@@ -129,7 +187,8 @@ class ProviderOut(BaseModel):
 
 
 # ── Match ────────────────────────────────────────────────────────────────
-class MatchOut(BaseModel):
+class MatchRefOut(BaseModel):
+    """A match that references its provider / opportunity by id only (compact responses)."""
     id: int
     company_id: int
     opportunity_id: int
@@ -139,9 +198,18 @@ class MatchOut(BaseModel):
     weighted_score: float
     est_pilot_value: Optional[float]
     stage: str
+    class Config: from_attributes = True
+
+class MatchOut(MatchRefOut):
     provider: Optional[ProviderOut]
     opportunity: Optional[OpportunityOut]
-    class Config: from_attributes = True
+
+class CompactMatchPage(BaseModel):
+    """?compact=true: each provider and opportunity once, matches reference them by id."""
+    items: List[MatchRefOut]
+    providers: List[ProviderOut]
+    opportunities: List[OpportunityOut]
+    next_cursor: Optional[str] = None
 
 
 # ── Dashboard ────────────────────────────────────────────────────────────
@@ -151,3 +219,12 @@ class DashboardOut(BaseModel):
     opportunities: List[OpportunityOut]
     matches: List[MatchOut]
     total_pipeline_value: float
+
+class CompactDashboardOut(BaseModel):
+    """?compact=true: matches reference `opportunities` and `providers` by id."""
+    company: CompanyOut
+    score: Optional[ScoreOut]
+    opportunities: List[OpportunityOut]
+    matches: List[MatchRefOut]
+    providers: List[ProviderOut]
+    total_pipeline_value: float
@@ -0,0 +1,147 @@
+"""
+Valyntra Bulk Import
+Streams CRM exports (CSV / NDJSON) into companies + assessments, one chunk per transaction
+"""
+import csv
+import io
+import json
+import queue
+from typing import Iterator, Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.models.models import Assessment, Company
+from app.services.pipeline import run_pipeline_batch
+
+FORMATS = ("csv", "ndjson")
+_ABORT = object()
+
+
+class BodyReader(io.RawIOBase):
+    """
+    Blocking file object over request body chunks fed from the event loop, so a
+    worker thread can parse the upload while it is still arriving. The bounded
+    queue applies back-pressure to the client: the event loop uses feed_nowait()
+    and only waits on a full queue (feed()) from a thread.
+    """
+
+    def __init__(self, max_chunks: int = 16):
+        self._chunks: queue.Queue = queue.Queue(max_chunks)
+        self._buffer = b""
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def feed_nowait(self, chunk) -> bool:
+        """Hand over a chunk if there is room (safe on the event loop). False if full or closed."""
+        if self.closed:
+            return False
+        try:
+            self._chunks.put_nowait(chunk)
+            return True
+        except queue.Full:
+            return False
+
+    def feed(self, chunk, timeout: float = 0.1) -> bool:
+        """
+        Hand over a chunk (b"" = end of body), waiting while the queue is full, so
+        call it from a thread. Returns False once the reader is closed.
+        """
+        while not self.closed:
+            try:
+                self._chunks.put(chunk, timeout=timeout)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def abort(self) -> None:
+        """Make the reader raise; never blocks (queued chunks are dropped to make room)."""
+        while not self.closed:
+            try:
+                self._chunks.put_nowait(_ABORT)
+                return
+            except queue.Full:
+                try:
+                    self._chunks.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def readinto(self, b) -> int:
+        while not self._buffer and not self._eof:
+            chunk = self._chunks.get()
+            if chunk is _ABORT:
+                raise OSError("upload aborted")
+            if chunk:
+                self._buffer = chunk
+            else:
+                self._eof = True
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self) -> None:
+        super().close()
+        # Unblock a feeder waiting on a full queue
+        while True:
+            try:
+                self._chunks.get_nowait()
+            except queue.Empty:
+                break
+
+
+def read_records(stream: io.TextIOBase, fmt: str) -> Iterator:
+    """
+    Yield one item per record: a dict of raw values, or a ValueError for a record
+    that can't be parsed (so it still gets its own result line).
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield ValueError(f"invalid JSON: {exc.msg}")
+            continue
+        yield record if isinstance(record, dict) else ValueError("each line must be a JSON object")
+
+
+def import_chunk(entries: list, owner_id: int, db: Session) -> list:
+    """
+    Insert a chunk of validated (company row, assessment row or None) pairs and run
+    the batched pipeline for the assessments. Does not commit.
+    Returns one result dict per entry, in order.
+    """
+    companies = db.scalars(
+        insert(Company).returning(Company, sort_by_parameter_order=True),
+        [dict(company, owner_id=owner_id) for company, _ in entries],
+    ).all()
+
+    assessment_rows = [
+        dict(assessment, company_id=company.id)
+        for (_, assessment), company in zip(entries, companies)
+        if assessment is not None
+    ]
+    assessments, scores = [], {}
+    if assessment_rows:
+        assessments = db.scalars(insert(Assessment).returning(Assessment), assessment_rows).all()
+        scores = run_pipeline_batch(assessments, {c.id: c for c in companies}, db)
+
+    by_company = {a.company_id: a for a in assessments}
+    results = []
+    for company in companies:
+        result = {"status": "created", "company_id": company.id}
+        assessment: Optional[Assessment] = by_company.get(company.id)
+        if assessment is not None:
+            score = scores[assessment.id]
+            result.update(
+                assessment_id=assessment.id,
+                overall_score=score["overall_score"],
+                recommendation_level=score["recommendation_level"],
+            )
+        results.append(result)
+    return results
@@ -0,0 +1,110 @@
+"""
+Valyntra Dashboard Builder
+Assembles DashboardOut and maintains the per-company materialized snapshot
+"""
+from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+from app.core.response_cache import company_scope, invalidate_on_commit
+from app.models.models import Company, CompanyDashboard, Match, Score
+from app.schemas.schemas import DashboardOut
+
+
+def dashboard_statement(company_id: int, owner_id: Optional[int] = None):
+    """
+    (company, latest score, pipeline total) in one statement, with opportunities and
+    matches (plus their provider/opportunity) eager-loaded so serialization never
+    lazy-loads. Matches no row if the company doesn't exist or isn't owned by owner_id.
+    """
+    newer = aliased(Score)
+    latest_score_id = (
+        select(newer.id)
+        .where(newer.company_id == Company.id)
+        .order_by(newer.calculated_at.desc(), newer.id.desc())
+        .limit(1)
+        .correlate(Company)
+        .scalar_subquery()
+    )
+    total_value = (
+        select(func.coalesce(func.sum(Match.est_pilot_value), 0.0))
+        .where(Match.company_id == Company.id)
+        .correlate(Company)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(Company, Score, total_value)
+        .outerjoin(Score, Score.id == latest_score_id)
+        .where(Company.id == company_id)
+        .options(
+            selectinload(Company.opportunities),
+            selectinload(Company.matches).options(
+                joinedload(Match.provider),
+                joinedload(Match.opportunity),
+            ),
+        )
+        # Mid-transaction callers (the pipeline) may hold stale collections
+        .execution_options(populate_existing=True)
+    )
+    if owner_id is not None:
+        stmt = stmt.where(Company.owner_id == owner_id)
+    return stmt
+
+
+def load_dashboard(company_id: int, db: Session, owner_id: Optional[int] = None) -> Optional[tuple]:
+    return db.execute(dashboard_statement(company_id, owner_id)).first()
+
+
+def build_dashboard(company: Company, score: Optional[Score], total_value: float) -> DashboardOut:
+    return DashboardOut(
+        company=company,
+        score=score,
+        opportunities=sorted(company.opportunities, key=lambda o: o.rank),
+        matches=sorted(company.matches, key=lambda m: (-(m.weighted_score or 0), m.id)),
+        total_pipeline_value=total_value,
+    )
+
+
+def compact_matches(matches: list) -> tuple:
+    """
+    Split MatchOut dicts into (matches without nested objects, providers,
+    opportunities), each provider / opportunity once in first-seen order.
+    """
+    refs, providers, opportunities = [], {}, {}
+    for match in matches:
+        match = dict(match)
+        provider = match.pop("provider", None)
+        opportunity = match.pop("opportunity", None)
+        if provider is not None:
+            providers.setdefault(provider["id"], provider)
+        if opportunity is not None:
+            opportunities.setdefault(opportunity["id"], opportunity)
+        refs.append(match)
+    return refs, list(providers.values()), list(opportunities.values())
+
+
+def compact_dashboard(payload: dict) -> dict:
+    """CompactDashboardOut from a DashboardOut dict (stored snapshot or model_dump)."""
+    # The matches' opportunities are the company's, already listed in full
+    refs, providers, _ = compact_matches(payload["matches"])
+    return {**payload, "matches": refs, "providers": providers}
+
+
+def refresh_dashboard_snapshot(company_id: int, db: Session) -> CompanyDashboard:
+    """
+    Rebuild the company's stored dashboard and bump its version. Call at the end of
+    anything that changes scores, opportunities or matches; does not commit. The
+    company's cached read responses are invalidated when the caller commits.
+    """
+    invalidate_on_commit(db, company_scope(company_id))
+    row = load_dashboard(company_id, db)
+    payload = build_dashboard(*row).model_dump(mode="json")
+
+    snapshot = db.get(CompanyDashboard, company_id)
+    if snapshot is None:
+        snapshot = CompanyDashboard(company_id=company_id, version=1, payload=payload)
+        db.add(snapshot)
+    else:
+        snapshot.version += 1
+        snapshot.payload = payload
+    db.flush()
+    return snapshot
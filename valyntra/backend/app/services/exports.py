@@ -0,0 +1,93 @@
+"""
+Valyntra Exports
+Match pipeline export streamed from a server-side cursor (NDJSON / CSV, optional gzip)
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Iterator, Optional
+from sqlalchemy import select
+from app.db.session import SessionLocal
+from app.models.models import Company, Match, Opportunity, Provider
+
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+BATCH_SIZE = 1000
+
+MATCH_EXPORT_COLUMNS = (
+    Match.id.label("match_id"),
+    Company.id.label("company_id"),
+    Company.name.label("company_name"),
+    Company.industry.label("industry"),
+    Opportunity.id.label("opportunity_id"),
+    Opportunity.use_case.label("use_case"),
+    Provider.id.label("provider_id"),
+    Provider.name.label("provider_name"),
+    Match.weighted_score,
+    Match.est_pilot_value,
+    Match.stage,
+    Match.created_at,
+)
+
+
+def match_export_statement(
+    stage: Optional[str] = None,
+    industry: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """All matches with their company / opportunity / provider, in id order. `until` is exclusive."""
+    stmt = (
+        select(*MATCH_EXPORT_COLUMNS)
+        .join(Company, Company.id == Match.company_id)
+        .join(Opportunity, Opportunity.id == Match.opportunity_id)
+        .join(Provider, Provider.id == Match.provider_id)
+        .order_by(Match.id)
+    )
+    if stage is not None:
+        stmt = stmt.where(Match.stage == stage)
+    if industry is not None:
+        stmt = stmt.where(Company.industry == industry)
+    if since is not None:
+        stmt = stmt.where(Match.created_at >= since)
+    if until is not None:
+        stmt = stmt.where(Match.created_at < until)
+    return stmt
+
+
+def _encode(rows: list, fmt: str) -> bytes:
+    if fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            [v.isoformat() if isinstance(v, datetime) else v for v in row] for row in rows
+        )
+        return buffer.getvalue().encode()
+    return "".join(json.dumps(row._asdict(), default=datetime.isoformat) + "\n" for row in rows).encode()
+
+
+def iter_export(stmt, fmt: str, compress: bool = False, batch_size: int = BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Stream `stmt` as NDJSON or CSV. Rows come from a server-side cursor
+    `batch_size` at a time and are encoded (and gzipped) per batch, so memory
+    stays flat however large the export. Uses its own session: the request's
+    is closed before the response body is sent.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # gzip container
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        if fmt == "csv":
+            yield emit(_encode([list(result.keys())], fmt))
+        for rows in result.partitions():
+            chunk = emit(_encode(rows, fmt))
+            if chunk:
+                yield chunk
+        if compressor:
+            yield compressor.flush()
+    finally:
+        db.close()
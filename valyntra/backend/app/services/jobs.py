@@ -0,0 +1,204 @@
+"""
+Valyntra Pipeline Jobs
+Runs the assessment pipeline off the request thread: an in-process queue feeds a
+pool of worker threads, and the pipeline_jobs table is the durable record used to
+recover work after a restart or from another worker process.
+"""
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import select, update
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeout
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.models import Assessment, Company, PipelineJob
+from app.services.pipeline import run_pipeline
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+MAX_ATTEMPTS = 3
+# Database errors (lost connection, deadlock, pool timeout, a concurrent run's
+# conflicting write) are retried; anything else is a bug or bad data and fails
+TRANSIENT_ERRORS = (DBAPIError, PoolTimeout)
+RETRY_DELAY_SECONDS = 1.0   # times the attempt number
+
+_queue: "queue.Queue[int]" = queue.Queue()
+_workers: list = []
+_workers_lock = threading.Lock()
+_stop = threading.Event()
+_recovery_lock = threading.Lock()
+_last_recovery: Optional[float] = None
+
+
+def create_job(assessment: Assessment, db: Session, top_k: Optional[int] = None) -> PipelineJob:
+    """Record a queued job for a flushed assessment. The caller commits, then calls enqueue_job."""
+    job = PipelineJob(
+        assessment_id=assessment.id,
+        company_id=assessment.company_id,
+        status=QUEUED,
+        top_k=top_k,
+        attempts=0,
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+
+def enqueue_job(job_id: int) -> None:
+    start_workers()
+    _queue.put(job_id)
+
+
+def queue_depth() -> int:
+    return _queue.qsize()
+
+
+def start_workers() -> None:
+    """Start the worker pool once per process (idempotent)."""
+    with _workers_lock:
+        if _workers:
+            return
+        _stop.clear()
+        for i in range(settings.PIPELINE_WORKERS):
+            t = threading.Thread(target=_worker_loop, name=f"pipeline-worker-{i}", daemon=True)
+            t.start()
+            _workers.append(t)
+
+
+def stop_workers(timeout: float = 5.0) -> None:
+    _stop.set()
+    with _workers_lock:
+        for t in _workers:
+            t.join(timeout)
+        _workers.clear()
+
+
+def run_job(job_id: int) -> None:
+    """
+    Claim and run one job. Pipeline writes and the job's final status commit together.
+    Transient database errors re-queue the job until it has had MAX_ATTEMPTS runs.
+    """
+    db = SessionLocal()
+    try:
+        if not _claim(job_id, db):
+            return  # already taken by another worker / process
+        job = db.get(PipelineJob, job_id)
+        assessment = db.get(Assessment, job.assessment_id)
+        company = db.get(Company, job.company_id)
+        run_pipeline(assessment, company, db, top_k=job.top_k)
+        job.status = DONE
+        job.finished_at = func.now()
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        attempts = db.scalar(select(PipelineJob.attempts).where(PipelineJob.id == job_id))
+        if attempts is None:
+            attempts = MAX_ATTEMPTS     # job row gone
+        if isinstance(exc, TRANSIENT_ERRORS) and attempts < MAX_ATTEMPTS:
+            logger.warning("Pipeline job %s failed (attempt %s), retrying", job_id, attempts, exc_info=True)
+            db.execute(update(PipelineJob).where(PipelineJob.id == job_id).values(status=QUEUED, error=str(exc)))
+            db.commit()
+            _retry_later(job_id, RETRY_DELAY_SECONDS * max(attempts, 1))
+        else:
+            logger.exception("Pipeline job %s failed", job_id)
+            db.execute(
+                update(PipelineJob)
+                .where(PipelineJob.id == job_id)
+                .values(status=FAILED, error=str(exc), finished_at=func.now())
+            )
+            db.commit()
+    finally:
+        db.close()
+
+
+def _retry_later(job_id: int, delay: float) -> None:
+    # The job is QUEUED in the table too, so recover_jobs still finds it if this process dies first
+    timer = threading.Timer(delay, _queue.put, (job_id,))
+    timer.daemon = True
+    timer.start()
+
+
+def recover_jobs() -> int:
+    """
+    Re-queue jobs this process doesn't know about: queued jobs older than the poll
+    interval (their process may have died) and running jobs past the timeout.
+    Claiming is atomic, so re-queueing a job another process also holds is harmless.
+    """
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        stale = PipelineJob.started_at < now - timedelta(seconds=settings.PIPELINE_JOB_TIMEOUT_SECONDS)
+        db.execute(
+            update(PipelineJob)
+            .where(PipelineJob.status == RUNNING, stale, PipelineJob.attempts < MAX_ATTEMPTS)
+            .values(status=QUEUED)
+        )
+        db.execute(
+            update(PipelineJob)
+            .where(PipelineJob.status == RUNNING, stale, PipelineJob.attempts >= MAX_ATTEMPTS)
+            .values(status=FAILED, error="Timed out", finished_at=func.now())
+        )
+        db.commit()
+        job_ids = db.scalars(
+            select(PipelineJob.id)
+            .where(
+                PipelineJob.status == QUEUED,
+                PipelineJob.created_at < now - timedelta(seconds=settings.PIPELINE_POLL_SECONDS),
+            )
+            .order_by(PipelineJob.id)
+        ).all()
+    finally:
+        db.close()
+
+    for job_id in job_ids:
+        _queue.put(job_id)
+    return len(job_ids)
+
+
+def _claim(job_id: int, db: Session) -> bool:
+    result = db.execute(
+        update(PipelineJob)
+        .where(PipelineJob.id == job_id, PipelineJob.status == QUEUED)
+        .values(status=RUNNING, started_at=func.now(), attempts=PipelineJob.attempts + 1)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def _maybe_recover() -> None:
+    """Called by idle workers; at most one recovery sweep per poll interval per process."""
+    global _last_recovery
+    if not _recovery_lock.acquire(blocking=False):
+        return
+    try:
+        if _last_recovery is not None and time.monotonic() - _last_recovery < settings.PIPELINE_POLL_SECONDS:
+            return
+        _last_recovery = time.monotonic()
+        recover_jobs()
+    except Exception:
+        logger.exception("Pipeline job recovery failed")
+    finally:
+        _recovery_lock.release()
+
+
+def _worker_loop() -> None:
+    while not _stop.is_set():
+        try:
+            job_id = _queue.get(timeout=1.0)
+        except queue.Empty:
+            _maybe_recover()
+            continue
+        try:
+            run_job(job_id)
+        except Exception:
+            # e.g. the database is unreachable while recording the failure; the row
+            # stays QUEUED/RUNNING and recover_jobs picks it up later
+            logger.exception("Pipeline job %s could not be run", job_id)
+        finally:
+            _queue.task_done()
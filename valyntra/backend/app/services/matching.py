@@ -2,24 +2,16 @@
 Valyntra Provider Matching Engine
 Matches opportunities to providers using capability tags + industry + qualification score
 """
+import heapq
+from typing import Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.models.models import Company, Opportunity, Provider, Match
+from app.services.provider_index import get_provider_index, qualification_points
 import random
 
 
-def _capability_match(provider: Provider, opportunity: Opportunity) -> bool:
-    tags = provider.capability_tags or []
-    return opportunity.use_case_tag.lower() in [t.lower() for t in tags]
-
-
-def _industry_match(provider: Provider, company: Company) -> bool:
-    industries = provider.industries_served or []
-    if not industries:
-        return True  # assume multi-industry
-    normalized = [i.lower() for i in industries]
-    return (company.industry or "").lower() in normalized or "multi-industry" in normalized
-
-
 def _weighted_score(provider: Provider, cap_match: bool, ind_match: bool) -> float:
     """
     Weighted match score (0-100):
@@ -29,7 +21,7 @@ def _weighted_score(provider: Provider, cap_match: bool, ind_match: bool) -> flo
     """
     cap   = 40 if cap_match else 0
     ind   = 30 if ind_match else 0
-    qual  = ((provider.qualification_score or 0) / 30) * 30
+    qual  = qualification_points(provider.qualification_score)
     return round(cap + ind + qual, 1)
 
 
@@ -47,43 +39,85 @@ def _estimate_pilot_value(provider: Provider, opportunity: Opportunity) -> float
     return round(base * impact_mult * variance, 0)
 
 
-def run_matching(company: Company, opportunities: list, db: Session) -> list:
+def _matches_per_opportunity(company: Company, top_k: Optional[int] = None) -> int:
+    """Explicit request value, else the company segment override, else the global default."""
+    if top_k is not None:
+        return top_k
+    return settings.MATCHES_PER_SEGMENT.get(
+        company.company_size_segment or "", settings.MATCHES_PER_OPPORTUNITY
+    )
+
+
+def _scored_candidates(index, cap_ids: set, industry_ids: set, k: int):
+    """
+    Yield (score, provider, cap, ind) for providers matching on capability or industry,
+    plus the k best qualification-only providers (nobody else can reach the top K).
+    """
+    candidate_ids = cap_ids | industry_ids
+    for pid in candidate_ids:
+        provider = index.providers[pid]
+        cap = pid in cap_ids
+        ind = pid in industry_ids
+        yield _weighted_score(provider, cap, ind), provider, cap, ind
+    for provider in index.top_qualified(k, exclude=candidate_ids):
+        yield _weighted_score(provider, False, False), provider, False, False
+
+
+def _select_top_k(scored, k: int) -> list:
+    """
+    Bounded-heap top-K over (score, provider, cap, ind) tuples: O(n log k) without
+    sorting the whole candidate set. Ties break on provider id so results are stable.
+    """
+    return heapq.nsmallest(k, scored, key=lambda x: (-x[0], x[1].id))
+
+
+def _match_row(company_id: int, opportunity: Opportunity, provider, ws: float, cap: bool, ind: bool) -> dict:
+    return dict(
+        company_id=company_id,
+        opportunity_id=opportunity.id,
+        provider_id=provider.id,
+        industry_match=ind,
+        capability_match=cap,
+        weighted_score=ws,
+        est_pilot_value=_estimate_pilot_value(provider, opportunity),
+        stage="Not Started",
+    )
+
+
+def match_rows(company: Company, opportunities: list, index, k: int) -> list:
+    """Top-K Match rows (as dicts) for each of a company's opportunities."""
+    industry_ids = index.industry_candidates(company.industry)
+    rows = []
+
+    for opportunity in opportunities:
+        cap_ids = index.capability_candidates(opportunity.use_case_tag)
+        scored = _scored_candidates(index, cap_ids, industry_ids, k)
+
+        # Take top K providers per opportunity
+        top = _select_top_k(scored, k)
+
+        for ws, provider, cap, ind in top:
+            rows.append(_match_row(company.id, opportunity, provider, ws, cap, ind))
+    return rows
+
+
+def run_matching(
+    company: Company,
+    opportunities: list,
+    db: Session,
+    top_k: Optional[int] = None,
+    clear_existing: bool = True,
+) -> list:
     """Match each opportunity to best-fit providers. Returns all Match records."""
 
     # Clear existing matches for this company
-    db.query(Match).filter(Match.company_id == company.id).delete()
-    db.flush()
+    if clear_existing:
+        db.query(Match).filter(Match.company_id == company.id).delete(synchronize_session=False)
 
-    providers = db.query(Provider).filter(Provider.is_active == True).all()
-    all_matches = []
+    index = get_provider_index(db)
+    rows = match_rows(company, opportunities, index, _matches_per_opportunity(company, top_k))
 
-    for opportunity in opportunities:
-        scored = []
-        for provider in providers:
-            cap   = _capability_match(provider, opportunity)
-            ind   = _industry_match(provider, company)
-            score = _weighted_score(provider, cap, ind)
-            if score > 0:
-                scored.append((score, provider, cap, ind))
-
-        # Take top 3 providers per opportunity
-        top3 = sorted(scored, key=lambda x: x[0], reverse=True)[:3]
-
-        for ws, provider, cap, ind in top3:
-            match = Match(
-                company_id=company.id,
-                opportunity_id=opportunity.id,
-                provider_id=provider.id,
-                industry_match=ind,
-                capability_match=cap,
-                weighted_score=ws,
-                est_pilot_value=_estimate_pilot_value(provider, opportunity),
-                stage="Not Started",
-            )
-            db.add(match)
-            all_matches.append(match)
-
-    db.commit()
-    for m in all_matches:
-        db.refresh(m)
-    return all_matches
+    if not rows:
+        return []
+    # Bulk INSERT … RETURNING; the caller owns the transaction
+    return db.scalars(insert(Match).returning(Match), rows).all()
@@ -2,8 +2,12 @@
 Valyntra Opportunity Recommendation Engine
 Rule-based: maps industry + score + pain to ranked AI use cases
 """
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from app.models.models import Company, Score, Assessment, Opportunity
+from app.models.models import Company, Score, Assessment, Opportunity, Match
 
 
 # Use case library keyed by industry + tag
@@ -67,51 +71,99 @@ USE_CASE_LIBRARY = {
 EFFORT_TO_SCORE = {"Low": 3, "Medium": 2, "High": 1}
 IMPACT_TO_SCORE = {"High": 3, "Medium": 2, "Low": 1}
 ROI_TO_SCORE    = {"Quick Win": 3, "Strategic": 2, "Long-Term": 1}
+# Built-in priority points per dimension (the use_case_points table overrides them)
+PRIORITY_POINTS = {"effort": EFFORT_TO_SCORE, "impact": IMPACT_TO_SCORE, "roi": ROI_TO_SCORE}
 
 
-def _rank_use_cases(use_cases: list, readiness_score: float) -> list:
+@dataclass(frozen=True)
+class UseCase:
+    use_case: str
+    tag: str
+    impact: str
+    effort: str
+    roi: str
+
+
+def _rank_use_cases(use_cases: tuple, low_readiness: bool, points: dict = PRIORITY_POINTS) -> tuple:
     """Rank by impact/effort ratio, boosting quick wins for lower-readiness orgs."""
     def _priority(uc):
-        effort  = EFFORT_TO_SCORE[uc["effort"]]
-        impact  = IMPACT_TO_SCORE[uc["impact"]]
-        roi     = ROI_TO_SCORE[uc["roi"]]
+        effort  = points["effort"][uc.effort]
+        impact  = points["impact"][uc.impact]
+        roi     = points["roi"][uc.roi]
         # Lower-readiness companies → prefer easier wins
-        effort_weight = 2.0 if readiness_score < 50 else 1.0
+        effort_weight = 2.0 if low_readiness else 1.0
         return (impact * 1.5) + (effort * effort_weight) + roi
-    return sorted(use_cases, key=_priority, reverse=True)
+    return tuple(sorted(use_cases, key=_priority, reverse=True))
+
+
+def compile_library(library: dict, points: dict = PRIORITY_POINTS) -> MappingProxyType:
+    """
+    (industry, readiness < 50) → top-5 ranked UseCase tuple. Ranking only depends
+    on those two, so it is done once here instead of on every assessment.
+    """
+    default = tuple(UseCase(**uc) for uc in library["Default"])
+    ranked = {}
+    for industry, entries in library.items():
+        use_cases = tuple(UseCase(**uc) for uc in entries)
+        # Always add default cases if industry-specific list is short
+        if len(use_cases) < 3 and industry != "Default":
+            use_cases += default
+        for low_readiness in (True, False):
+            ranked[(industry, low_readiness)] = _rank_use_cases(use_cases, low_readiness, points)[:5]  # top 5
+    return MappingProxyType(ranked)
+
+
+# ── Compiled catalog snapshot ────────────────────────────────────────────
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int                 # use_case_catalog.version it was loaded at; 0 = built-in
+    ranked: MappingProxyType     # compile_library() output
 
 
-def generate_opportunities(company: Company, score: Score, db: Session) -> list:
-    """Generate and persist ranked opportunities for a company."""
+# Copy-on-write: reloads compile a new snapshot and swap this reference, so readers
+# never lock (see services/use_case_catalog.py)
+_snapshot = CatalogSnapshot(version=0, ranked=compile_library(USE_CASE_LIBRARY))
 
-    # Clear existing opportunities
-    db.query(Opportunity).filter(Opportunity.company_id == company.id).delete()
-    db.flush()
 
-    industry = company.industry or "Default"
-    use_cases = USE_CASE_LIBRARY.get(industry, USE_CASE_LIBRARY["Default"])
+def current_catalog() -> CatalogSnapshot:
+    return _snapshot
 
-    # Always add default cases if industry-specific list is short
-    if len(use_cases) < 3:
-        use_cases += USE_CASE_LIBRARY["Default"]
 
-    ranked = _rank_use_cases(use_cases, score.overall_score)
+def install_catalog(snapshot: CatalogSnapshot) -> None:
+    global _snapshot
+    _snapshot = snapshot
 
-    opportunities = []
-    for i, uc in enumerate(ranked[:5], start=1):  # top 5
-        opp = Opportunity(
+
+def ranked_use_cases(industry: Optional[str], readiness_score: float) -> tuple:
+    low_readiness = readiness_score < 50
+    ranked = _snapshot.ranked
+    return ranked.get((industry or "Default", low_readiness)) or ranked[("Default", low_readiness)]
+
+
+def opportunity_rows(company: Company, overall_score: float) -> list:
+    """Top-5 ranked Opportunity rows (as dicts) for a company at the given readiness score."""
+    return [
+        dict(
             company_id=company.id,
-            use_case=uc["use_case"],
-            use_case_tag=uc["tag"],
-            impact_estimate=uc["impact"],
-            implementation_effort=uc["effort"],
-            roi_classification=uc["roi"],
+            use_case=uc.use_case,
+            use_case_tag=uc.tag,
+            impact_estimate=uc.impact,
+            implementation_effort=uc.effort,
+            roi_classification=uc.roi,
             rank=i,
         )
-        db.add(opp)
-        opportunities.append(opp)
+        for i, uc in enumerate(ranked_use_cases(company.industry, overall_score), start=1)
+    ]
+
+
+def generate_opportunities(company: Company, score: Score, db: Session, top_k: Optional[int] = None) -> list:
+    """Generate and persist ranked opportunities for a company (top_k: matches each will get)."""
+
+    # Clear existing opportunities (and the matches that reference them)
+    db.query(Match).filter(Match.company_id == company.id).delete(synchronize_session=False)
+    db.query(Opportunity).filter(Opportunity.company_id == company.id).delete(synchronize_session=False)
 
-    db.commit()
-    for o in opportunities:
-        db.refresh(o)
-    return opportunities
+    rows = [dict(row, top_k=top_k) for row in opportunity_rows(company, score.overall_score)]
+    # Bulk INSERT … RETURNING (row order not guaranteed); the caller owns the transaction
+    opportunities = db.scalars(insert(Opportunity).returning(Opportunity), rows).all()
+    return sorted(opportunities, key=lambda o: o.rank)
@@ -0,0 +1,64 @@
+"""
+Valyntra Assessment Pipeline
+score → opportunities → matches → dashboard snapshot as a single unit of work
+"""
+from typing import Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.core.timing import span
+from app.models.models import Assessment, Company, Match, Opportunity, Score
+from app.services.scoring import CATEGORIES, calculate_score, score_rows
+from app.services.opportunity_engine import generate_opportunities, opportunity_rows
+from app.services.matching import _matches_per_opportunity, match_rows, run_matching
+from app.services.dashboard import refresh_dashboard_snapshot
+from app.services.provider_index import get_provider_index
+
+
+def run_pipeline(assessment: Assessment, company: Company, db: Session, top_k: Optional[int] = None) -> tuple:
+    """
+    Run the full pipeline for a flushed assessment. Does not commit: the caller
+    commits once so the whole submission is one transaction.
+    Returns (score, opportunities, matches).
+    """
+    k = _matches_per_opportunity(company, top_k)
+    with span("calculate_score"):
+        score = calculate_score(assessment, db)
+    with span("generate_opportunities"):
+        opportunities = generate_opportunities(company, score, db, top_k=k)
+    # generate_opportunities already cleared the company's matches
+    with span("run_matching"):
+        matches = run_matching(company, opportunities, db, top_k=k, clear_existing=False)
+    with span("dashboard_snapshot"):
+        refresh_dashboard_snapshot(company.id, db)
+    return score, opportunities, matches
+
+
+def run_pipeline_batch(assessments: list, companies: dict, db: Session) -> dict:
+    """
+    Pipeline for many new companies at once (bulk import): one vectorized scoring
+    pass and one INSERT per stage. Expects one assessment per company and no prior
+    opportunities or matches; dashboards are built on first read. Does not commit.
+    `companies` maps id → Company. Returns {assessment_id: score row}.
+    """
+    scores = score_rows([(a.id, a.company_id, *(getattr(a, c) for c in CATEGORIES)) for a in assessments])
+    db.execute(insert(Score), scores)
+
+    opp_rows = []
+    for score in scores:
+        company = companies[score["company_id"]]
+        k = _matches_per_opportunity(company)
+        opp_rows.extend(dict(row, top_k=k) for row in opportunity_rows(company, score["overall_score"]))
+    by_company = {}
+    for opportunity in db.scalars(insert(Opportunity).returning(Opportunity), opp_rows):
+        by_company.setdefault(opportunity.company_id, []).append(opportunity)
+
+    index = get_provider_index(db)
+    rows = []
+    for company_id, opportunities in by_company.items():
+        company = companies[company_id]
+        opportunities.sort(key=lambda o: o.rank)
+        rows.extend(match_rows(company, opportunities, index, _matches_per_opportunity(company)))
+    if rows:
+        db.execute(insert(Match), rows)
+
+    return {score["assessment_id"]: score for score in scores}
@@ -0,0 +1,152 @@
+"""
+Valyntra Provider Index
+In-memory capability / industry lookup over the active provider catalog
+
+Every provider write bumps provider_catalog.version in its transaction. A worker
+re-reads the version at most every PROVIDER_INDEX_MAX_AGE_SECONDS and rebuilds
+its index when it differs; the worker that made the write rebuilds at once.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.models import Provider, ProviderCatalog
+
+MULTI_INDUSTRY = "multi-industry"
+
+
+def qualification_points(qualification_score: Optional[int]) -> float:
+    """Qualification score (normalized 0-30 → 0-30pts)."""
+    return ((qualification_score or 0) / 30) * 30
+
+
+@dataclass(frozen=True)
+class IndexedProvider:
+    """Detached, pre-normalized view of a Provider row (safe to share across sessions)."""
+    id: int
+    name: str
+    typical_project_size: Optional[str]
+    qualification_score: Optional[int]
+    qualification_points: float
+    capability_tags: frozenset
+    industries_served: frozenset
+    serves_all_industries: bool
+
+
+class ProviderIndex:
+    """tag → provider ids, industry → provider ids, plus qualification ranking."""
+
+    def __init__(self, providers: list, version: int):
+        self.version = version
+        self.checked_at = time.monotonic()   # last time `version` was confirmed current
+        self.providers = {}
+        self.by_tag = {}
+        self.by_industry = {}
+        self.all_industries = set()
+
+        for p in providers:
+            tags = frozenset(t.lower() for t in (p.capability_tags or []))
+            industries = frozenset(i.lower() for i in (p.industries_served or []))
+            entry = IndexedProvider(
+                id=p.id,
+                name=p.name,
+                typical_project_size=p.typical_project_size,
+                qualification_score=p.qualification_score,
+                qualification_points=qualification_points(p.qualification_score),
+                capability_tags=tags,
+                industries_served=industries,
+                # No industries listed → assume multi-industry
+                serves_all_industries=not industries or MULTI_INDUSTRY in industries,
+            )
+            self.providers[p.id] = entry
+            for tag in tags:
+                self.by_tag.setdefault(tag, set()).add(p.id)
+            if entry.serves_all_industries:
+                self.all_industries.add(p.id)
+            for industry in industries:
+                self.by_industry.setdefault(industry, set()).add(p.id)
+
+        # Providers that score on qualification alone, best first
+        self.by_qualification = sorted(
+            (e for e in self.providers.values() if e.qualification_points > 0),
+            key=lambda e: (-e.qualification_points, e.id),
+        )
+
+    def __len__(self) -> int:
+        return len(self.providers)
+
+    def capability_candidates(self, use_case_tag: Optional[str]) -> set:
+        return self.by_tag.get((use_case_tag or "").lower(), set())
+
+    def industry_candidates(self, industry: Optional[str]) -> set:
+        return self.all_industries | self.by_industry.get((industry or "").lower(), set())
+
+    def top_qualified(self, limit: int, exclude: set) -> list:
+        """Highest-qualification providers outside `exclude` (score from qualification only)."""
+        picked = []
+        for entry in self.by_qualification:
+            if len(picked) >= limit:
+                break
+            if entry.id not in exclude:
+                picked.append(entry)
+        return picked
+
+
+_index: Optional[ProviderIndex] = None
+_lock = threading.Lock()
+CATALOG_ID = 1
+
+
+def provider_catalog_version(db: Session) -> int:
+    return db.scalar(select(ProviderCatalog.version).where(ProviderCatalog.id == CATALOG_ID)) or 0
+
+
+def bump_provider_catalog_version(db: Session) -> None:
+    """Call in every transaction that writes providers (does not commit)."""
+    bumped = db.execute(
+        update(ProviderCatalog)
+        .where(ProviderCatalog.id == CATALOG_ID)
+        .values(version=ProviderCatalog.version + 1)
+    )
+    if bumped.rowcount == 0:
+        raise RuntimeError("provider_catalog row missing; run 'python -m app.db.migrate'")
+
+
+def seed_provider_catalog(db: Session) -> None:
+    """Add the version row, which migration 0005 seeds, for databases built by create_all (does not commit)."""
+    if db.get(ProviderCatalog, CATALOG_ID) is None:
+        db.add(ProviderCatalog(id=CATALOG_ID, version=0))
+        db.flush()
+
+
+def get_provider_index(db: Session) -> ProviderIndex:
+    """
+    Return the process-wide provider index. Within PROVIDER_INDEX_MAX_AGE_SECONDS of
+    its last check it is returned as is; after that the catalog version is read and
+    the index rebuilt if it changed.
+    """
+    global _index
+    index = _index
+    if index is not None and time.monotonic() - index.checked_at < settings.PROVIDER_INDEX_MAX_AGE_SECONDS:
+        return index
+
+    version = provider_catalog_version(db)
+    if index is not None and index.version == version:
+        index.checked_at = time.monotonic()
+        return index
+
+    with _lock:
+        if _index is None or _index.version != version:
+            providers = db.query(Provider).filter(Provider.is_active == True).all()
+            _index = ProviderIndex(providers, version)
+        return _index
+
+
+def invalidate_provider_index() -> None:
+    """Drop this worker's index; call after committing a provider write (others follow the version)."""
+    global _index
+    with _lock:
+        _index = None
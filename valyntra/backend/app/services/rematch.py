@@ -0,0 +1,309 @@
+"""
+Valyntra Incremental Re-matching
+Applies a provider catalog change to existing matches without re-running the pipeline
+
+Provider writes queue a rematch_jobs row in their own transaction. The re-match
+worker (`python -m app.services.rematch --worker`, a process of its own) claims
+and runs them, so the process pool never competes with request handling and a
+queued change survives restarts.
+"""
+import argparse
+import logging
+import multiprocessing
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from typing import Iterator, Optional
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.core.config import settings
+from app.core.response_cache import company_scope, response_cache
+from app.db.session import SessionLocal
+from app.models.models import Company, Match, Opportunity, RematchJob
+from app.services.dashboard import refresh_dashboard_snapshot
+from app.services.jobs import DONE, FAILED, MAX_ATTEMPTS, QUEUED, RUNNING, TRANSIENT_ERRORS
+from app.services.matching import (
+    _match_row, _matches_per_opportunity, _scored_candidates, _select_top_k, _weighted_score,
+)
+from app.services.provider_index import get_provider_index, invalidate_provider_index
+
+logger = logging.getLogger(__name__)
+
+ADDED, REMOVED = "added", "removed"
+
+
+def affected_company_ids(provider_id: int, change: str, db: Session, chunk_size: int) -> Iterator[list]:
+    """
+    Keyset chunks of companies the change can touch: any company with opportunities
+    for an added provider, only the companies matched to it for a removed one.
+    """
+    column = Match.company_id if change == REMOVED else Opportunity.company_id
+    stmt = select(column).distinct().order_by(column).limit(chunk_size)
+    if change == REMOVED:
+        stmt = stmt.where(Match.provider_id == provider_id)
+    last_id = 0
+    while True:
+        ids = db.scalars(stmt.where(column > last_id)).all()
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def _rank_key(match) -> tuple:
+    # Same ordering as _select_top_k: best score first, ties on provider id
+    return (-match.weighted_score, match.provider_id)
+
+
+def rematch_chunk(company_ids: list, provider_id: int, change: str, db: Session) -> set:
+    """
+    Update the matches of one chunk of companies for the changed provider. Only
+    opportunities whose top K actually changes are written: an added provider
+    displaces the current worst match if it ranks above it; a removed provider's
+    matches are replaced by the best provider not already matched. Existing rows
+    (and their stage) are otherwise left alone. Returns the changed company ids.
+    """
+    index = get_provider_index(db)
+    added = index.providers.get(provider_id) if change == ADDED else None
+    if change == ADDED and added is None:
+        return set()  # deactivated again before we got here
+
+    companies = {c.id: c for c in db.scalars(select(Company).where(Company.id.in_(company_ids)))}
+    opportunities = db.scalars(select(Opportunity).where(Opportunity.company_id.in_(company_ids))).all()
+    current = defaultdict(list)
+    for m in db.execute(
+        select(Match.id, Match.opportunity_id, Match.provider_id, Match.weighted_score)
+        .where(Match.company_id.in_(company_ids))
+    ):
+        current[m.opportunity_id].append(m)
+
+    delete_ids, rows, changed = [], [], set()
+    for opportunity in opportunities:
+        company = companies[opportunity.company_id]
+        matched = sorted(current[opportunity.id], key=_rank_key)
+        # Keep the K the opportunity was matched with (an explicit top_k may differ from
+        # the default); rows from before it was stored fall back to the old estimate
+        k = opportunity.top_k or max(len(matched), _matches_per_opportunity(company))
+
+        if change == ADDED:
+            if any(m.provider_id == provider_id for m in matched):
+                continue
+            cap = provider_id in index.capability_candidates(opportunity.use_case_tag)
+            ind = provider_id in index.industry_candidates(company.industry)
+            if not (cap or ind or added.qualification_points > 0):
+                continue  # run_matching wouldn't consider it either
+            ws = _weighted_score(added, cap, ind)
+            if len(matched) >= k:
+                if (-ws, provider_id) >= _rank_key(matched[k - 1]):
+                    continue
+                delete_ids.extend(m.id for m in matched[k - 1:])
+            rows.append(_match_row(company.id, opportunity, added, ws, cap, ind))
+        else:
+            removed = [m for m in matched if m.provider_id == provider_id]
+            if not removed:
+                continue
+            delete_ids.extend(m.id for m in removed)
+            keep = {m.provider_id for m in matched} - {provider_id}
+            need = k - len(keep)
+            scored = _scored_candidates(
+                index,
+                index.capability_candidates(opportunity.use_case_tag),
+                index.industry_candidates(company.industry),
+                need + len(keep),
+            )
+            for ws, provider, cap, ind in _select_top_k((s for s in scored if s[1].id not in keep), need):
+                rows.append(_match_row(company.id, opportunity, provider, ws, cap, ind))
+        changed.add(company.id)
+
+    if delete_ids:
+        db.execute(delete(Match).where(Match.id.in_(delete_ids)))
+    if rows:
+        db.execute(insert(Match), rows)
+    return changed
+
+
+def rematch_companies(company_ids: list, provider_id: int, change: str) -> list:
+    """Pool entry point: re-match one chunk in its own transaction. Returns the changed company ids."""
+    for attempt in (1, 2):
+        db = SessionLocal()
+        try:
+            changed = rematch_chunk(company_ids, provider_id, change, db)
+            for company_id in changed:
+                refresh_dashboard_snapshot(company_id, db)
+            db.commit()
+            return sorted(changed)
+        except DBAPIError:
+            # Most likely a concurrent pipeline run replaced a company's opportunities;
+            # re-reading the chunk picks up its new state. A second failure fails the
+            # job, which is retried as a whole (chunks already applied are skipped).
+            db.rollback()
+            if attempt == 2:
+                raise
+        finally:
+            db.close()
+
+
+def rematch_provider(
+    provider_id: int,
+    change: str,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """
+    Bring existing matches up to date after a provider was added or deactivated,
+    spreading company chunks over a process pool (REMATCH_WORKERS; 0 = inline).
+    Returns the number of companies whose matches changed.
+    """
+    workers = settings.REMATCH_WORKERS if workers is None else workers
+    chunk_size = chunk_size or settings.REMATCH_CHUNK_SIZE
+    db = SessionLocal()
+    try:
+        chunks = list(affected_company_ids(provider_id, change, db, chunk_size))
+    finally:
+        db.close()
+
+    if workers <= 0 or len(chunks) <= 1:
+        changed = sum(len(rematch_companies(ids, provider_id, change)) for ids in chunks)
+    else:
+        changed = 0
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            for company_ids in pool.map(rematch_companies, chunks, repeat(provider_id), repeat(change)):
+                # The children's commits bumped their own copy of a memory cache; bump ours
+                for company_id in company_ids:
+                    response_cache.invalidate(company_scope(company_id))
+                changed += len(company_ids)
+    logger.info("Provider %s %s: re-matched %s companies", provider_id, change, changed)
+    return changed
+
+
+# ── Queue ────────────────────────────────────────────────────────────────
+def queue_rematch(provider_id: int, change: str, db: Session) -> None:
+    """Record a re-match in the caller's transaction: it is queued exactly when the provider write commits."""
+    db.add(RematchJob(provider_id=provider_id, change=change, status=QUEUED, attempts=0))
+
+
+def _recover_stale(db: Session) -> None:
+    """Re-queue jobs whose worker died mid-run (running past REMATCH_JOB_TIMEOUT_SECONDS)."""
+    stale = RematchJob.started_at < datetime.now(timezone.utc) - timedelta(seconds=settings.REMATCH_JOB_TIMEOUT_SECONDS)
+    db.execute(
+        update(RematchJob)
+        .where(RematchJob.status == RUNNING, stale, RematchJob.attempts < MAX_ATTEMPTS)
+        .values(status=QUEUED)
+    )
+    db.execute(
+        update(RematchJob)
+        .where(RematchJob.status == RUNNING, stale, RematchJob.attempts >= MAX_ATTEMPTS)
+        .values(status=FAILED, error="Timed out", finished_at=func.now())
+    )
+    db.commit()
+
+
+def _claim_next(db: Session, skip: set) -> Optional[RematchJob]:
+    """Oldest queued job outside `skip`, claimed atomically (another worker may race for it)."""
+    while True:
+        stmt = select(RematchJob.id).where(RematchJob.status == QUEUED).order_by(RematchJob.id).limit(1)
+        if skip:
+            stmt = stmt.where(RematchJob.id.notin_(skip))
+        job_id = db.scalar(stmt)
+        if job_id is None:
+            return None
+        claimed = db.execute(
+            update(RematchJob)
+            .where(RematchJob.id == job_id, RematchJob.status == QUEUED)
+            .values(status=RUNNING, started_at=func.now(), attempts=RematchJob.attempts + 1)
+        )
+        db.commit()
+        if claimed.rowcount == 1:
+            return db.get(RematchJob, job_id)
+
+
+def run_rematch_job(job: RematchJob, db: Session, workers: Optional[int] = None,
+                    chunk_size: Optional[int] = None) -> bool:
+    """
+    Run one claimed job and record its outcome. Transient database errors re-queue it
+    until it has had MAX_ATTEMPTS runs. Returns False if it failed.
+    """
+    # This process's index may predate the provider write by PROVIDER_INDEX_MAX_AGE_SECONDS
+    invalidate_provider_index()
+    try:
+        changed = rematch_provider(job.provider_id, job.change, workers, chunk_size)
+    except Exception as exc:
+        retry = isinstance(exc, TRANSIENT_ERRORS) and job.attempts < MAX_ATTEMPTS
+        logger.exception("Re-match job %s (provider %s %s) failed", job.id, job.provider_id, job.change)
+        db.rollback()
+        db.execute(
+            update(RematchJob)
+            .where(RematchJob.id == job.id)
+            .values(status=QUEUED if retry else FAILED, error=str(exc), finished_at=None if retry else func.now())
+        )
+        db.commit()
+        return False
+    db.execute(
+        update(RematchJob)
+        .where(RematchJob.id == job.id)
+        .values(status=DONE, changed_companies=changed, error=None, finished_at=func.now())
+    )
+    db.commit()
+    return True
+
+
+def run_queued_rematches(workers: Optional[int] = None, chunk_size: Optional[int] = None) -> int:
+    """
+    Claim and run queued jobs oldest first until none are left (a job that fails is
+    not retried in the same pass). Returns the number of jobs run.
+    """
+    ran, failed = 0, set()
+    db = SessionLocal()
+    try:
+        _recover_stale(db)
+        while (job := _claim_next(db, failed)) is not None:
+            job_id = job.id
+            if not run_rematch_job(job, db, workers, chunk_size):
+                failed.add(job_id)
+            ran += 1
+    finally:
+        db.close()
+    return ran
+
+
+def work(workers: Optional[int] = None, chunk_size: Optional[int] = None) -> None:
+    """Re-match worker: run queued jobs, then poll every REMATCH_POLL_SECONDS."""
+    while True:
+        try:
+            run_queued_rematches(workers, chunk_size)
+        except Exception:
+            logger.exception("Re-match queue sweep failed")
+        time.sleep(settings.REMATCH_POLL_SECONDS)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Apply provider catalog changes to existing matches: run the queued "
+                    "re-match jobs (once, or as a --worker), or one given change directly."
+    )
+    parser.add_argument("provider_id", type=int, nargs="?", help="Re-match this provider now, bypassing the queue")
+    parser.add_argument("--removed", action="store_true", help="The provider was deactivated (default: added)")
+    parser.add_argument("--worker", action="store_true", help="Keep running queued jobs (REMATCH_POLL_SECONDS)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.provider_id is not None:
+        changed = rematch_provider(args.provider_id, REMOVED if args.removed else ADDED, args.workers, args.chunk_size)
+        print(f"Re-matched {changed} companies")
+    elif args.worker:
+        work(args.workers, args.chunk_size)
+    else:
+        print(f"Ran {run_queued_rematches(args.workers, args.chunk_size)} queued re-match jobs")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,16 @@
 Valyntra AI Readiness Scoring Engine
 Weights from Lead_Prioritization_Model in CRM
 """
+import argparse
+from typing import TYPE_CHECKING, Optional
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
-from app.models.models import Assessment, Score, Company
+from app.core.response_cache import company_scope, invalidate_on_commit
+from app.models.models import Assessment, CompanyDashboard, Score, Company
+from app.services.dashboard import refresh_dashboard_snapshot
 
+if TYPE_CHECKING:
+    import numpy as np
 
 # Category weights (sum to 1.0)
 WEIGHTS = {
@@ -43,22 +50,158 @@ def calculate_score(assessment: Assessment, db: Session) -> Score:
     )
 
     # Remove existing score if re-assessing
-    existing = db.query(Score).filter(Score.assessment_id == assessment.id).first()
-    if existing:
-        db.delete(existing)
-        db.flush()
-
-    score = Score(
-        assessment_id=assessment.id,
-        company_id=assessment.company_id,
-        overall_score=round(overall, 1),
-        data_maturity_score=round(dm, 1),
-        process_automation_score=round(pa, 1),
-        leadership_alignment_score=round(la, 1),
-        technical_infrastructure_score=round(ti, 1),
-        recommendation_level=_recommendation_level(overall),
+    db.query(Score).filter(Score.assessment_id == assessment.id).delete(synchronize_session=False)
+
+    # INSERT … RETURNING; the caller owns the transaction
+    return db.scalar(
+        insert(Score).returning(Score).values(
+            assessment_id=assessment.id,
+            company_id=assessment.company_id,
+            overall_score=round(overall, 1),
+            data_maturity_score=round(dm, 1),
+            process_automation_score=round(pa, 1),
+            leadership_alignment_score=round(la, 1),
+            technical_infrastructure_score=round(ti, 1),
+            recommendation_level=_recommendation_level(overall),
+        )
     )
-    db.add(score)
-    db.commit()
-    db.refresh(score)
-    return score
+
+
+# ── Batch re-scoring ─────────────────────────────────────────────────────
+CATEGORIES = list(WEIGHTS)
+DEFAULT_BATCH_SIZE = 5000
+
+
+def _score_matrix(inputs: "np.ndarray") -> tuple:
+    """
+    Vectorized calculate_score for an (n, 4) array of 1-5 inputs in CATEGORIES order.
+    Returns (normalized category scores, overall, recommendation levels).
+    """
+    import numpy as np  # batch-only; kept off the API's import path
+
+    normalized = (inputs - 1) / 4 * 100
+    # Summed left-to-right like calculate_score so floats round identically
+    overall = np.zeros(len(inputs))
+    for i, category in enumerate(CATEGORIES):
+        overall = overall + normalized[:, i] * WEIGHTS[category]
+    levels = np.select([overall >= 70, overall >= 45], ["Ready", "Developing"], default="Early Stage")
+    return normalized, overall, levels
+
+
+def score_rows(assessments: list) -> list:
+    """
+    Score rows (as dicts) for (assessment_id, company_id, *CATEGORIES inputs) tuples,
+    computed in one vectorized pass.
+    """
+    import numpy as np
+
+    data = np.array(assessments, dtype=float)
+    normalized, overall, levels = _score_matrix(data[:, 2:])
+    return [
+        {
+            "assessment_id": int(row[0]),
+            "company_id": int(row[1]),
+            "overall_score": round(float(overall[i]), 1),
+            **{f"{c}_score": round(float(normalized[i, j]), 1) for j, c in enumerate(CATEGORIES)},
+            "recommendation_level": str(levels[i]),
+        }
+        for i, row in enumerate(data)
+    ]
+
+
+def _upsert_scores(rows: list, db: Session) -> None:
+    """
+    Insert or replace Score rows keyed by assessment_id. A replaced row keeps its
+    calculated_at: the latest score per company is picked by it, so re-scoring an
+    old assessment must not make it current.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(Score).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Score.assessment_id],
+            set_={col: stmt.excluded[col] for col in rows[0] if col != "assessment_id"},
+        )
+        db.execute(stmt)
+    else:
+        ids = [r["assessment_id"] for r in rows]
+        kept = dict(db.query(Score.assessment_id, Score.calculated_at).filter(Score.assessment_id.in_(ids)))
+        db.query(Score).filter(Score.assessment_id.in_(ids)).delete(synchronize_session=False)
+        new = [r for r in rows if r["assessment_id"] not in kept]
+        replaced = [{**r, "calculated_at": kept[r["assessment_id"]]} for r in rows if r["assessment_id"] in kept]
+        for group in (new, replaced):
+            if group:
+                db.execute(insert(Score), group)
+
+
+def _refresh_dashboards(company_ids: set, db: Session) -> None:
+    """Rebuild stored snapshots and drop cached responses of re-scored companies (on commit)."""
+    with_snapshot = set(db.scalars(
+        select(CompanyDashboard.company_id).where(CompanyDashboard.company_id.in_(company_ids))
+    ))
+    for company_id in sorted(company_ids):
+        if company_id in with_snapshot:
+            refresh_dashboard_snapshot(company_id, db)
+        else:
+            # No snapshot: the dashboard is built live, only cached responses are stale
+            invalidate_on_commit(db, company_scope(company_id))
+
+
+def calculate_scores_batch(
+    db: Session,
+    assessment_ids: Optional[list] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Re-score assessments in chunks (all of them by default) with the current WEIGHTS.
+    Each chunk is loaded as a column array, scored in vectorized form and bulk-upserted
+    in its own transaction, together with the affected companies' dashboard snapshots.
+    Returns the number of Score rows written.
+    """
+    columns = [getattr(Assessment, c) for c in CATEGORIES]
+    total = 0
+    last_id = 0
+    while True:
+        # Keyset chunks so each commit doesn't invalidate an open cursor
+        q = (
+            db.query(Assessment.id, Assessment.company_id, *columns)
+            .filter(Assessment.id > last_id, *[c.isnot(None) for c in columns])
+        )
+        if assessment_ids is not None:
+            q = q.filter(Assessment.id.in_(assessment_ids))
+        chunk = q.order_by(Assessment.id).limit(batch_size).all()
+        if not chunk:
+            break
+
+        rows = score_rows(chunk)
+        _upsert_scores(rows, db)
+        _refresh_dashboards({r["company_id"] for r in rows}, db)
+        db.commit()
+
+        total += len(rows)
+        last_id = chunk[-1][0]
+    return total
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-score assessments with the current WEIGHTS.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--assessment-id", type=int, action="append", dest="assessment_ids",
+                        help="Limit to these assessments (repeatable); default is all")
+    args = parser.parse_args(argv)
+
+    from app.db.session import SessionLocal
+    db = SessionLocal()
+    try:
+        written = calculate_scores_batch(db, args.assessment_ids, args.batch_size)
+    finally:
+        db.close()
+    print(f"Re-scored {written} assessments")
+
+
+if __name__ == "__main__":
+    main()
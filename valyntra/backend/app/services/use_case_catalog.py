@@ -0,0 +1,159 @@
+"""
+Valyntra Use-Case Catalog
+Loads the admin-edited use_cases / use_case_points tables into the compiled
+snapshot that opportunity generation reads (opportunity_engine.current_catalog()).
+
+Opportunity generation never queries these tables. Every edit bumps
+use_case_catalog.version, the worker that made it reloads right after commit,
+and a watcher thread in every worker polls the version every
+USE_CASE_CATALOG_POLL_SECONDS, reloading when it differs. Empty tables mean
+the built-in library in opportunity_engine.py.
+"""
+import logging
+import threading
+from typing import Optional
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.models import UseCaseCatalog, UseCaseEntry, UseCasePoints
+from app.services.opportunity_engine import (
+    PRIORITY_POINTS, USE_CASE_LIBRARY, CatalogSnapshot, compile_library, current_catalog, install_catalog,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDUSTRY = "Default"
+CATALOG_ID = 1
+FIELDS = ("use_case", "tag", "impact", "effort", "roi")
+
+_reload_lock = threading.Lock()
+_watcher: Optional[threading.Thread] = None
+_watcher_lock = threading.Lock()
+_stop = threading.Event()
+
+
+# ── Loading ──────────────────────────────────────────────────────────────
+def catalog_version(db: Session) -> int:
+    return db.scalar(select(UseCaseCatalog.version).where(UseCaseCatalog.id == CATALOG_ID)) or 0
+
+
+def load_points(db: Session) -> dict:
+    """Built-in priority points overridden by the use_case_points rows."""
+    points = {dimension: dict(levels) for dimension, levels in PRIORITY_POINTS.items()}
+    for row in db.scalars(select(UseCasePoints)):
+        points.setdefault(row.dimension, {})[row.level] = row.points
+    return points
+
+
+def load_library(db: Session) -> dict:
+    """industry → use-case dicts in id order; the built-in library if the table is empty."""
+    library = {}
+    for entry in db.scalars(select(UseCaseEntry).order_by(UseCaseEntry.id)):
+        library.setdefault(entry.industry, []).append({f: getattr(entry, f) for f in FIELDS})
+    if not library:
+        return USE_CASE_LIBRARY
+    # Unknown industries fall back to Default, so it must always exist
+    library.setdefault(DEFAULT_INDUSTRY, USE_CASE_LIBRARY[DEFAULT_INDUSTRY])
+    return library
+
+
+def reload_catalog(db: Optional[Session] = None) -> CatalogSnapshot:
+    """Compile the catalog as currently stored and swap it in for this worker."""
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        with _reload_lock:
+            snapshot = CatalogSnapshot(
+                version=catalog_version(db),
+                ranked=compile_library(load_library(db), load_points(db)),
+            )
+            install_catalog(snapshot)
+        return snapshot
+    finally:
+        if own_session:
+            db.close()
+
+
+def refresh_if_changed() -> bool:
+    """One cheap version read; reloads only when another worker changed the catalog."""
+    with SessionLocal() as db:
+        if catalog_version(db) == current_catalog().version:
+            return False
+        reload_catalog(db)
+        return True
+
+
+# ── Editing ──────────────────────────────────────────────────────────────
+def bump_catalog_version(db: Session) -> None:
+    """
+    Call first in the transaction that edits the catalog (does not commit). The
+    UPDATE holds the catalog row's lock until commit, so concurrent edits run
+    one after the other.
+    """
+    bumped = db.execute(
+        update(UseCaseCatalog)
+        .where(UseCaseCatalog.id == CATALOG_ID)
+        .values(version=UseCaseCatalog.version + 1)
+    )
+    if bumped.rowcount == 0:
+        raise RuntimeError("use_case_catalog row missing; run 'python -m app.db.migrate'")
+
+
+def seed_builtin_catalog(db: Session) -> bool:
+    """
+    Copy the built-in library and points into empty tables (does not commit or
+    bump the version). Also adds the catalog row, which migration 0003 seeds,
+    for databases built by create_all.
+    """
+    if db.get(UseCaseCatalog, CATALOG_ID) is None:
+        db.add(UseCaseCatalog(id=CATALOG_ID, version=0))
+        db.flush()
+    if db.scalar(select(func.count()).select_from(UseCaseEntry)):
+        return False
+    db.execute(insert(UseCaseEntry), [
+        {"industry": industry, **uc} for industry, entries in USE_CASE_LIBRARY.items() for uc in entries
+    ])
+    if not db.scalar(select(func.count()).select_from(UseCasePoints)):
+        db.execute(insert(UseCasePoints), [
+            {"dimension": dimension, "level": level, "points": points}
+            for dimension, levels in PRIORITY_POINTS.items() for level, points in levels.items()
+        ])
+    return True
+
+
+# ── Watcher ──────────────────────────────────────────────────────────────
+def _watch_loop() -> None:
+    while not _stop.is_set():
+        try:
+            refresh_if_changed()
+        except Exception:
+            logger.exception("Use-case catalog reload failed")
+        _stop.wait(settings.USE_CASE_CATALOG_POLL_SECONDS)
+
+
+def start_catalog_watcher() -> None:
+    """Start this worker's version poller (idempotent). Its first check runs immediately."""
+    global _watcher
+    if settings.USE_CASE_CATALOG_POLL_SECONDS <= 0:
+        # No watcher: load the stored catalog once; edits then reach only the worker making them
+        try:
+            refresh_if_changed()
+        except Exception:
+            logger.exception("Use-case catalog load failed")
+        return
+    with _watcher_lock:
+        if _watcher is not None:
+            return
+        _stop.clear()
+        _watcher = threading.Thread(target=_watch_loop, name="use-case-catalog-watcher", daemon=True)
+        _watcher.start()
+
+
+def stop_catalog_watcher(timeout: float = 5.0) -> None:
+    global _watcher
+    _stop.set()
+    with _watcher_lock:
+        if _watcher is not None:
+            _watcher.join(timeout)
+            _watcher = None
@@ -0,0 +1,205 @@
+"""
+Query plans and timings for the per-company hot paths, before and after the
+indexes added in alembic revision 0002.
+
+Run from backend/:
+    python -m benchmarks.bench_indexes                       # SQLite file, 1M matches
+    python -m benchmarks.bench_indexes --matches 100000
+    python -m benchmarks.bench_indexes --database-url postgresql://user:pw@localhost/valyntra_bench
+
+The target database is dropped and re-seeded; never point this at real data.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+DEFAULT_URL = "sqlite:////tmp/valyntra_bench_indexes.db"
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_URL))
+    parser.add_argument("--matches", type=int, default=1_000_000)
+    parser.add_argument("--providers", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50, help="timed runs per query")
+    parser.add_argument("--json", dest="json_path", help="also write the report here")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+args = _parse_args() if __name__ == "__main__" else None
+if args is not None:
+    # Settings are read at import time
+    os.environ["DATABASE_URL"] = args.database_url
+
+from sqlalchemy import create_engine, func, insert, select, text  # noqa: E402
+from app.db.session import Base  # noqa: E402
+from app.models.models import User, Company, Assessment, Score, Opportunity, Provider, Match  # noqa: E402
+
+MATCHES_PER_COMPANY = 15     # 5 opportunities × 3 providers
+BATCH = 10_000
+
+
+def hot_path_indexes() -> list:
+    """Indexes declared in __table_args__ (i.e. not Column(index=True) ones)."""
+    found = []
+    for table in Base.metadata.sorted_tables:
+        for idx in table.indexes:
+            cols = list(idx.columns)
+            if not (len(cols) == 1 and cols[0].index):
+                found.append(idx)
+    return sorted(found, key=lambda i: i.name)
+
+
+def _batched(conn, model, rows):
+    for i in range(0, len(rows), BATCH):
+        conn.execute(insert(model), rows[i:i + BATCH])
+
+
+def seed(engine, n_matches: int, n_providers: int, rng: random.Random) -> dict:
+    n_companies = max(1, n_matches // MATCHES_PER_COMPANY)
+    n_users = max(1, n_companies // 50)
+    tags = ["ml", "automation", "optimization", "analytics"]
+    with engine.begin() as conn:
+        _batched(conn, User, [
+            {"id": i, "email": f"user{i}@bench.local", "hashed_password": "x"} for i in range(1, n_users + 1)
+        ])
+        _batched(conn, Provider, [
+            {"id": i, "name": f"Provider {i}", "capability_tags": rng.sample(tags, 2),
+             "industries_served": [], "qualification_score": rng.randint(1, 30), "is_active": True}
+            for i in range(1, n_providers + 1)
+        ])
+        _batched(conn, Company, [
+            {"id": i, "owner_id": rng.randint(1, n_users), "name": f"Company {i}", "industry": "Healthcare"}
+            for i in range(1, n_companies + 1)
+        ])
+        _batched(conn, Assessment, [
+            {"id": i, "company_id": i, "data_maturity": 3, "process_automation": 3,
+             "leadership_alignment": 3, "technical_infrastructure": 3}
+            for i in range(1, n_companies + 1)
+        ])
+        _batched(conn, Score, [
+            {"id": i, "assessment_id": i, "company_id": i, "overall_score": 50.0,
+             "data_maturity_score": 50.0, "process_automation_score": 50.0,
+             "leadership_alignment_score": 50.0, "technical_infrastructure_score": 50.0,
+             "recommendation_level": "Developing"}
+            for i in range(1, n_companies + 1)
+        ])
+        opp_id = match_id = 0
+        opps, matches = [], []
+        for company_id in range(1, n_companies + 1):
+            for rank in range(1, 6):
+                opp_id += 1
+                opps.append({"id": opp_id, "company_id": company_id, "use_case": "Bench", "use_case_tag": tags[rank % 4],
+                             "impact_estimate": "High", "implementation_effort": "Low", "roi_classification": "Quick Win",
+                             "rank": rank})
+                for _ in range(3):
+                    match_id += 1
+                    matches.append({"id": match_id, "company_id": company_id, "opportunity_id": opp_id,
+                                    "provider_id": rng.randint(1, n_providers), "weighted_score": rng.uniform(30, 100),
+                                    "est_pilot_value": rng.uniform(35_000, 400_000), "stage": "Not Started"})
+            if len(matches) >= BATCH * 5:
+                _batched(conn, Opportunity, opps)
+                _batched(conn, Match, matches)
+                opps, matches = [], []
+        _batched(conn, Opportunity, opps)
+        _batched(conn, Match, matches)
+    return {"users": n_users, "companies": n_companies, "opportunities": opp_id,
+            "matches": match_id, "providers": n_providers}
+
+
+def queries(company_id: int, owner_id: int, provider_id: int) -> dict:
+    return {
+        "list_companies": select(Company).where(Company.owner_id == owner_id),
+        "get_assessments": select(Assessment).where(Assessment.company_id == company_id),
+        "latest_score": (
+            select(Score).where(Score.company_id == company_id)
+            .order_by(Score.calculated_at.desc(), Score.id.desc()).limit(1)
+        ),
+        "get_opportunities": select(Opportunity).where(Opportunity.company_id == company_id).order_by(Opportunity.rank),
+        "get_matches": select(Match).where(Match.company_id == company_id).order_by(Match.weighted_score.desc()),
+        "pipeline_value": select(func.sum(Match.est_pilot_value)).where(Match.company_id == company_id),
+        "matches_for_provider": select(func.count()).select_from(Match).where(Match.provider_id == provider_id),
+    }
+
+
+def explain(conn, stmt) -> list:
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "sqlite":
+        return [row[3] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql))]
+    return [row[0] for row in conn.execute(text("EXPLAIN " + sql))]
+
+
+def measure(engine, sample: list, repeat: int) -> dict:
+    results = {}
+    with engine.connect() as conn:
+        names = queries(*sample[0]).keys()
+        for name in names:
+            timings = []
+            for i in range(repeat):
+                stmt = queries(*sample[i % len(sample)])[name]
+                start = time.perf_counter()
+                conn.execute(stmt).fetchall()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = {
+                "plan": explain(conn, queries(*sample[0])[name]),
+                "median_ms": round(statistics.median(timings), 3),
+                "max_ms": round(max(timings), 3),
+            }
+    return results
+
+
+def main(args) -> dict:
+    rng = random.Random(args.seed)
+    engine = create_engine(args.database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    indexes = hot_path_indexes()
+    with engine.begin() as conn:
+        for idx in indexes:
+            idx.drop(conn)
+
+    start = time.perf_counter()
+    counts = seed(engine, args.matches, args.providers, rng)
+    print(f"Seeded {counts} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    with engine.connect() as conn:
+        owners = dict(conn.execute(select(Company.id, Company.owner_id)).all())
+    company_ids = rng.sample(sorted(owners), min(len(owners), args.repeat))
+    sample = [(cid, owners[cid], rng.randint(1, args.providers)) for cid in company_ids]
+
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    before = measure(engine, sample, args.repeat)
+
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        for idx in indexes:
+            idx.create(conn)
+        conn.execute(text("ANALYZE"))
+    build_s = time.perf_counter() - start
+    after = measure(engine, sample, args.repeat)
+
+    report = {
+        "dialect": engine.dialect.name,
+        "dataset": counts,
+        "indexes": [idx.name for idx in indexes],
+        "index_build_seconds": round(build_s, 2),
+        "queries": {name: {"before": before[name], "after": after[name]} for name in before},
+    }
+    for name, r in report["queries"].items():
+        print(f"\n## {name}: {r['before']['median_ms']} ms → {r['after']['median_ms']} ms (median)")
+        print("  before: " + " | ".join(r["before"]["plan"]))
+        print("  after:  " + " | ".join(r["after"]["plan"]))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main(args)
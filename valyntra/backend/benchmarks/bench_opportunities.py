@@ -0,0 +1,98 @@
+"""
+Opportunity generation cost per assessment: ranking the use-case library on every
+call (the previous implementation, tests/support.py:resorting_rows) vs the precompiled
+(industry, readiness band) lookup. Also checks that neither the library nor the
+compiled rankings change after many calls, including an industry short enough
+to be padded with the Default cases (this used to extend the library in place).
+Exits 1 if anything changed.
+
+No database is needed. Run from backend/:
+    python -m benchmarks.bench_opportunities
+    python -m benchmarks.bench_opportunities --calls 200000 --json out.json
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.models.models import Company  # noqa: E402
+from app.services.opportunity_engine import (  # noqa: E402
+    USE_CASE_LIBRARY, CatalogSnapshot, compile_library, install_catalog, opportunity_rows,
+)
+from tests.support import resorting_rows  # noqa: E402
+
+
+def _timed(fn, inputs: list, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for company, score in inputs:
+            fn(company, score)
+        samples.append((time.perf_counter() - start) / len(inputs) * 1e6)
+    return {"median_us_per_call": round(statistics.median(samples), 3), "min_us_per_call": round(min(samples), 3)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50_000, help="calls per timed run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args(argv)
+
+    library_sizes = {industry: len(cases) for industry, cases in USE_CASE_LIBRARY.items()}
+    rng = random.Random(42)
+    industries = list(USE_CASE_LIBRARY) + ["Retail", None]
+    inputs = [(Company(id=i, industry=rng.choice(industries)), rng.uniform(0, 100)) for i in range(args.calls)]
+
+    # Same output as ranking per call
+    mismatches = sum(opportunity_rows(c, s) != resorting_rows(c, s, USE_CASE_LIBRARY) for c, s in inputs[:2000])
+    timings = {
+        "ranking_per_call": _timed(lambda c, s: resorting_rows(c, s, USE_CASE_LIBRARY), inputs, args.repeat),
+        "precompiled": _timed(opportunity_rows, inputs, args.repeat),
+    }
+
+    # Library stability, with a short industry that gets padded with Default: serve
+    # from a snapshot of it, then compare with a compile of an untouched copy
+    library = copy.deepcopy(USE_CASE_LIBRARY)
+    library["Tiny"] = library["Logistics"][:1]
+    pristine = copy.deepcopy(library)
+    compiled = compile_library(library)
+    entries_before = {key: id(ranked) for key, ranked in compiled.items()}
+    install_catalog(CatalogSnapshot(version=0, ranked=compiled))
+    for company, score in inputs:
+        company.industry = "Tiny" if company.id % 2 else company.industry
+        opportunity_rows(company, score)
+        compile_library(library)
+    stable = (
+        library == pristine
+        and compiled == compile_library(pristine)
+        and {key: id(ranked) for key, ranked in compiled.items()} == entries_before
+        and all(len(v) <= 5 for v in compiled.values())
+        and {industry: len(cases) for industry, cases in USE_CASE_LIBRARY.items()} == library_sizes
+    )
+
+    report = {
+        "calls": args.calls,
+        **timings,
+        "mismatches": mismatches,
+        "library_sizes": library_sizes,
+        "library_stable": stable,
+    }
+    report["speedup"] = round(
+        report["ranking_per_call"]["median_us_per_call"] / report["precompiled"]["median_us_per_call"], 2
+    )
+    print(json.dumps(report, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0 if stable and not mismatches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
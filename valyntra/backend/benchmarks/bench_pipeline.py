@@ -0,0 +1,280 @@
+"""
+Latency and throughput of the assessment pipeline and the dashboard read, for
+several provider catalog sizes:
+
+  stages             calculate_score, generate_opportunities, run_matching, called
+                     directly (one transaction per iteration, rolled back)
+  submit_assessment  POST /api/assessments (full pipeline) at each concurrency level
+  get_dashboard      GET /api/dashboard/{id} at each concurrency level
+
+Requests go through the ASGI app in-process (httpx.ASGITransport), so sync routes
+run in the same threadpool as under uvicorn. The report has p50/p95/p99 per
+measurement and requests/second for the HTTP runs.
+
+Run from backend/:
+    python -m benchmarks.bench_pipeline                                  # SQLite file
+    python -m benchmarks.bench_pipeline --catalog-sizes 100,5000 --concurrency 1,32 --json report.json
+    python -m benchmarks.bench_pipeline --database-url postgresql://user:pw@localhost/valyntra_bench
+    python -m benchmarks.bench_pipeline --baseline report.json           # exit 1 on a p95 regression
+
+The response cache is off unless --response-cache is given, so reads measure the
+route itself. The target database is dropped and re-seeded for every catalog size;
+never point this at real data.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+DEFAULT_URL = "sqlite:////tmp/valyntra_bench_pipeline.db"
+
+
+def _sizes(value: str) -> list:
+    return [int(v) for v in value.split(",") if v]
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL", DEFAULT_URL))
+    parser.add_argument("--catalog-sizes", type=_sizes, default=[100, 1000, 5000], help="providers, comma-separated")
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200, help="iterations per pipeline stage")
+    parser.add_argument("--requests", type=int, default=300, help="requests per endpoint and concurrency level")
+    parser.add_argument("--concurrency", type=_sizes, default=[1, 8, 32])
+    parser.add_argument("--response-cache", default="none", choices=["none", "memory"])
+    parser.add_argument("--json", dest="json_path", help="also write the report here")
+    parser.add_argument("--baseline", help="earlier report to compare p95s against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 slowdown vs --baseline")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+args = _parse_args() if __name__ == "__main__" else None
+if args is not None:
+    # Settings are read at import time
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["RESPONSE_CACHE_BACKEND"] = args.response_cache
+    os.environ["PIPELINE_BACKGROUND"] = "0"
+    os.environ["DB_CREATE_ALL"] = "0"
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from app.db.session import Base, SessionLocal, get_engine  # noqa: E402
+from app.models.models import User, Company, Assessment, Provider  # noqa: E402
+from app.core.security import create_access_token, user_cache  # noqa: E402
+from app.services.scoring import calculate_score  # noqa: E402
+from app.services.opportunity_engine import USE_CASE_LIBRARY, generate_opportunities  # noqa: E402
+from app.services.matching import run_matching  # noqa: E402
+from app.services.pipeline import run_pipeline_batch  # noqa: E402
+from app.services.dashboard import refresh_dashboard_snapshot  # noqa: E402
+from app.services.provider_index import invalidate_provider_index  # noqa: E402
+
+INDUSTRIES = [i for i in USE_CASE_LIBRARY if i != "Default"] + ["Retail"]
+TAGS = sorted({uc["tag"] for use_cases in USE_CASE_LIBRARY.values() for uc in use_cases})
+SEGMENTS = ["SMB", "Enterprise"]
+INPUTS = ["data_maturity", "process_automation", "leadership_alignment", "technical_infrastructure"]
+
+
+def summarize(samples_ms: list) -> dict:
+    ordered = sorted(samples_ms)
+
+    def pct(p: float) -> float:
+        return round(ordered[max(0, math.ceil(p * len(ordered)) - 1)], 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+    }
+
+
+# ── Dataset ──────────────────────────────────────────────────────────────
+def _inputs(rng: random.Random) -> dict:
+    return {name: rng.randint(1, 5) for name in INPUTS}
+
+
+def seed(n_users: int, n_companies: int, n_providers: int, rng: random.Random) -> dict:
+    """
+    Fresh schema with users, companies (one assessment each, run through the batch
+    pipeline, dashboard snapshot written) and an active provider catalog.
+    Returns {company_id: owner_id} plus one assessment id per company.
+    """
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    user_cache.clear()
+
+    with SessionLocal() as db:
+        db.execute(insert(Provider), [
+            {"name": f"Provider {i}", "provider_type": "Consultancy",
+             "capability_tags": rng.sample(TAGS, rng.randint(1, 3)),
+             # A few multi-industry providers (no industries listed), the rest specialised
+             "industries_served": [] if rng.random() < 0.1 else rng.sample(INDUSTRIES, rng.randint(1, 2)),
+             "typical_project_size": rng.choice(SEGMENTS), "qualification_score": rng.randint(0, 30),
+             "is_active": True}
+            for i in range(n_providers)
+        ])
+        invalidate_provider_index()     # new database, same process
+        user_ids = db.scalars(insert(User).returning(User.id, sort_by_parameter_order=True), [
+            {"email": f"user{i}@bench.local", "hashed_password": "x"} for i in range(n_users)
+        ]).all()
+        companies = db.scalars(insert(Company).returning(Company, sort_by_parameter_order=True), [
+            {"owner_id": rng.choice(user_ids), "name": f"Company {i}", "industry": rng.choice(INDUSTRIES),
+             "company_size_segment": rng.choice(SEGMENTS), "employee_count": rng.randint(10, 5000)}
+            for i in range(n_companies)
+        ]).all()
+        assessments = db.scalars(insert(Assessment).returning(Assessment, sort_by_parameter_order=True), [
+            {"company_id": c.id, **_inputs(rng)} for c in companies
+        ]).all()
+        run_pipeline_batch(assessments, {c.id: c for c in companies}, db)
+        for company in companies:
+            refresh_dashboard_snapshot(company.id, db)
+        owners = {c.id: c.owner_id for c in companies}
+        assessment_ids = {a.company_id: a.id for a in assessments}
+        db.commit()
+    return {"owners": owners, "assessments": assessment_ids}
+
+
+# ── Pipeline stages ──────────────────────────────────────────────────────
+def measure_stages(assessment_ids: dict, repeat: int, rng: random.Random) -> dict:
+    """Each iteration runs the three stages the way run_pipeline does, then rolls back."""
+    timings = {"calculate_score": [], "generate_opportunities": [], "run_matching": []}
+    company_ids = sorted(assessment_ids)
+    for i in range(repeat + 1):
+        company_id = rng.choice(company_ids)
+        with SessionLocal() as db:
+            assessment = db.get(Assessment, assessment_ids[company_id])
+            company = db.get(Company, company_id)
+            t0 = time.perf_counter()
+            score = calculate_score(assessment, db)
+            t1 = time.perf_counter()
+            opportunities = generate_opportunities(company, score, db)
+            t2 = time.perf_counter()
+            run_matching(company, opportunities, db, clear_existing=False)
+            t3 = time.perf_counter()
+            db.rollback()
+        if i == 0:
+            continue  # warm-up: provider index build, statement caches
+        timings["calculate_score"].append((t1 - t0) * 1000)
+        timings["generate_opportunities"].append((t2 - t1) * 1000)
+        timings["run_matching"].append((t3 - t2) * 1000)
+    return {name: summarize(samples) for name, samples in timings.items()}
+
+
+# ── HTTP load ────────────────────────────────────────────────────────────
+async def load(client: httpx.AsyncClient, make_request, total: int, concurrency: int) -> dict:
+    """`total` requests from `concurrency` concurrent clients; make_request(i) → (method, url, kwargs)."""
+    latencies, errors = [], 0
+    pending = iter(range(total))
+
+    async def client_loop():
+        nonlocal errors
+        for i in pending:
+            method, url, kwargs = make_request(i)
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    return {**summarize(latencies), "errors": errors, "throughput_rps": round(total / wall, 1)}
+
+
+async def measure_http(owners: dict, total: int, levels: list, rng: random.Random) -> dict:
+    from app.main import app
+
+    tokens = {uid: create_access_token({"sub": str(uid)}) for uid in set(owners.values())}
+    company_ids = sorted(owners)
+    # Round-robin over companies: concurrent submits never race on the same company
+    # as long as there are more companies than clients
+    def auth(company_id: int) -> dict:
+        return {"Authorization": f"Bearer {tokens[owners[company_id]]}"}
+
+    def submit(i: int):
+        company_id = company_ids[i % len(company_ids)]
+        return "POST", "/api/assessments", {"json": {"company_id": company_id, **_inputs(rng)}, "headers": auth(company_id)}
+
+    def dashboard(i: int):
+        company_id = company_ids[i % len(company_ids)]
+        return "GET", f"/api/dashboard/{company_id}", {"headers": auth(company_id)}
+
+    results = {"submit_assessment": {}, "get_dashboard": {}}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for name, make_request in (("submit_assessment", submit), ("get_dashboard", dashboard)):
+            await load(client, make_request, min(total, 20), 1)  # warm-up
+            for level in levels:
+                results[name][f"c{level}"] = await load(client, make_request, total, level)
+    return results
+
+
+# ── Regression check ─────────────────────────────────────────────────────
+def _p95s(node, path=()):
+    if isinstance(node, dict):
+        if "p95_ms" in node:
+            yield "/".join(path), node["p95_ms"]
+        for key, value in node.items():
+            yield from _p95s(value, path + (key,))
+
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> list:
+    before = dict(_p95s(baseline.get("catalogs", {})))
+    found = []
+    for path, p95 in _p95s(report["catalogs"]):
+        if path in before and before[path] > 0 and p95 > before[path] * (1 + tolerance):
+            found.append(f"{path}: p95 {before[path]} → {p95} ms")
+    return found
+
+
+def main(args) -> int:
+    rng = random.Random(args.seed)
+    report = {
+        "dialect": get_engine().dialect.name,
+        "config": {"companies": args.companies, "users": args.users, "repeat": args.repeat,
+                   "requests": args.requests, "concurrency": args.concurrency,
+                   "response_cache": args.response_cache},
+        "catalogs": {},
+    }
+    for n_providers in args.catalog_sizes:
+        start = time.perf_counter()
+        dataset = seed(args.users, args.companies, n_providers, rng)
+        print(f"[{n_providers} providers] seeded in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        result = {"stages": measure_stages(dataset["assessments"], args.repeat, rng)}
+        result.update(asyncio.run(measure_http(dataset["owners"], args.requests, args.concurrency, rng)))
+        report["catalogs"][str(n_providers)] = result
+
+        for name, stats in result["stages"].items():
+            print(f"  {name:24} p50 {stats['p50_ms']:8.3f}  p95 {stats['p95_ms']:8.3f}  p99 {stats['p99_ms']:8.3f} ms", file=sys.stderr)
+        for name in ("submit_assessment", "get_dashboard"):
+            for level, stats in result[name].items():
+                print(f"  {name + ' ' + level:24} p50 {stats['p50_ms']:8.3f}  p95 {stats['p95_ms']:8.3f}  "
+                      f"p99 {stats['p99_ms']:8.3f} ms  {stats['throughput_rps']:8.1f} req/s  {stats['errors']} errors",
+                      file=sys.stderr)
+
+    print(json.dumps(report, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(report, json.load(f), args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(args))
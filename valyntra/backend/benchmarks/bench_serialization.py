@@ -0,0 +1,138 @@
+"""
+Per-response serialization cost of DashboardOut, MatchOut and ProviderOut payloads
+built from ORM rows, comparing:
+
+  fastapi        response_model validation + jsonable dump + JSONResponse (default)
+  fastapi+orjson the same, rendered by ORJSONResponse (FAST_JSON's response class)
+  fast_response  one validation against the *Out schema, JSON bytes from pydantic-core
+
+No database is needed: rows are transient ORM objects.
+
+Run from backend/:
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --matches 300 --providers 2000 --json out.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ["FAST_JSON"] = "1"  # fast_response is a no-op without it
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from app.core.serialization import fast_response  # noqa: E402
+from app.models.models import Company, Score, Opportunity, Provider, Match  # noqa: E402
+from app.schemas.schemas import DashboardOut, MatchOut, ProviderOut  # noqa: E402
+from app.services.dashboard import build_dashboard  # noqa: E402
+
+NOW = datetime.now(timezone.utc)
+TAGS = ["automation", "analytics", "ml", "nlp", "vision", "forecasting"]
+
+
+def _provider(i: int, rnd: random.Random) -> Provider:
+    return Provider(
+        id=i, name=f"Provider {i}", provider_type="Consultancy",
+        capability_tags=rnd.sample(TAGS, 3), industries_served=["Manufacturing", "Retail"],
+        delivery_model="Hybrid", typical_project_size="SMB", capacity="Medium",
+        qualification_score=rnd.randint(0, 30), website=f"https://p{i}.example.com",
+    )
+
+
+def _company(n_matches: int, rnd: random.Random) -> Company:
+    company = Company(
+        id=1, name="Acme", industry="Manufacturing", county="Cook", city="Chicago",
+        website="https://acme.example.com", employee_count=250, company_size_segment="SMB", created_at=NOW,
+    )
+    company.opportunities = [
+        Opportunity(
+            id=i, company_id=1, use_case=f"Use case {i}", use_case_tag=TAGS[i % len(TAGS)],
+            impact_estimate="High", implementation_effort="Medium", roi_classification="Quick Win", rank=i,
+        )
+        for i in range(1, 6)
+    ]
+    company.matches = []
+    for i in range(1, n_matches + 1):
+        opportunity = company.opportunities[i % 5]
+        company.matches.append(Match(
+            id=i, company_id=1, opportunity_id=opportunity.id, provider_id=i,
+            industry_match=True, capability_match=bool(i % 2), weighted_score=float(rnd.randint(30, 100)),
+            est_pilot_value=float(rnd.randint(40_000, 400_000)), stage="Not Started",
+            provider=_provider(i, rnd), opportunity=opportunity,
+        ))
+    return company
+
+
+def _timed(fn, repeat: int) -> dict:
+    fn()  # warm up (adapter / schema caches)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return {
+        "p50_us": round(statistics.median(samples), 1),
+        "p95_us": round(samples[int(len(samples) * 0.95) - 1], 1),
+    }
+
+
+_loop = asyncio.new_event_loop()
+
+
+def _fastapi(schema, content, response_class):
+    field = create_response_field(name="Response", type_=schema)
+
+    def run():
+        value = _loop.run_until_complete(serialize_response(field=field, response_content=content))
+        return response_class(value).body
+    return run
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--matches", type=int, default=15, help="matches on the dashboard / in the match list")
+    parser.add_argument("--providers", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args(argv)
+
+    rnd = random.Random(42)
+    company = _company(args.matches, rnd)
+    score = Score(
+        id=1, company_id=1, overall_score=62.5, data_maturity_score=75.0, process_automation_score=50.0,
+        leadership_alignment_score=75.0, technical_infrastructure_score=50.0,
+        recommendation_level="Developing", calculated_at=NOW,
+    )
+    dashboard = build_dashboard(company, score, sum(m.est_pilot_value for m in company.matches))
+    cases = {
+        "DashboardOut": (DashboardOut, dashboard),
+        f"list[MatchOut] x{args.matches}": (list[MatchOut], company.matches),
+        f"list[ProviderOut] x{args.providers}": (list[ProviderOut], [_provider(i, rnd) for i in range(args.providers)]),
+    }
+
+    report = {}
+    for name, (schema, content) in cases.items():
+        report[name] = {
+            "fastapi": _timed(_fastapi(schema, content, JSONResponse), args.repeat),
+            "fastapi+orjson": _timed(_fastapi(schema, content, ORJSONResponse), args.repeat),
+            "fast_response": _timed(lambda: fast_response(schema, content).body, args.repeat),
+        }
+        base = report[name]["fastapi"]["p50_us"]
+        report[name]["speedup_p50"] = round(base / report[name]["fast_response"]["p50_us"], 2)
+
+    print(json.dumps(report, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
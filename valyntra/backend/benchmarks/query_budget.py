@@ -0,0 +1,47 @@
+"""
+SQL statements per request for the read endpoints, checked against a budget.
+
+Seeds a throwaway SQLite database with two companies that went through the
+pipeline (one with a dashboard snapshot, one without), then calls every
+endpoint in BUDGETS through TestClient while counting the statements sent on any
+Engine. Budgets don't depend on row counts, so an N+1 (e.g. lazy loads while
+serializing nested MatchOut objects) pushes a route over and the run exits 1.
+
+Run from backend/:
+    python -m benchmarks.query_budget
+    DB_ASYNC=1 python -m benchmarks.query_budget      # async read stack
+
+BUDGETS and the seeding live in tests/support.py; tests/test_query_budget.py
+asserts the same budgets under pytest.
+"""
+import os
+import sys
+
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/valyntra_query_budget.db")
+os.environ["RESPONSE_CACHE_BACKEND"] = "none"    # count the route's own queries
+os.environ["PIPELINE_BACKGROUND"] = "0"
+
+from tests.support import BUDGETS, route_statements, seeded_client  # noqa: E402
+
+
+def check() -> list:
+    """[(method, path, statements, budget)] for every route in BUDGETS."""
+    client, ids = seeded_client()
+    results = []
+    for method, template, budget in BUDGETS:
+        path = template.format(**ids)
+        results.append((method, path, len(route_statements(client, method, path)), budget))
+    return results
+
+
+def main() -> int:
+    over = 0
+    for method, path, count, budget in check():
+        status = "ok" if count <= budget else "OVER BUDGET"
+        over += count > budget
+        print(f"{method:4} {path:45} {count:3} / {budget:<3} {status}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
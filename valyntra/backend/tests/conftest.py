@@ -0,0 +1,13 @@
+"""
+Settings are read when app.core.config is first imported, so the test
+environment is set here, before any test module imports the app: a throwaway
+SQLite database, no response cache (tests count the route's own queries), the
+pipeline inline, and no use-case catalog watcher thread.
+"""
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='valyntra-tests-')}/test.db"
+os.environ["RESPONSE_CACHE_BACKEND"] = "none"
+os.environ["PIPELINE_BACKGROUND"] = "0"
+os.environ["USE_CASE_CATALOG_POLL_SECONDS"] = "0"
@@ -0,0 +1,111 @@
+"""
+Helpers shared by the tests and the benchmarks (which import them from here, so
+tuning a benchmark can't change what a test checks). The environment, e.g.
+DATABASE_URL, must be set before importing this module.
+"""
+from contextlib import contextmanager
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+from app.core.security import create_access_token
+from app.db.session import Base, SessionLocal, get_engine
+from app.models.models import Assessment, Company, Provider, User
+from app.services.opportunity_engine import EFFORT_TO_SCORE, IMPACT_TO_SCORE, ROI_TO_SCORE
+from app.services.pipeline import run_pipeline, run_pipeline_batch
+from app.services.provider_index import invalidate_provider_index
+
+
+# ── Opportunity ranking reference ────────────────────────────────────────
+def resorting_rows(company: Company, overall_score: float, library: dict) -> list:
+    """Opportunity rows ranked per call, as before compile_library (without the in-place +=)."""
+    use_cases = library.get(company.industry or "Default", library["Default"])
+    if len(use_cases) < 3:
+        use_cases = use_cases + library["Default"]
+
+    def priority(uc):
+        effort_weight = 2.0 if overall_score < 50 else 1.0
+        return IMPACT_TO_SCORE[uc["impact"]] * 1.5 + EFFORT_TO_SCORE[uc["effort"]] * effort_weight + ROI_TO_SCORE[uc["roi"]]
+
+    return [
+        dict(company_id=company.id, use_case=uc["use_case"], use_case_tag=uc["tag"], impact_estimate=uc["impact"],
+             implementation_effort=uc["effort"], roi_classification=uc["roi"], rank=i)
+        for i, uc in enumerate(sorted(use_cases, key=priority, reverse=True)[:5], start=1)
+    ]
+
+
+# ── Query budget ─────────────────────────────────────────────────────────
+# (method, path, max statements); {snapshot} / {live} are the seeded company ids.
+# Measured on the second call: the user cache is warm, the response cache is off.
+BUDGETS = [
+    ("GET", "/api/auth/me", 0),
+    ("GET", "/api/companies", 1),
+    ("GET", "/api/companies/{snapshot}", 1),
+    ("GET", "/api/assessments/company/{snapshot}", 2),
+    ("GET", "/api/scores/{snapshot}", 2),
+    ("GET", "/api/opportunities/{snapshot}", 2),
+    ("GET", "/api/providers", 1),
+    ("GET", "/api/matches/{snapshot}", 2),
+    ("GET", "/api/matches/{snapshot}?compact=true", 2),
+    ("GET", "/api/dashboard/{snapshot}", 1),
+    ("GET", "/api/dashboard/{snapshot}?compact=true", 1),
+    ("GET", "/api/dashboard/{live}", 4),
+    ("GET", "/api/dashboard/{live}?compact=true", 4),
+]
+
+
+@contextmanager
+def count_queries():
+    """Yields a list that collects every SQL statement executed inside the block."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def seed() -> dict:
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        db.execute(insert(Provider), [
+            {"name": f"Provider {i}", "capability_tags": [tag], "industries_served": ["Healthcare"],
+             "qualification_score": i % 30, "is_active": True}
+            for i, tag in enumerate(["ml", "automation", "optimization", "analytics"] * 10)
+        ])
+        invalidate_provider_index()     # new database, same process
+        user_id = db.scalar(insert(User).returning(User.id).values(email="budget@bench.local", hashed_password="x"))
+        snapshot, live = db.scalars(insert(Company).returning(Company, sort_by_parameter_order=True), [
+            {"owner_id": user_id, "name": name, "industry": "Healthcare"} for name in ("Snapshot Co", "Live Co")
+        ]).all()
+        inputs = {"data_maturity": 3, "process_automation": 4, "leadership_alignment": 2, "technical_infrastructure": 3}
+        first = db.scalar(insert(Assessment).returning(Assessment).values(company_id=snapshot.id, **inputs))
+        run_pipeline(first, snapshot, db)      # writes the dashboard snapshot
+        second = db.scalar(insert(Assessment).returning(Assessment).values(company_id=live.id, **inputs))
+        run_pipeline_batch([second], {live.id: live}, db)   # no snapshot: dashboard built live
+        ids = {"user": user_id, "snapshot": snapshot.id, "live": live.id}
+        db.commit()
+    return ids
+
+
+def seeded_client() -> tuple:
+    """(TestClient authenticated as the seeded user, seeded ids)."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    ids = seed()
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(ids['user'])})}"
+    return client, ids
+
+
+def route_statements(client, method: str, path: str) -> list:
+    """Statements executed by the second of two calls to the route."""
+    client.request(method, path).raise_for_status()   # warm-up
+    with count_queries() as statements:
+        client.request(method, path).raise_for_status()
+    return statements
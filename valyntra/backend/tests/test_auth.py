@@ -0,0 +1,38 @@
+"""Register / login await bcrypt in the hashing pool; a changed BCRYPT_ROUNDS rehashes on login."""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from app.core import hashing
+from app.core.config import settings
+from app.db.session import Base, SessionLocal, get_engine
+from app.main import app
+from app.models.models import User
+
+CREDENTIALS = {"email": "auth@example.com", "password": "correct horse"}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    Base.metadata.create_all(get_engine())
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    yield TestClient(app)
+    hashing.shutdown_hash_pool()
+
+
+def _stored_hash() -> str:
+    with SessionLocal() as db:
+        return db.scalar(select(User.hashed_password).where(User.email == CREDENTIALS["email"]))
+
+
+def test_register_login_and_rehash(client, monkeypatch):
+    assert client.post("/api/auth/register", json={**CREDENTIALS, "full_name": "Auth"}).status_code == 200
+    assert client.post("/api/auth/register", json=CREDENTIALS).status_code == 400
+    assert client.post("/api/auth/login", json={**CREDENTIALS, "password": "wrong"}).status_code == 401
+
+    token = client.post("/api/auth/login", json=CREDENTIALS).json()["access_token"]
+    assert client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"}).json()["email"] == CREDENTIALS["email"]
+    assert _stored_hash().startswith("$2b$04$")
+
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    assert client.post("/api/auth/login", json=CREDENTIALS).status_code == 200
+    assert _stored_hash().startswith("$2b$05$")
@@ -0,0 +1,37 @@
+"""BodyReader back-pressure: the event-loop side never blocks on a full queue."""
+import threading
+import time
+import pytest
+from app.services.bulk_import import BodyReader
+
+
+def test_feed_nowait_reports_full_queue_without_blocking():
+    reader = BodyReader(max_chunks=2)
+    assert reader.feed_nowait(b"a") and reader.feed_nowait(b"b")
+    start = time.perf_counter()
+    assert not reader.feed_nowait(b"c")
+    assert time.perf_counter() - start < 0.05
+    reader.close()
+    assert not reader.feed_nowait(b"d")
+
+
+def test_feed_waits_for_reader_in_a_thread():
+    reader = BodyReader(max_chunks=1)
+    reader.feed_nowait(b"ab")
+    fed = threading.Event()
+    threading.Thread(target=lambda: reader.feed(b"") and fed.set(), daemon=True).start()
+    assert not fed.wait(0.2)                 # queue full: the feeding thread waits...
+    assert reader.read() == b"ab"            # ...until the reader drains it
+    assert fed.wait(1)
+
+
+def test_abort_on_full_queue_does_not_block():
+    reader = BodyReader(max_chunks=2)
+    reader.feed_nowait(b"a")
+    reader.feed_nowait(b"b")
+    start = time.perf_counter()
+    reader.abort()
+    assert time.perf_counter() - start < 0.05
+    with pytest.raises(OSError):
+        while reader.read(1):
+            pass
@@ -0,0 +1,87 @@
+"""Pipeline jobs: transient database errors are retried up to MAX_ATTEMPTS, other errors fail at once."""
+import itertools
+import threading
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+from app.db.session import Base, SessionLocal, get_engine
+from app.models.models import Assessment, Company, PipelineJob, User
+from app.services import jobs
+
+_emails = (f"jobs-{i}@test.local" for i in itertools.count())
+
+
+@pytest.fixture
+def job_id():
+    Base.metadata.create_all(get_engine())
+    with SessionLocal() as db:
+        owner_id = db.scalar(insert(User).returning(User.id).values(email=next(_emails), hashed_password="x"))
+        company = db.scalar(insert(Company).returning(Company).values(owner_id=owner_id, name="Jobs Co", industry="Retail"))
+        assessment = db.scalar(insert(Assessment).returning(Assessment).values(company_id=company.id))
+        job = jobs.create_job(assessment, db)
+        db.commit()
+        return job.id
+
+
+def _fail_with(monkeypatch, exc):
+    def run_pipeline(*args, **kwargs):
+        raise exc
+    monkeypatch.setattr(jobs, "run_pipeline", run_pipeline)
+
+
+def _job(job_id) -> PipelineJob:
+    with SessionLocal() as db:
+        return db.get(PipelineJob, job_id)
+
+
+def test_transient_error_requeues_until_max_attempts(job_id, monkeypatch):
+    retries = []
+    monkeypatch.setattr(jobs, "_retry_later", lambda job_id, delay: retries.append(delay))
+    _fail_with(monkeypatch, OperationalError("SELECT 1", {}, Exception("connection reset")))
+    for attempt in range(1, jobs.MAX_ATTEMPTS):
+        jobs.run_job(job_id)
+        job = _job(job_id)
+        assert (job.status, job.attempts) == (jobs.QUEUED, attempt)
+    jobs.run_job(job_id)
+    job = _job(job_id)
+    assert (job.status, job.attempts) == (jobs.FAILED, jobs.MAX_ATTEMPTS)
+    assert retries == [jobs.RETRY_DELAY_SECONDS * n for n in range(1, jobs.MAX_ATTEMPTS)]
+
+
+def test_other_errors_fail_at_once(job_id, monkeypatch):
+    monkeypatch.setattr(jobs, "_retry_later", lambda job_id, delay: pytest.fail("retried a permanent error"))
+    _fail_with(monkeypatch, ValueError("bad assessment"))
+    jobs.run_job(job_id)
+    job = _job(job_id)
+    assert (job.status, job.attempts, job.error) == (jobs.FAILED, 1, "bad assessment")
+
+
+def test_transient_error_while_claiming_is_retried(job_id, monkeypatch):
+    retries = []
+    monkeypatch.setattr(jobs, "_retry_later", lambda job_id, delay: retries.append(job_id))
+
+    def claim(job_id, db):
+        raise OperationalError("UPDATE pipeline_jobs", {}, Exception("connection reset"))
+    monkeypatch.setattr(jobs, "_claim", claim)
+    jobs.run_job(job_id)
+    job = _job(job_id)
+    assert (job.status, job.attempts, retries) == (jobs.QUEUED, 0, [job_id])
+
+
+def test_worker_survives_a_job_that_raises(monkeypatch):
+    ran = []
+
+    def run_job(job_id):
+        ran.append(job_id)
+        if job_id == 1:
+            raise OperationalError("SELECT 1", {}, Exception("database unreachable"))
+    monkeypatch.setattr(jobs, "run_job", run_job)
+    worker = threading.Thread(target=jobs._worker_loop, daemon=True)
+    worker.start()
+    jobs._queue.put(1)
+    jobs._queue.put(2)
+    jobs._queue.join()
+    jobs._stop.set()
+    worker.join(5)
+    jobs._stop.clear()
+    assert ran == [1, 2]
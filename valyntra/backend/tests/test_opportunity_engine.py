@@ -0,0 +1,55 @@
+"""Precompiled opportunity rankings: same output as ranking per call, and nothing grows or changes with use."""
+import copy
+import random
+from types import MappingProxyType
+import pytest
+from app.models.models import Company
+from app.services.opportunity_engine import (
+    USE_CASE_LIBRARY, CatalogSnapshot, compile_library, current_catalog, install_catalog, opportunity_rows,
+)
+from tests.support import resorting_rows
+
+
+@pytest.fixture
+def library():
+    """Built-in library plus an industry short enough to be padded with Default, installed as the catalog."""
+    library = copy.deepcopy(USE_CASE_LIBRARY)
+    library["Tiny"] = library["Logistics"][:1]
+    previous = current_catalog()
+    install_catalog(CatalogSnapshot(version=0, ranked=compile_library(library)))
+    yield library
+    install_catalog(previous)
+
+
+def _inputs(library: dict, n: int) -> list:
+    rng = random.Random(7)
+    industries = list(library) + ["Retail", None]
+    scores = [0, 49.9, 50, 100] + [rng.uniform(0, 100) for _ in range(n)]
+    return [(Company(id=i, industry=rng.choice(industries)), score) for i, score in enumerate(scores)]
+
+
+def test_rows_match_linear_scan(library):
+    for company, score in _inputs(library, 2000):
+        assert opportunity_rows(company, score) == resorting_rows(company, score, library)
+
+
+def test_library_and_compiled_rankings_stable(library):
+    pristine = copy.deepcopy(library)
+    compiled = current_catalog().ranked
+    entries = {key: ranked for key, ranked in compiled.items()}
+
+    for company, score in _inputs(library, 20_000):
+        opportunity_rows(company, score)
+    compile_library(library)
+
+    assert library == pristine
+    assert {industry: len(cases) for industry, cases in library.items()} == {
+        industry: len(cases) for industry, cases in pristine.items()
+    }
+    assert isinstance(compiled, MappingProxyType)
+    assert len(compiled) == 2 * len(library)          # (industry, low_readiness) pairs only
+    assert all(compiled[key] is ranked for key, ranked in entries.items())
+    assert all(isinstance(ranked, tuple) and len(ranked) <= 5 for ranked in compiled.values())
+    assert compile_library(pristine) == compiled      # a fresh compile gives the same rankings
+    with pytest.raises(TypeError):
+        compiled[("Tiny", True)] = ()
@@ -0,0 +1,24 @@
+"""Cursors are checked against the keyset's columns before they reach SQL."""
+import pytest
+from fastapi import HTTPException
+from app.api.routes import MATCH_KEYSET, OPPORTUNITY_KEYSET
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def test_round_trip():
+    assert decode_cursor(encode_cursor([3, 17]), OPPORTUNITY_KEYSET) == [3, 17]
+    assert decode_cursor(encode_cursor([87, 4]), MATCH_KEYSET) == [87.0, 4]    # int JSON for a float column
+
+
+@pytest.mark.parametrize("values", [["x", "y"], [1], [1, 2, 3], [True, 2], [None, 2], [1.5, 2], {"rank": 1}, "1,2"])
+def test_wrong_shape_or_types_are_rejected(values):
+    with pytest.raises(HTTPException) as err:
+        decode_cursor(encode_cursor(values), OPPORTUNITY_KEYSET)
+    assert (err.value.status_code, err.value.detail) == (400, "Invalid cursor")
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24", "_w"])
+def test_garbage_is_rejected(cursor):
+    with pytest.raises(HTTPException) as err:
+        decode_cursor(cursor, OPPORTUNITY_KEYSET)
+    assert err.value.status_code == 400
@@ -0,0 +1,39 @@
+"""TimedQueuePool counts a wait only when a checkout finds the pool at capacity."""
+import threading
+import pytest
+from sqlalchemy import create_engine, exc
+from app.db.session import TimedQueuePool, _pool_stats
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool,
+                           pool_size=1, max_overflow=1, pool_timeout=0.2)
+    yield engine
+    engine.dispose()
+
+
+def _waits():
+    return _pool_stats.waits, _pool_stats.timeouts
+
+
+def test_checkouts_with_headroom_do_not_count_as_waits(engine):
+    before = _waits()
+    for _ in range(5):
+        with engine.connect(), engine.connect():    # pool slot plus the overflow slot
+            pass
+    assert _waits() == before
+
+
+def test_checkout_at_capacity_waits_then_times_out(engine):
+    waits, timeouts = _waits()
+    first, second = engine.connect(), engine.connect()
+    released = threading.Timer(0.05, second.close)
+    released.start()
+    with engine.connect():                           # blocks until `second` is returned
+        pass
+    assert _waits() == (waits + 1, timeouts)
+    with pytest.raises(exc.TimeoutError), engine.connect(), engine.connect():
+        pass
+    assert _waits() == (waits + 2, timeouts + 1)
+    first.close()
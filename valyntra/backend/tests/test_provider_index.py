@@ -0,0 +1,58 @@
+"""The provider index is reused without queries, and rebuilt when another worker bumps the catalog version."""
+import pytest
+from sqlalchemy import event, insert, update
+from app.core.config import settings
+from app.db.session import Base, SessionLocal, get_engine
+from app.models.models import Provider
+from app.services.provider_index import (
+    bump_provider_catalog_version, get_provider_index, invalidate_provider_index, seed_provider_catalog,
+)
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(get_engine())
+    with SessionLocal() as db:
+        seed_provider_catalog(db)
+        provider_id = db.scalar(insert(Provider).returning(Provider.id).values(
+            name="Indexed", capability_tags=["ml"], industries_served=["Retail"], is_active=True))
+        db.commit()
+        invalidate_provider_index()
+        db.info["provider_id"] = provider_id
+        yield db
+    invalidate_provider_index()
+
+
+def _statements(fn) -> list:
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(get_engine(), "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(get_engine(), "before_cursor_execute", listener)
+    return statements
+
+
+def test_reused_without_queries_within_max_age(db, monkeypatch):
+    monkeypatch.setattr(settings, "PROVIDER_INDEX_MAX_AGE_SECONDS", 60)
+    index = get_provider_index(db)
+    assert _statements(lambda: get_provider_index(db)) == []
+    assert get_provider_index(db) is index
+
+
+def test_edit_by_another_worker_is_picked_up(db, monkeypatch):
+    monkeypatch.setattr(settings, "PROVIDER_INDEX_MAX_AGE_SECONDS", 0)
+    provider_id = db.info["provider_id"]
+    index = get_provider_index(db)
+    assert provider_id in index.capability_candidates("ml")
+    assert len(_statements(lambda: get_provider_index(db))) == 1      # version check only
+    assert get_provider_index(db) is index
+
+    # Another worker edits an existing provider's tags: row count and max id stay the same
+    db.execute(update(Provider).where(Provider.id == provider_id).values(capability_tags=["nlp"]))
+    bump_provider_catalog_version(db)
+    db.commit()
+    index = get_provider_index(db)
+    assert provider_id in index.capability_candidates("nlp")
+    assert provider_id not in index.capability_candidates("ml")
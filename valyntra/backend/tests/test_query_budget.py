@@ -0,0 +1,15 @@
+"""SQL statements per read endpoint stay within tests.support.BUDGETS (catches N+1s)."""
+import pytest
+from tests.support import BUDGETS, route_statements, seeded_client
+
+
+@pytest.fixture(scope="module")
+def client_and_ids():
+    return seeded_client()
+
+
+@pytest.mark.parametrize("method,template,budget", BUDGETS, ids=[f"{m} {t}" for m, t, _ in BUDGETS])
+def test_route_within_query_budget(client_and_ids, method, template, budget):
+    client, ids = client_and_ids
+    statements = route_statements(client, method, template.format(**ids))
+    assert len(statements) <= budget, "\n".join(statements)
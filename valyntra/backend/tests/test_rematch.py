@@ -0,0 +1,138 @@
+"""
+Incremental re-matching keeps each opportunity's K and invalidates cached responses
+in the calling process; provider writes queue it durably for the re-match worker.
+"""
+import itertools
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import OperationalError
+from app.core.response_cache import MemoryBackend, company_scope, response_cache, set_backend
+from app.core.security import create_access_token
+from app.db.session import Base, SessionLocal, get_engine
+from app.main import app
+from app.models.models import Assessment, Company, Match, Opportunity, Provider, RematchJob, User
+from app.services import rematch
+from app.services.jobs import DONE, QUEUED, RUNNING
+from app.services.pipeline import run_pipeline
+from app.services.provider_index import invalidate_provider_index, seed_provider_catalog
+from app.services.rematch import ADDED, rematch_provider, run_queued_rematches
+
+_emails = (f"rematch-{i}@test.local" for i in itertools.count())
+INPUTS = {"data_maturity": 3, "process_automation": 3, "leadership_alignment": 3, "technical_infrastructure": 3}
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(get_engine())
+    with SessionLocal() as db:
+        db.execute(insert(Provider), [
+            {"name": f"Rematch {i}", "capability_tags": ["ml", "automation", "analytics", "optimization"],
+             "industries_served": ["Retail"], "qualification_score": 10, "is_active": True}
+            for i in range(6)
+        ])
+        seed_provider_catalog(db)
+        db.commit()
+        invalidate_provider_index()
+        yield db
+    invalidate_provider_index()
+
+
+def _company(db, top_k=None) -> int:
+    owner_id = db.scalar(insert(User).returning(User.id).values(email=next(_emails), hashed_password="x"))
+    company = db.scalar(insert(Company).returning(Company).values(owner_id=owner_id, name="Rematch Co", industry="Retail"))
+    assessment = db.scalar(insert(Assessment).returning(Assessment).values(company_id=company.id, **INPUTS))
+    run_pipeline(assessment, company, db, top_k=top_k)
+    db.commit()
+    return company.id
+
+
+def _add_star_provider(db) -> int:
+    provider_id = db.scalar(insert(Provider).returning(Provider.id).values(
+        name="Star", capability_tags=["ml", "automation", "analytics", "optimization"],
+        industries_served=["Retail"], qualification_score=30, is_active=True))
+    db.commit()
+    invalidate_provider_index()
+    return provider_id
+
+
+def _matches_per_opportunity(db, company_id: int) -> set:
+    return set(db.scalars(
+        select(func.count()).select_from(Match).where(Match.company_id == company_id).group_by(Match.opportunity_id)
+    ))
+
+
+def test_added_provider_keeps_explicit_top_k(db):
+    company_id = _company(db, top_k=1)
+    assert set(db.scalars(select(Opportunity.top_k).where(Opportunity.company_id == company_id))) == {1}
+    star = _add_star_provider(db)
+    rematch_provider(star, ADDED, workers=0)
+    db.expire_all()
+    assert _matches_per_opportunity(db, company_id) == {1}
+    assert set(db.scalars(select(Match.provider_id).where(Match.company_id == company_id))) == {star}
+
+
+def test_pool_rematch_invalidates_parent_cache(db):
+    company_ids = [_company(db) for _ in range(2)]
+    star = _add_star_provider(db)
+    previous = response_cache.backend
+    set_backend(MemoryBackend(100, 300))
+    try:
+        before = {cid: response_cache.backend.version(company_scope(cid)) for cid in company_ids}
+        assert rematch_provider(star, ADDED, workers=2, chunk_size=1) >= 2
+        for cid in company_ids:
+            assert response_cache.backend.version(company_scope(cid)) > before[cid]
+    finally:
+        set_backend(previous)
+
+
+def _job(db, job_id) -> RematchJob:
+    db.expire_all()
+    return db.get(RematchJob, job_id)
+
+
+def test_provider_write_queues_rematch_for_the_worker(db):
+    company_id = _company(db)
+    admin_id = db.scalar(insert(User).returning(User.id).values(email=next(_emails), hashed_password="x", is_admin=True))
+    db.commit()
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(admin_id)})}"
+    star = client.post("/api/providers", json={
+        "name": "Queued Star", "capability_tags": ["ml", "automation", "analytics", "optimization"],
+        "industries_served": ["Retail"], "qualification_score": 30}).json()["id"]
+
+    job = db.scalars(select(RematchJob).where(RematchJob.provider_id == star)).one()
+    assert (job.change, job.status) == (ADDED, QUEUED)
+    assert star not in set(db.scalars(select(Match.provider_id).where(Match.company_id == company_id)))
+
+    assert run_queued_rematches(workers=0) >= 1
+    job = _job(db, job.id)
+    assert job.status == DONE and job.changed_companies >= 1
+    assert star in set(db.scalars(select(Match.provider_id).where(Match.company_id == company_id)))
+
+
+def test_stale_running_job_is_recovered(db):
+    _company(db)
+    star = _add_star_provider(db)
+    job_id = db.scalar(insert(RematchJob).returning(RematchJob.id).values(
+        provider_id=star, change=ADDED, status=RUNNING, attempts=1,
+        started_at=datetime.now(timezone.utc) - timedelta(days=1)))
+    db.commit()
+    run_queued_rematches(workers=0)
+    job = _job(db, job_id)
+    assert (job.status, job.attempts) == (DONE, 2)
+
+
+def test_transient_failure_is_requeued_not_retried_in_the_same_pass(db, monkeypatch):
+    star = _add_star_provider(db)
+    rematch.queue_rematch(star, ADDED, db)
+    db.commit()
+    job_id = db.scalar(select(RematchJob.id).where(RematchJob.provider_id == star))
+
+    def rematch_provider(*args):
+        raise OperationalError("SELECT 1", {}, Exception("connection reset"))
+    monkeypatch.setattr(rematch, "rematch_provider", rematch_provider)
+    run_queued_rematches(workers=0)
+    job = _job(db, job_id)
+    assert (job.status, job.attempts, job.error is not None) == (QUEUED, 1, True)
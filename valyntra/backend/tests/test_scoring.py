@@ -0,0 +1,51 @@
+"""Batch re-scoring keeps what the read endpoints serve in line with the scores table."""
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy import case, insert, select, update
+from app.core.security import create_access_token
+from app.db.session import Base, SessionLocal, get_engine
+from app.main import app
+from app.models.models import Assessment, Score, User
+from app.services.scoring import CATEGORIES, calculate_scores_batch
+
+
+def test_batch_rescore_refreshes_dashboard():
+    Base.metadata.create_all(get_engine())
+    with SessionLocal() as db:
+        user_id = db.scalar(insert(User).returning(User.id).values(email="rescore@test.local", hashed_password="x"))
+        db.commit()
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(user_id)})}"
+    company_id = client.post("/api/companies", json={"name": "Rescore Co", "industry": "Retail"}).json()["id"]
+    client.post("/api/assessments", json={"company_id": company_id, **{c: 1 for c in CATEGORIES}})
+    assert client.get(f"/api/dashboard/{company_id}").json()["score"]["overall_score"] == 0.0
+
+    with SessionLocal() as db:
+        db.execute(update(Assessment).where(Assessment.company_id == company_id).values({c: 5 for c in CATEGORIES}))
+        db.commit()
+        calculate_scores_batch(db)
+
+    assert client.get(f"/api/scores/{company_id}").json()["overall_score"] == 100.0
+    assert client.get(f"/api/dashboard/{company_id}").json()["score"]["overall_score"] == 100.0
+
+
+def test_rescoring_an_old_assessment_keeps_the_latest_score():
+    Base.metadata.create_all(get_engine())
+    with SessionLocal() as db:
+        user_id = db.scalar(insert(User).returning(User.id).values(email="rescore-old@test.local", hashed_password="x"))
+        db.commit()
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(user_id)})}"
+    company_id = client.post("/api/companies", json={"name": "Rescore Old Co", "industry": "Retail"}).json()["id"]
+    old_id = client.post("/api/assessments", json={"company_id": company_id, **{c: 1 for c in CATEGORIES}}).json()["id"]
+    client.post("/api/assessments", json={"company_id": company_id, **{c: 5 for c in CATEGORIES}})
+    with SessionLocal() as db:
+        # Scored at different times, both in the past
+        db.execute(update(Score).where(Score.company_id == company_id).values(
+            calculated_at=case((Score.assessment_id == old_id, datetime(2020, 1, 1)), else_=datetime(2021, 1, 1))))
+        db.commit()
+        calculate_scores_batch(db, assessment_ids=[old_id])
+        assert db.scalar(select(Score.calculated_at).where(Score.assessment_id == old_id)).year == 2020
+
+    assert client.get(f"/api/scores/{company_id}").json()["overall_score"] == 100.0
+    assert client.get(f"/api/dashboard/{company_id}").json()["score"]["overall_score"] == 100.0
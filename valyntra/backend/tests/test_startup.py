@@ -0,0 +1,44 @@
+"""
+Cold start: importing app.main must not create a database engine, open a
+connection or run create_all, and must not load the batch-only numpy. Checked in
+a fresh interpreter; how long the import takes is benchmarks/bench_startup.py's job.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+_PROBE = """
+import json, sys
+import sqlalchemy
+import sqlalchemy.ext.asyncio
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+from sqlalchemy.schema import MetaData
+
+calls = []
+
+def recorded(name, real):
+    def wrapper(*args, **kwargs):
+        calls.append(name)
+        return real(*args, **kwargs)
+    return wrapper
+
+sqlalchemy.create_engine = recorded("create_engine", sqlalchemy.create_engine)
+sqlalchemy.ext.asyncio.create_async_engine = recorded("create_async_engine", sqlalchemy.ext.asyncio.create_async_engine)
+MetaData.create_all = recorded("create_all", MetaData.create_all)
+event.listen(Pool, "connect", lambda *args: calls.append("connect"))
+
+import app.main
+from app.db import session
+print(json.dumps({"calls": calls, "engine_created": session._engine is not None, "numpy": "numpy" in sys.modules}))
+"""
+
+
+def test_import_does_not_touch_the_database():
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    ).stdout
+    assert json.loads(out.splitlines()[-1]) == {"calls": [], "engine_created": False, "numpy": False}
@@ -0,0 +1,65 @@
+"""Admin use-case catalog: edits reach opportunity generation at once; invalid edits are 4xx, not 500."""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, insert, select
+from app.core.security import create_access_token
+from app.db.session import Base, SessionLocal, get_engine
+from app.main import app
+from app.models.models import Company, UseCaseCatalog, UseCaseEntry, UseCasePoints, User
+from app.services.opportunity_engine import current_catalog, install_catalog, opportunity_rows
+from app.services.use_case_catalog import CATALOG_ID, catalog_version, seed_builtin_catalog
+
+ADMIN_EMAIL = "catalog-admin@test.local"
+SHELF_VISION = {"industry": "Retail", "use_case": "Shelf Vision", "tag": "ml",
+                "impact": "High", "effort": "Low", "roi": "Quick Win"}
+
+
+@pytest.fixture
+def client():
+    Base.metadata.create_all(get_engine())
+    previous = current_catalog()
+    with SessionLocal() as db:
+        for model in (UseCaseEntry, UseCasePoints, UseCaseCatalog):
+            db.execute(delete(model))
+        db.add(UseCaseCatalog(id=CATALOG_ID, version=0))    # as migration 0003 leaves it
+        admin_id = db.scalar(select(User.id).where(User.email == ADMIN_EMAIL)) or db.scalar(
+            insert(User).returning(User.id).values(email=ADMIN_EMAIL, hashed_password="x", is_admin=True))
+        db.commit()
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(admin_id)})}"
+    yield client
+    install_catalog(previous)
+
+
+def test_edit_reaches_opportunities_and_bumps_version(client):
+    assert client.post("/api/admin/use-cases", json=SHELF_VISION).status_code == 201
+    rows = opportunity_rows(Company(id=1, industry="Retail"), 80)
+    assert rows[0]["use_case"] == "Shelf Vision"
+    status = client.get("/api/admin/use-case-catalog").json()
+    assert status["version"] == status["loaded_version"] == 1
+    assert "Retail" in status["industries"]
+
+
+def test_explicit_null_is_rejected(client):
+    created = client.post("/api/admin/use-cases", json=SHELF_VISION).json()
+    assert client.patch(f"/api/admin/use-cases/{created['id']}", json={"industry": None}).status_code == 422
+    assert client.patch(f"/api/admin/use-cases/{created['id']}", json={"tag": "automation"}).json()["industry"] == "Retail"
+
+
+def test_unknown_level_and_last_default(client):
+    assert client.post("/api/admin/use-cases", json={**SHELF_VISION, "impact": "Huge"}).status_code == 422
+    client.post("/api/admin/use-cases", json=SHELF_VISION)     # copies the built-ins in
+    defaults = client.get("/api/admin/use-cases", params={"industry": "Default"}).json()
+    for entry in defaults[:-1]:
+        assert client.delete(f"/api/admin/use-cases/{entry['id']}").status_code == 204
+    last = defaults[-1]["id"]
+    assert client.delete(f"/api/admin/use-cases/{last}").status_code == 409
+    assert client.patch(f"/api/admin/use-cases/{last}", json={"industry": "Retail"}).status_code == 409
+
+
+def test_seed_adds_catalog_row_for_create_all_databases(client):
+    with SessionLocal() as db:
+        db.execute(delete(UseCaseCatalog))
+        assert seed_builtin_catalog(db)
+        assert not seed_builtin_catalog(db)
+        assert catalog_version(db) == 0 and db.get(UseCaseCatalog, CATALOG_ID) is not None
@@ -0,0 +1,37 @@
+"""The authenticated-user cache drops a user when a change to them commits, not before."""
+import itertools
+import pytest
+from sqlalchemy import insert
+from app.core.security import _load_user, user_cache
+from app.db.session import Base, SessionLocal, get_engine
+from app.models.models import User
+
+_emails = (f"user-cache-{i}@test.local" for i in itertools.count())
+
+
+@pytest.fixture
+def user_id():
+    Base.metadata.create_all(get_engine())
+    with SessionLocal() as db:
+        user_id = db.scalar(insert(User).returning(User.id).values(email=next(_emails), hashed_password="x"))
+        db.commit()
+        assert not _load_user(user_id, db).is_admin
+    return user_id
+
+
+def test_evicted_on_commit(user_id):
+    with SessionLocal() as db:
+        db.get(User, user_id).is_admin = True
+        db.flush()
+        assert user_cache.get(user_id) is not None       # a concurrent read still sees the committed row
+        db.commit()
+        assert user_cache.get(user_id) is None
+        assert _load_user(user_id, db).is_admin
+
+
+def test_kept_on_rollback(user_id):
+    with SessionLocal() as db:
+        db.get(User, user_id).is_admin = True
+        db.flush()
+        db.rollback()
+    assert user_cache.get(user_id) is not None
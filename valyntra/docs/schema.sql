@@ -93,3 +93,86 @@ CREATE TABLE IF NOT EXISTS matches (
     stage VARCHAR DEFAULT 'Not Started',
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
+
+CREATE TABLE IF NOT EXISTS pipeline_jobs (
+    id SERIAL PRIMARY KEY,
+    assessment_id INTEGER NOT NULL REFERENCES assessments(id),
+    company_id INTEGER NOT NULL REFERENCES companies(id),
+    status VARCHAR DEFAULT 'queued',
+    top_k INTEGER,
+    attempts INTEGER DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS ix_pipeline_jobs_status ON pipeline_jobs (status);
+
+CREATE TABLE IF NOT EXISTS company_dashboards (
+    company_id INTEGER PRIMARY KEY REFERENCES companies(id),
+    version INTEGER NOT NULL DEFAULT 1,
+    payload JSONB NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Hot-path indexes (alembic revision 0002)
+CREATE INDEX IF NOT EXISTS ix_companies_owner_id_id ON companies (owner_id, id);
+CREATE INDEX IF NOT EXISTS ix_assessments_company_id_id ON assessments (company_id, id);
+CREATE INDEX IF NOT EXISTS ix_scores_company_id_calculated_at ON scores (company_id, calculated_at, id);
+CREATE INDEX IF NOT EXISTS ix_opportunities_company_id_rank ON opportunities (company_id, rank);
+CREATE INDEX IF NOT EXISTS ix_matches_company_id_weighted_score ON matches (company_id, weighted_score);
+CREATE INDEX IF NOT EXISTS ix_matches_opportunity_id ON matches (opportunity_id);
+CREATE INDEX IF NOT EXISTS ix_matches_provider_id ON matches (provider_id);
+
+-- Use-case catalog (alembic revision 0003); empty tables = built-in library
+CREATE TABLE IF NOT EXISTS use_cases (
+    id SERIAL PRIMARY KEY,
+    industry VARCHAR NOT NULL,
+    use_case VARCHAR NOT NULL,
+    tag VARCHAR NOT NULL,
+    impact VARCHAR NOT NULL,
+    effort VARCHAR NOT NULL,
+    roi VARCHAR NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS use_case_points (
+    dimension VARCHAR NOT NULL,
+    level VARCHAR NOT NULL,
+    points INTEGER NOT NULL,
+    PRIMARY KEY (dimension, level)
+);
+
+CREATE TABLE IF NOT EXISTS use_case_catalog (
+    id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+INSERT INTO use_case_catalog (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING;
+
+-- Matches per opportunity used when matching (alembic revision 0004)
+ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS top_k INTEGER;
+
+-- Provider catalog version, bumped by every provider write (alembic revision 0005)
+CREATE TABLE IF NOT EXISTS provider_catalog (
+    id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+INSERT INTO provider_catalog (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING;
+
+-- Provider changes waiting for the re-match worker (alembic revision 0006)
+CREATE TABLE IF NOT EXISTS rematch_jobs (
+    id SERIAL PRIMARY KEY,
+    provider_id INTEGER NOT NULL REFERENCES providers(id),
+    change VARCHAR NOT NULL,
+    status VARCHAR DEFAULT 'queued',
+    attempts INTEGER DEFAULT 0,
+    changed_companies INTEGER,
+    error TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+CREATE INDEX IF NOT EXISTS ix_rematch_jobs_status ON rematch_jobs (status);